@@ -0,0 +1,115 @@
+# benchmarks/bench_table_extraction.py
+"""
+Benchmark for marker-based table extraction (utils.helpers.extract_tables_by_markers).
+
+Builds a large synthetic settings sheet with many '~Name' marked tables, checks
+that the vectorized scanner returns tables identical to the previous cell-by-cell
+implementation and reports the timings of both.
+
+Usage:
+    python benchmarks/bench_table_extraction.py [--rows 20000] [--cols 40] [--tables 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.helpers import extract_tables_by_markers  # noqa: E402
+
+
+def legacy_find_special_symbols(df, marker):
+    markers = []
+    for i, row in df.iterrows():
+        for j, value in enumerate(row):
+            if isinstance(value, str) and value.startswith(marker):
+                markers.append((i, j, value[len(marker):].strip()))
+    return markers
+
+
+def legacy_extract_table(df, start_row, start_col):
+    end_row = start_row + 1
+    while end_row < len(df) and pd.notnull(df.iloc[end_row, start_col]):
+        end_row += 1
+
+    end_col = start_col + 1
+    while end_col < len(df.columns) and pd.notnull(df.iloc[start_row, end_col]):
+        end_col += 1
+
+    table = df.iloc[start_row:end_row, start_col:end_col].copy()
+    table.columns = table.iloc[0]
+    return table[1:].reset_index(drop=True)
+
+
+def legacy_extract_tables_by_markers(df, marker):
+    return {
+        name: legacy_extract_table(df, row + 1, col)
+        for row, col, name in legacy_find_special_symbols(df, marker)
+    }
+
+
+def build_settings_sheet(rows, cols, n_tables, seed=0):
+    """Sheet laid out like the Settings/main sheets: marker, header row, data block, blank gap"""
+    rng = np.random.default_rng(seed)
+    grid = np.full((rows, cols), np.nan, dtype=object)
+    block_rows = max(rows // n_tables, 5)
+
+    for t in range(n_tables):
+        top = t * block_rows
+        if top + 3 >= rows:
+            break
+        left = int(rng.integers(0, max(cols - 8, 1)))
+        width = int(rng.integers(2, min(8, cols - left) + 1))
+        height = int(rng.integers(1, block_rows - 2))
+
+        grid[top, left] = f"~Table_{t}"
+        for c in range(width):
+            grid[top + 1, left + c] = f"Col_{c}"
+        for r in range(height):
+            grid[top + 2 + r, left] = f"Item_{r}"
+            grid[top + 2 + r, left + 1:left + width] = rng.random(width - 1).round(4)
+        # Free text next to tables, as in real sheets
+        if left + width + 1 < cols:
+            grid[top, left + width + 1] = "Note: values in MW"
+
+    return pd.DataFrame(grid)
+
+
+def time_call(func, *args, repeat=3):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--cols', type=int, default=40)
+    parser.add_argument('--tables', type=int, default=200)
+    args = parser.parse_args()
+
+    df = build_settings_sheet(args.rows, args.cols, args.tables)
+    print(f"Sheet: {df.shape[0]} rows x {df.shape[1]} columns, {args.tables} tables")
+
+    legacy_time, legacy_tables = time_call(legacy_extract_tables_by_markers, df, '~', repeat=1)
+    new_time, new_tables = time_call(extract_tables_by_markers, df, '~')
+
+    assert list(legacy_tables) == list(new_tables), "Table names or order differ"
+    for name, expected in legacy_tables.items():
+        pd.testing.assert_frame_equal(new_tables[name], expected)
+
+    print(f"cell-by-cell: {legacy_time * 1000:10.1f} ms")
+    print(f"vectorized:   {new_time * 1000:10.1f} ms")
+    print(f"speedup:      {legacy_time / new_time:10.1f}x ({len(new_tables)} identical tables)")
+
+
+if __name__ == '__main__':
+    main()
@@ -405,6 +405,8 @@ class DemandProjectionBlueprint(ServiceBlueprint):
                 exclude_covid_years=data.get('excludeCovidYears', True),
                 sector_configs=data['sectorConfigs'],
                 detailed_configuration=data.get('detailedConfiguration', {}),
+                max_workers=int(data.get('maxWorkers', 1)),
+                reuse_unchanged_sectors=bool(data.get('reuseUnchangedSectors', True)),
                 user_metadata={
                     'request_source': 'web_ui',
                     'configuration_version': '2.0.0',
@@ -468,6 +470,8 @@ class DemandProjectionBlueprint(ServiceBlueprint):
                     'scenario_name': config.scenario_name,
                     'target_year': config.target_year,
                     'total_sectors': len(config.sector_configs),
+                    'max_workers': config.max_workers,
+                    'reuse_unchanged_sectors': config.reuse_unchanged_sectors,
                     'estimated_duration_minutes': len(config.sector_configs) * 2,
                     'configuration_tracking': True,
                     'auto_save_enabled': True,
@@ -751,7 +755,8 @@ class DemandProjectionBlueprint(ServiceBlueprint):
                 target_year=int(data['targetYear']),
                 exclude_covid_years=data.get('excludeCovidYears', True),
                 sector_configs=data['sectorConfigs'],
-                detailed_configuration=data.get('detailedConfiguration', {})
+                detailed_configuration=data.get('detailedConfiguration', {}),
+                max_workers=int(data.get('maxWorkers', 1))
             )
             
             # Run validation
@@ -4,20 +4,26 @@ Optimized Load Profile Blueprint with Service Layer Integration
 Fixed STL-related routes and historical data summary
 """
 import os
+import threading
+import uuid
 import logging
 from datetime import datetime
-from flask import Blueprint, jsonify, render_template, request, send_file, g
+from flask import Blueprint, jsonify, render_template, request, send_file, g, url_for
 from utils.base_blueprint import ServiceBlueprint, with_service
 from utils.common_decorators import (
     require_project, validate_json_request, validate_file_upload,
     handle_exceptions, api_route, track_performance, cache_route
 )
 from utils.response_utils import error_response, success_json, error_json, success_response, validation_error_json
-from utils.constants import ALLOWED_EXTENSIONS, UNIT_FACTORS
-from services.loadprofile_service import LoadProfileService
+from utils.constants import ALLOWED_EXTENSIONS, UNIT_FACTORS, JOB_STATUS
+from services.loadprofile_service import LoadProfileService, profile_job_manager
 
 logger = logging.getLogger(__name__)
 
+# Profile types that can run as background jobs, with their display names
+GENERATION_JOB_TYPES = {'base_profile': 'Base profile', 'stl_profile': 'STL profile'}
+MAX_ACTIVE_GENERATION_JOBS = 2
+
 class LoadProfileBlueprint(ServiceBlueprint):
     """Optimized Load Profile Blueprint with comprehensive caching and error handling"""
     
@@ -72,6 +78,14 @@ class LoadProfileBlueprint(ServiceBlueprint):
         def generate_base_profile():
             return self._generate_base_profile()
         
+        @self.blueprint.route('/api/generate_base_profiles_batch', methods=['POST'])
+        @api_route(
+            required_json_fields=['base_year', 'start_fy', 'end_fy'],
+            max_concurrent=1
+        )
+        def generate_base_profiles_batch():
+            return self._generate_base_profiles_batch()
+        
         @self.blueprint.route('/api/generate_stl_profile', methods=['POST'])
         @api_route(
             required_json_fields=['start_fy', 'end_fy', 'demand_source'],
@@ -80,6 +94,27 @@ class LoadProfileBlueprint(ServiceBlueprint):
         def generate_stl_profile():
             return self._generate_stl_profile()
         
+        # Background generation job routes
+        @self.blueprint.route('/api/generate_profile_job', methods=['POST'])
+        @api_route(required_json_fields=['profile_type', 'start_fy', 'end_fy', 'demand_source'])
+        def generate_profile_job():
+            return self._start_generation_job()
+        
+        @self.blueprint.route('/api/generation_status/<job_id>')
+        @api_route()
+        def get_generation_status_api(job_id):
+            return self._get_generation_status(job_id)
+        
+        @self.blueprint.route('/api/cancel_generation/<job_id>', methods=['POST'])
+        @api_route()
+        def cancel_generation_api(job_id):
+            return self._cancel_generation(job_id)
+        
+        @self.blueprint.route('/api/generation_jobs/summary')
+        @api_route()
+        def get_generation_jobs_summary_api():
+            return self._get_generation_jobs_summary()
+        
         # Profile management routes
         @self.blueprint.route('/api/saved_profiles')
         @api_route(cache_ttl=600)
@@ -255,6 +290,38 @@ class LoadProfileBlueprint(ServiceBlueprint):
             logger.exception(f"Error generating base profile: {e}")
             return error_json(f"Failed to generate profile: {str(e)}")
     
+    @with_service
+    def _generate_base_profiles_batch(self):
+        """Generate base profiles for several demand scenarios in one job"""
+        try:
+            data = request.get_json()
+            
+            # validation
+            validation_result = self.service.validate_generation_request(data, 'base_profile_batch')
+            if not validation_result['valid']:
+                return validation_error_json(
+                    "Configuration validation failed",
+                    errors=validation_result['errors']
+                )
+            
+            # Generate profiles
+            generation_result = self.service.generate_base_profiles_batch(data)
+            
+            if generation_result['success']:
+                # Invalidate cache
+                self._invalidate_profile_cache()
+                
+                return success_json(
+                    f"Generated and saved {len(generation_result['data']['profiles'])} base profiles",
+                    generation_result['data']
+                )
+            else:
+                return error_json(generation_result['error'])
+                
+        except Exception as e:
+            logger.exception(f"Error generating base profile batch: {e}")
+            return error_json(f"Failed to generate profiles: {str(e)}")
+    
     @with_service
     def _generate_stl_profile(self):
         """Generate STL profile with advanced configuration"""
@@ -287,6 +354,166 @@ class LoadProfileBlueprint(ServiceBlueprint):
             logger.exception(f"Error generating STL profile: {e}")
             return error_json(f"Failed to generate profile: {str(e)}")
     
+    @with_service
+    def _start_generation_job(self):
+        """Validate a base/STL generation request and run it as a background job"""
+        try:
+            data = request.get_json()
+            profile_type = data.get('profile_type')
+            if profile_type not in GENERATION_JOB_TYPES:
+                return validation_error_json(f"profile_type must be one of {list(GENERATION_JOB_TYPES)}")
+            
+            # validation
+            validation_result = self.service.validate_generation_request(data, profile_type)
+            if not validation_result['valid']:
+                return validation_error_json(
+                    "Configuration validation failed",
+                    errors=validation_result['errors']
+                )
+            
+            # Check concurrent job limits
+            if profile_job_manager.get_active_jobs_count() >= MAX_ACTIVE_GENERATION_JOBS:
+                return error_json(
+                    "Too many active load profile jobs. Please wait for current jobs to complete.",
+                    status_code=429
+                )
+            
+            # Create job
+            job_id = str(uuid.uuid4())
+            label = GENERATION_JOB_TYPES[profile_type]
+            profile_job_manager.create_job(
+                job_id,
+                job_type=profile_type,
+                scenario_name=data.get('scenario_name') if data['demand_source'] == 'scenario' else 'template',
+                configuration=data
+            )
+            profile_job_manager.update_job(job_id,
+                status=JOB_STATUS['RUNNING'],
+                message=f"{label} generation started"
+            )
+            
+            # The service only needs the project path, so the worker runs without an app context
+            generation_thread = threading.Thread(
+                target=self._execute_generation_job,
+                args=(self.service, data, profile_type, job_id),
+                name=f"LoadProfileJob-{profile_type}-{job_id[:8]}",
+                daemon=True
+            )
+            generation_thread.start()
+            
+            logger.info(f"Started {profile_type} job {job_id}")
+            
+            return success_json(
+                f"{label} generation job started",
+                {
+                    'job_id': job_id,
+                    'profile_type': profile_type,
+                    'status_url': url_for('loadprofile.get_generation_status_api', job_id=job_id),
+                    'cancel_url': url_for('loadprofile.cancel_generation_api', job_id=job_id)
+                }
+            )
+            
+        except Exception as e:
+            logger.exception(f"Error starting load profile job: {e}")
+            return error_json(f"Failed to start generation: {str(e)}")
+    
+    def _execute_generation_job(self, service: LoadProfileService, config: dict, profile_type: str, job_id: str):
+        """Run a generation job in a background thread"""
+        try:
+            result = service.execute_generation_job(config, profile_type, profile_job_manager, job_id)
+            
+            if result['status'] == 'success':
+                self._invalidate_profile_cache()
+                logger.info(f"Load profile job {job_id} completed: {result['profile_id']}")
+            elif result['status'] == 'cancelled':
+                logger.info(f"Load profile job {job_id} was cancelled")
+            else:
+                logger.error(f"Load profile job {job_id} failed: {result.get('error', 'Unknown error')}")
+                
+        except Exception as e:
+            error_msg = f"Critical error in load profile job {job_id}: {str(e)}"
+            logger.exception(error_msg)
+            profile_job_manager.complete_job(job_id, error=error_msg)
+    
+    def _get_generation_status(self, job_id: str):
+        """Get status of a generation job"""
+        try:
+            job = profile_job_manager.get_job(job_id)
+            if not job:
+                return error_json(f"Job '{job_id}' not found", status_code=404)
+            
+            response_data = {
+                'job_id': job_id,
+                'profile_type': job['configuration'].get('profile_type'),
+                'status': job['status'],
+                'progress': job['progress'],
+                'current_step': job['current_step'],
+                'message': job['message'],
+                'scenario_name': job['scenario_name'],
+                'elapsed_seconds': job['elapsed_seconds']
+            }
+            
+            if job['status'] == JOB_STATUS['RUNNING'] and 'estimated_remaining_seconds' in job:
+                response_data['estimated_remaining_seconds'] = job['estimated_remaining_seconds']
+            
+            # Add result data for completed jobs
+            if job['status'] == JOB_STATUS['COMPLETED']:
+                response_data['result'] = job.get('result', {})
+            
+            # Add error details for failed jobs
+            elif job['status'] == JOB_STATUS['FAILED']:
+                response_data['error'] = job.get('error')
+                response_data['detailed_log'] = job.get('detailed_log', [])[-5:]  # Last 5 log entries
+            
+            return success_json(
+                f"Status retrieved for job '{job_id}'",
+                response_data
+            )
+            
+        except Exception as e:
+            logger.exception(f"Error getting load profile job status for {job_id}: {e}")
+            return error_json(f"Failed to get status: {str(e)}")
+    
+    def _cancel_generation(self, job_id: str):
+        """Request cancellation of a generation job; it stops at the next stage boundary"""
+        try:
+            job = profile_job_manager.get_job(job_id)
+            if not job:
+                return error_json(f"Job '{job_id}' not found", status_code=404)
+            
+            if job['status'] not in [JOB_STATUS['RUNNING'], JOB_STATUS['STARTING']]:
+                return error_json(f"Cannot cancel job with status '{job['status']}'", status_code=400)
+            
+            if not profile_job_manager.cancel_job(job_id):
+                return error_json("Failed to cancel load profile job")
+            
+            logger.info(f"Load profile job {job_id} cancelled")
+            return success_json(
+                f"Load profile job '{job_id}' cancelled",
+                {
+                    'job_id': job_id,
+                    'previous_status': job['status'],
+                    'new_status': JOB_STATUS['CANCELLED'],
+                    'cancelled_at': datetime.now().isoformat(),
+                    'current_step': job['current_step']
+                }
+            )
+            
+        except Exception as e:
+            logger.exception(f"Error cancelling load profile job {job_id}: {e}")
+            return error_json(f"Failed to cancel: {str(e)}")
+    
+    def _get_generation_jobs_summary(self):
+        """Get summary of load profile generation jobs"""
+        try:
+            return success_json(
+                "Load profile jobs summary retrieved",
+                profile_job_manager.get_jobs_summary()
+            )
+        except Exception as e:
+            logger.exception(f"Error getting load profile jobs summary: {e}")
+            return error_json(f"Failed to get jobs summary: {str(e)}")
+    
     @with_service
     def _get_saved_profiles(self):
         """Get saved profiles with metadata"""
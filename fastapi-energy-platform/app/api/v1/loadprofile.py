@@ -4,8 +4,9 @@ Load Profile API Endpoints for FastAPI.
 Handles load profile generation, management, and retrieval.
 """
 import logging
+import uuid
 from typing import Dict, List, Any, Optional
-from fastapi import APIRouter, Depends, Query, HTTPException, Body, Path as FastAPIPath, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException, Body, Path as FastAPIPath, UploadFile, File
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 from pathlib import Path
@@ -13,10 +14,10 @@ import tempfile # For creating temporary files for downloads
 import asyncio # For asyncio.to_thread if direct os calls were needed here (but they are in service)
 
 # Actual service import
-from app.services.loadprofile_service import LoadProfileService
+from app.services.loadprofile_service import LoadProfileService, profile_job_manager
 
-from app.utils.error_handlers import ProcessingError, ResourceNotFoundError, ValidationError as CustomValidationError
-from app.utils.constants import ALLOWED_EXTENSIONS, MAX_FILE_SIZE # Assuming these are relevant
+from app.utils.error_handlers import ProcessingError, ResourceNotFoundError, BusinessLogicError, ValidationError as CustomValidationError
+from app.utils.constants import ALLOWED_EXTENSIONS, MAX_FILE_SIZE, JOB_STATUS # Assuming these are relevant
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -37,6 +38,15 @@ class BaseProfileGenerationPayload(BaseModel):
     # apply_monthly_peaks: bool = False
     # apply_load_factors: bool = False
 
+class BaseProfileBatchGenerationPayload(BaseModel):
+    base_year: int = Field(..., ge=2000, le=2030)
+    start_fy: int = Field(..., ge=2000, le=2050)
+    end_fy: int = Field(..., ge=2000, le=2050)
+    scenario_names: Optional[List[str]] = None # All consolidated scenarios if omitted
+    include_template: bool = False # Also generate from the template's total demand
+    frequency: str = Field(default="hourly", pattern="^(hourly|15min|30min|daily)$")
+    custom_name: Optional[str] = Field(default=None, max_length=50)
+
 class StlProfileGenerationPayload(BaseModel):
     start_fy: int = Field(..., ge=2000, le=2050)
     end_fy: int = Field(..., ge=2000, le=2050)
@@ -65,8 +75,8 @@ async def get_main_page_data_api(
 
 @router.post("/{project_name}/generate_base_profile", summary="Generate Base Load Profile")
 async def generate_base_profile_api(
-    project_name: str = FastAPIPath(..., description="The name of the project"),
     payload: BaseProfileGenerationPayload,
+    project_name: str = FastAPIPath(..., description="The name of the project"),
     service: LoadProfileService = Depends(get_load_profile_service_dependency)
 ):
     try:
@@ -86,10 +96,28 @@ async def generate_base_profile_api(
         logger.exception(f"Error generating base profile for project {project_name}")
         raise HTTPException(status_code=500, detail=f"Failed to generate base profile: {str(e)}")
 
+@router.post("/{project_name}/generate_base_profiles_batch", summary="Generate Base Load Profiles for Several Scenarios")
+async def generate_base_profiles_batch_api(
+    payload: BaseProfileBatchGenerationPayload,
+    project_name: str = FastAPIPath(..., description="The name of the project"),
+    service: LoadProfileService = Depends(get_load_profile_service_dependency)
+):
+    try:
+        if payload.start_fy >= payload.end_fy:
+            raise CustomValidationError(message="start_fy must be before end_fy.")
+        return await service.generate_base_profiles_batch(project_name, payload.model_dump())
+    except (CustomValidationError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ProcessingError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        logger.exception(f"Error generating base profile batch for project {project_name}")
+        raise HTTPException(status_code=500, detail=f"Failed to generate base profiles: {str(e)}")
+
 @router.post("/{project_name}/generate_stl_profile", summary="Generate STL Load Profile")
 async def generate_stl_profile_api(
-    project_name: str = FastAPIPath(..., description="The name of the project"),
     payload: StlProfileGenerationPayload,
+    project_name: str = FastAPIPath(..., description="The name of the project"),
     service: LoadProfileService = Depends(get_load_profile_service_dependency)
 ):
     try:
@@ -108,6 +136,77 @@ async def generate_stl_profile_api(
         logger.exception(f"Error generating STL profile for project {project_name}")
         raise HTTPException(status_code=500, detail=f"Failed to generate STL profile: {str(e)}")
 
+# --- Background generation jobs ---
+# Same payloads as the blocking endpoints above; the job reports progress per generation
+# stage (template, decomposition, forecast, constraints, save) and can be cancelled.
+
+MAX_ACTIVE_GENERATION_JOBS = 2
+
+def _start_generation_job(project_name: str, generation_type: str, config: Dict[str, Any],
+                          service: LoadProfileService, background_tasks: BackgroundTasks) -> Dict[str, Any]:
+    if config.get('demand_source') == "scenario" and not config.get('scenario_name'):
+        raise HTTPException(status_code=422, detail="scenario_name is required when demand_source is 'scenario'.")
+    if profile_job_manager.get_active_jobs_count() >= MAX_ACTIVE_GENERATION_JOBS:
+        raise HTTPException(status_code=429, detail="Too many load profile generation jobs are running. Try again later.")
+
+    job_id = str(uuid.uuid4())
+    profile_job_manager.create_job(
+        job_id, job_type=generation_type, scenario_name=config.get('scenario_name') or 'template',
+        configuration=config, message="Queued"
+    )
+    profile_job_manager.update_job(job_id, status=JOB_STATUS['RUNNING'])
+    background_tasks.add_task(service.execute_generation_job, project_name, generation_type, config, job_id)
+
+    logger.info(f"Load profile job {job_id} ({generation_type}) started for project '{project_name}'.")
+    return {
+        "message": f"{generation_type} generation started.",
+        "job_id": job_id,
+        "status_url": router.url_path_for("get_generation_status_api", job_id=job_id),
+        "cancel_url": router.url_path_for("cancel_generation_api", job_id=job_id)
+    }
+
+@router.post("/{project_name}/generate_base_profile_job", summary="Start Base Load Profile Generation Job")
+async def generate_base_profile_job_api(
+    background_tasks: BackgroundTasks,
+    payload: BaseProfileGenerationPayload,
+    project_name: str = FastAPIPath(..., description="The name of the project"),
+    service: LoadProfileService = Depends(get_load_profile_service_dependency)
+):
+    return _start_generation_job(project_name, "base_profile", payload.model_dump(), service, background_tasks)
+
+@router.post("/{project_name}/generate_stl_profile_job", summary="Start STL Load Profile Generation Job")
+async def generate_stl_profile_job_api(
+    background_tasks: BackgroundTasks,
+    payload: StlProfileGenerationPayload,
+    project_name: str = FastAPIPath(..., description="The name of the project"),
+    service: LoadProfileService = Depends(get_load_profile_service_dependency)
+):
+    return _start_generation_job(project_name, "stl_profile", payload.model_dump(), service, background_tasks)
+
+@router.get("/generation_status/{job_id}", summary="Get Load Profile Generation Job Status")
+async def get_generation_status_api(job_id: str):
+    job = profile_job_manager.get_job(job_id)
+    if not job:
+        raise ResourceNotFoundError(resource_type="Load Profile Job", resource_id=job_id)
+    return job
+
+@router.post("/cancel_generation/{job_id}", summary="Cancel Load Profile Generation Job")
+async def cancel_generation_api(job_id: str):
+    job = profile_job_manager.get_job(job_id)
+    if not job:
+        raise ResourceNotFoundError(resource_type="Load Profile Job", resource_id=job_id)
+
+    if job.get('status') not in [JOB_STATUS['RUNNING'], JOB_STATUS['STARTING']]:
+        raise BusinessLogicError(message=f"Cannot cancel job {job_id}. Status: {job.get('status')}.")
+
+    if not profile_job_manager.cancel_job(job_id):
+        raise HTTPException(status_code=500, detail=f"Failed to request cancellation for job {job_id}.")
+    return {"message": f"Load profile job '{job_id}' cancellation requested. It stops at the next generation stage."}
+
+@router.get("/generation_jobs/summary", summary="Summary of Load Profile Generation Jobs")
+async def get_generation_jobs_summary_api():
+    return profile_job_manager.get_jobs_summary()
+
 @router.get("/{project_name}/saved_profiles", summary="List Saved Load Profiles")
 async def get_saved_profiles_api(
     project_name: str = FastAPIPath(..., description="The name of the project"),
@@ -239,8 +338,8 @@ class PreviewBaseProfilesPayload(BaseModel):
 
 @router.post("/{project_name}/preview_base_profiles", summary="Preview Base Load Profiles")
 async def preview_base_profiles_api(
-    project_name: str = FastAPIPath(..., description="The name of the project"),
     payload: PreviewBaseProfilesPayload,
+    project_name: str = FastAPIPath(..., description="The name of the project"),
     service: LoadProfileService = Depends(get_load_profile_service_dependency)
 ):
     try:
@@ -330,9 +429,9 @@ class ProfileAnalysisRequestPayload(BaseModel): # Example
 
 @router.post("/{project_name}/profiles/{profile_id}/analysis", summary="Analyze a Load Profile")
 async def analyze_profile_api(
+    payload: ProfileAnalysisRequestPayload, # This should use the more specific Pydantic models from app.models.loadprofile
     project_name: str = FastAPIPath(..., description="The name of the project"),
     profile_id: str = FastAPIPath(..., description="ID of the load profile"),
-    payload: ProfileAnalysisRequestPayload, # This should use the more specific Pydantic models from app.models.loadprofile
     service: LoadProfileService = Depends(get_load_profile_service_dependency)
 ):
     # service_method = getattr(service, f"analyze_{payload.analysis_type}", None)
@@ -348,8 +447,8 @@ class CompareProfilesPayload(BaseModel): # Example
 
 @router.post("/{project_name}/compare_profiles", summary="Compare Multiple Load Profiles")
 async def compare_profiles_api(
-    project_name: str = FastAPIPath(..., description="The name of the project"),
     payload: CompareProfilesPayload,
+    project_name: str = FastAPIPath(..., description="The name of the project"),
     service: LoadProfileService = Depends(get_load_profile_service_dependency)
 ):
     # result = await service.compare_profiles(project_name, payload.profile_ids, payload.metrics)
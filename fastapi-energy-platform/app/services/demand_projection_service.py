@@ -9,6 +9,9 @@ import asyncio # For async job management if needed, or use background tasks
 import uuid
 import time
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from queue import Empty
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, asdict, field
@@ -16,7 +19,8 @@ from pathlib import Path
 
 # Assuming these utilities are adapted and available in the new structure
 from app.utils.constants import JOB_STATUS, FORECAST_MODELS, VALIDATION_RULES, ERROR_MESSAGES
-from app.utils.data_loading import input_demand_data, validate_input_file # These need to be Path-aware
+from app.utils.data_loading import input_demand_data, validate_input_file, read_input_workbook # These need to be Path-aware
+from app.utils.input_snapshot import load_input_snapshot, read_source_identity, save_input_snapshot
 from app.utils.demand_utils import (
     handle_nan_values, safe_numeric_conversion, create_summary, # create_summary needs review
     # validate_project_path, # Project path validation will be part of service constructor/config
@@ -46,6 +50,7 @@ class ForecastJobConfig:
     detailed_configuration: Dict[str, Any] = field(default_factory=dict) # Global/advanced settings
     request_timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     user_metadata: Dict[str, Any] = field(default_factory=dict)
+    max_workers: int = 1 # 1 = serial execution, >1 = process pool with this many workers
 
 @dataclass
 class SectorProcessingResult:
@@ -59,6 +64,35 @@ class SectorProcessingResult:
     configuration_used: Dict[str, Any] = field(default_factory=dict)
 
 
+def _forecast_sector_in_process(sector_name: str, sector_df, forecast_path: str,
+                                selected_models: List[str], model_params: Dict[str, Any],
+                                target_year: int, exclude_covid: bool,
+                                progress_queue, cancel_event) -> Dict[str, Any]:
+    """
+    Process pool entry point: forecasts one sector and reports progress through a managed queue.
+    Must stay at module level so it can be pickled for the worker processes.
+    """
+    if cancel_event.is_set():
+        return {'status': 'cancelled', 'message': 'Skipped because the job was cancelled.'}
+
+    def _queue_progress(progress_percent: int, cb_sector_name: str, cb_message: str):
+        progress_queue.put((cb_sector_name, progress_percent, cb_message))
+
+    sector_start_time = time.time()
+    result = Main_forecasting_function(
+        sheet_name=sector_name,
+        forecast_path=forecast_path,
+        main_df=sector_df,
+        selected_models=selected_models,
+        model_params=model_params,
+        target_year=target_year,
+        exclude_covid=exclude_covid,
+        progress_callback=_queue_progress
+    )
+    result['processing_time_seconds'] = round(time.time() - sector_start_time, 2)
+    return result
+
+
 class ForecastJobManager:
     """
     Manages forecast jobs.
@@ -220,13 +254,27 @@ class DemandProjectionService:
         # Adapt validate_input_file and input_demand_data to be async or run in threadpool
         # These functions use pandas which is synchronous, so we run them in a thread pool.
         try:
-            validation_result = await asyncio.to_thread(validate_input_file, str(input_file_path))
+            # Snapshot written by any worker from the same, already validated workbook
+            data_tuple = await asyncio.to_thread(load_input_snapshot, str(input_file_path))
+            if data_tuple is not None:
+                self._project_input_data_cache[cache_key] = (data_tuple, time.time())
+                logger.info(f"Loaded input data for project '{project_name}' from snapshot.")
+                return data_tuple
+
+            # Identify the workbook before parsing, so a snapshot is only tagged with the file it was read from
+            source = await asyncio.to_thread(read_source_identity, str(input_file_path))
+
+            # Parse the workbook once; validation and loading share the parsed sheets
+            workbook = await asyncio.to_thread(read_input_workbook, str(input_file_path))
+            validation_result = await asyncio.to_thread(validate_input_file, str(input_file_path), *workbook)
             if not validation_result['valid']:
                 raise ValueError(f"Input file validation failed for {input_file_path}: {'; '.join(validation_result['errors'])}")
             for warning in validation_result.get('warnings', []):
                 logger.warning(f"Input file warning for project '{project_name}', file {input_file_path}: {warning}")
 
-            data_tuple = await asyncio.to_thread(input_demand_data, str(input_file_path))
+            data_tuple = await asyncio.to_thread(input_demand_data, str(input_file_path), workbook)
+            if data_tuple[0]:
+                await asyncio.to_thread(save_input_snapshot, str(input_file_path), data_tuple, source)
         except Exception as e:
             logger.error(f"Failed to load or validate input data for project '{project_name}' from {input_file_path}: {e}", exc_info=True)
             raise ValueError(f"Error processing input file for project '{project_name}': {str(e)}")
@@ -591,6 +639,9 @@ class DemandProjectionService:
 
         if not config.sector_configs: errors.append("No sector configurations provided.")
 
+        if not isinstance(config.max_workers, int) or not (VALIDATION_RULES['MIN_FORECAST_WORKERS'] <= config.max_workers <= VALIDATION_RULES['MAX_FORECAST_WORKERS']):
+            errors.append(f"Worker count must be between {VALIDATION_RULES['MIN_FORECAST_WORKERS']} and {VALIDATION_RULES['MAX_FORECAST_WORKERS']}.")
+
         try:
             _, _, param_dict, sector_data_map, _ = await self._load_input_data(project_name)
             data_end_year = param_dict.get('End_Year')
@@ -648,7 +699,6 @@ class DemandProjectionService:
         The core forecasting logic, designed to be run in the background.
         This method will be called by a BackgroundTask in the API route.
         """
-        project_input_file = self._get_project_input_file_path(project_name)
         project_results_dir = self.project_data_root / project_name / "results" / "demand_projection" / config.scenario_name
 
         # Async directory creation
@@ -657,15 +707,8 @@ class DemandProjectionService:
         try:
             await forecast_job_manager.update_job(job_id, status=JOB_STATUS['RUNNING'], progress=5, current_message='Loading input data...')
 
-            # Assuming _load_input_data is preferred. If direct call is needed, make it async.
-            # For this review, let's assume data is loaded via _load_input_data if possible,
-            # or if not, this call needs to be async. For now, making it async.
-            sectors, _, param_dict, sector_data_map, _ = await asyncio.to_thread(
-                input_demand_data, str(project_input_file)
-            )
-            # A better approach might be:
-            # sectors, _, param_dict, sector_data_map, _ = await self._load_input_data(project_name, force_reload=True)
-
+            # Shared input snapshot (or a single-pass parse that writes it)
+            sectors, _, param_dict, sector_data_map, _ = await self._load_input_data(project_name)
 
             await forecast_job_manager.update_job(job_id, progress=10, current_message='Data loaded. Saving configuration...')
             # Save full configuration to a file in project_results_dir
@@ -683,159 +726,127 @@ class DemandProjectionService:
 
             all_sector_results: List[SectorProcessingResult] = []
             total_configured_sectors = len(config.sector_configs)
+            worker_count = self._resolve_worker_count(config)
 
-            # Get the current event loop to schedule job updates from the thread
-            # This loop should be the one FastAPI's BackgroundTask is running on.
-            try:
-                main_event_loop = asyncio.get_running_loop()
-            except RuntimeError:
-                logger.error(f"Job {job_id}: Could not get running event loop. Progress updates might fail.")
-                main_event_loop = None # Continue, but progress updates from thread might not work as expected
-
-            for i, (sec_name, sec_cfg) in enumerate(config.sector_configs.items()):
-                # Check for cancellation before processing each sector
-                current_job_status_obj = await forecast_job_manager.get_job(job_id)
-                if current_job_status_obj and current_job_status_obj.get('status') == JOB_STATUS['CANCELLED']:
-                    logger.info(f"Job {job_id}: Detected cancellation before processing sector '{sec_name}'. Halting forecast execution.")
+            if worker_count > 1:
+                await forecast_job_manager.update_job(job_id, progress=15, current_message=f"Processing {total_configured_sectors} sectors with {worker_count} parallel workers...")
+                parallel_results = await self._execute_sectors_parallel(job_id, config, project_results_dir, sector_data_map, worker_count)
+                if parallel_results is None:
+                    logger.info(f"Job {job_id}: Parallel forecast execution halted due to cancellation request.")
                     await forecast_job_manager.update_job(job_id, current_message="Forecast execution halted due to cancellation request.")
-                    # No need to update to CANCELLED again if already marked by cancel_job,
-                    # but ensure final state reflects it if loop breaks here.
-                    # If loop terminates early, the final summary might be incomplete or not generated.
-                    # Consider how to handle this - perhaps a specific "CANCELLED_IN_PROGRESS" state
-                    # or just ensure the final summary reflects partial work.
-                    # For now, just break and let the job remain in CANCELLED state.
-                    break # Exit the sector processing loop
-
-                sector_start_time = time.time()
-                current_sector_message_prefix = f"Processing sector {i+1}/{total_configured_sectors}: '{sec_name}'"
-                await forecast_job_manager.update_job(job_id, current_sector=sec_name, current_message=f"{current_sector_message_prefix} - Starting...")
-
-                selected_models = sec_cfg.get('models', [])
-                model_params_cfg = {} # Ensure it's always a dict
-
-                # Prepare model_params carefully, converting windowSize if present
-                raw_mlr_params = sec_cfg.get('mlrParams', {}) # Assuming frontend might send it this way
-                raw_wam_params = sec_cfg.get('wamParams', {})
-
-                if 'MLR' in selected_models:
-                    model_params_cfg['MLR'] = {'independent_vars': sec_cfg.get('independentVars', [])}
-                if 'WAM' in selected_models:
-                    window_size_val = sec_cfg.get('windowSize', wam_params.get('window_size', 10)) # Check sec_cfg then global
-                    try:
-                        # Ensure window_size_val is treated as potentially string from config
-                        model_params_cfg['WAM'] = {'window_size': int(str(window_size_val))}
-                    except (ValueError, TypeError):
-                        logger.warning(f"Job {job_id}, Sector {sec_name}: Invalid window size '{window_size_val}'. Defaulting to 10.")
-                        model_params_cfg['WAM'] = {'window_size': 10} # Default WAM window size
-
-                # Check if sector data is available
-                if sec_name not in sector_data_map or sector_data_map[sec_name].empty:
-                    logger.warning(f"Job {job_id}: No data for sector '{sec_name}'. Skipping forecast.")
-                    s_result = SectorProcessingResult(
-                        sector_name=sec_name, status='failed',
-                        message="No input data found for this sector or data is empty.",
-                        error="Missing or empty sector data sheet.",
-                        processing_time_seconds=round(time.time() - sector_start_time, 2),
-                        configuration_used=sec_cfg
-                    )
-                    all_sector_results.append(s_result)
-                    await forecast_job_manager.add_sector_result(job_id, s_result)
-                    # Update overall progress immediately
-                    current_job_progress = 15 + int(((i + 1) / total_configured_sectors) * 70) # Mark this sector as "done" for progress
-                    await forecast_job_manager.update_job(job_id, progress=current_job_progress)
-                    continue # Move to the next sector
-
-
-                def _sector_progress_callback(progress_percent_sector: int, cb_sector_name: str, cb_message: str):
-                    # Before updating progress, check if the job has been cancelled.
-                    # This callback runs in the thread, so direct await is not possible here.
-                    # We can schedule a check or rely on the main loop's check.
-                    # For simplicity here, we'll assume the main loop check is frequent enough.
-                    # If more immediate halting of the ML function itself is needed, Main_forecasting_function
-                    # would need to accept a cancellation event/flag.
-
-                    if main_event_loop and not main_event_loop.is_closed():
-                        # Calculate overall progress: 15% for initial setup, 70% for sectors, 15% for finalization
-                        # This sector's contribution to the 70%
-                        overall_progress_for_sector = (progress_percent_sector / 100.0) / total_configured_sectors
-                        # Progress from previous sectors + current sector's partial progress
-                        current_overall_progress = 15 + int(((i + (progress_percent_sector / 100.0)) / total_configured_sectors) * 70)
-
-                        full_message = f"{current_sector_message_prefix} - {cb_message}"
-                        asyncio.run_coroutine_threadsafe(
-                            forecast_job_manager.update_job(
-                                job_id,
-                                progress=current_overall_progress,
-                                current_message=full_message
-                            ),
-                            main_event_loop
-                        )
-                    else:
-                        logger.warning(f"Job {job_id}: Event loop not available or closed. Cannot update progress for {cb_sector_name} - {cb_message}")
-
+                    return
+                all_sector_results.extend(parallel_results)
+            else:
+                # Get the current event loop to schedule job updates from the thread
+                # This loop should be the one FastAPI's BackgroundTask is running on.
                 try:
-                    sector_df = sector_data_map[sec_name]
-                    # Ensure main_df is a DataFrame, not None or other type
-                    if not isinstance(sector_df, pd.DataFrame):
-                         raise TypeError(f"Data for sector '{sec_name}' is not a pandas DataFrame.")
-
-                    sector_forecast_result = await asyncio.to_thread(
-                        Main_forecasting_function,
-                        sheet_name=sec_name,
-                        forecast_path=str(project_results_dir),
-                        main_df=sector_df, # Pass the actual DataFrame for the sector
-                        selected_models=selected_models,
-                        model_params=model_params_cfg,
-                        target_year=config.target_year,
-                        exclude_covid=config.exclude_covid_years,
-                        progress_callback=_sector_progress_callback
-                    )
-
-                    # Interpret result from Main_forecasting_function
-                    if sector_forecast_result.get('status') == 'success':
-                        s_status = 'success'
-                        if sector_forecast_result.get('used_existing_data', False):
-                            s_status = 'existing_data' # Special status if no forecast was run
-
+                    main_event_loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    logger.error(f"Job {job_id}: Could not get running event loop. Progress updates might fail.")
+                    main_event_loop = None # Continue, but progress updates from thread might not work as expected
+
+                for i, (sec_name, sec_cfg) in enumerate(config.sector_configs.items()):
+                    # Check for cancellation before processing each sector
+                    current_job_status_obj = await forecast_job_manager.get_job(job_id)
+                    if current_job_status_obj and current_job_status_obj.get('status') == JOB_STATUS['CANCELLED']:
+                        logger.info(f"Job {job_id}: Detected cancellation before processing sector '{sec_name}'. Halting forecast execution.")
+                        await forecast_job_manager.update_job(job_id, current_message="Forecast execution halted due to cancellation request.")
+                        # No need to update to CANCELLED again if already marked by cancel_job,
+                        # but ensure final state reflects it if loop breaks here.
+                        # If loop terminates early, the final summary might be incomplete or not generated.
+                        # Consider how to handle this - perhaps a specific "CANCELLED_IN_PROGRESS" state
+                        # or just ensure the final summary reflects partial work.
+                        # For now, just break and let the job remain in CANCELLED state.
+                        break # Exit the sector processing loop
+
+                    sector_start_time = time.time()
+                    current_sector_message_prefix = f"Processing sector {i+1}/{total_configured_sectors}: '{sec_name}'"
+                    await forecast_job_manager.update_job(job_id, current_sector=sec_name, current_message=f"{current_sector_message_prefix} - Starting...")
+
+                    selected_models, model_params_cfg = self._build_model_params(job_id, sec_name, sec_cfg)
+
+                    # Check if sector data is available
+                    if sec_name not in sector_data_map or sector_data_map[sec_name].empty:
+                        logger.warning(f"Job {job_id}: No data for sector '{sec_name}'. Skipping forecast.")
                         s_result = SectorProcessingResult(
-                            sector_name=sec_name, status=s_status,
-                            message=sector_forecast_result.get('message', 'Completed successfully.'),
-                            models_used=sector_forecast_result.get('models_used', selected_models),
+                            sector_name=sec_name, status='failed',
+                            message="No input data found for this sector or data is empty.",
+                            error="Missing or empty sector data sheet.",
                             processing_time_seconds=round(time.time() - sector_start_time, 2),
                             configuration_used=sec_cfg
                         )
-                    elif sector_forecast_result.get('status') == 'warning': # Handle warnings as partial success or note
-                        s_result = SectorProcessingResult(
-                            sector_name=sec_name, status='warning', # Or map to 'success' with notes
-                            message=sector_forecast_result.get('message', 'Completed with warnings.'),
-                            error=sector_forecast_result.get('error_details'), # Optional error detail
-                            models_used=sector_forecast_result.get('models_used', []),
-                            processing_time_seconds=round(time.time() - sector_start_time, 2),
-                            configuration_used=sec_cfg
+                        all_sector_results.append(s_result)
+                        await forecast_job_manager.add_sector_result(job_id, s_result)
+                        # Update overall progress immediately
+                        current_job_progress = 15 + int(((i + 1) / total_configured_sectors) * 70) # Mark this sector as "done" for progress
+                        await forecast_job_manager.update_job(job_id, progress=current_job_progress)
+                        continue # Move to the next sector
+
+
+                    def _sector_progress_callback(progress_percent_sector: int, cb_sector_name: str, cb_message: str):
+                        # Before updating progress, check if the job has been cancelled.
+                        # This callback runs in the thread, so direct await is not possible here.
+                        # We can schedule a check or rely on the main loop's check.
+                        # For simplicity here, we'll assume the main loop check is frequent enough.
+                        # If more immediate halting of the ML function itself is needed, Main_forecasting_function
+                        # would need to accept a cancellation event/flag.
+
+                        if main_event_loop and not main_event_loop.is_closed():
+                            # Calculate overall progress: 15% for initial setup, 70% for sectors, 15% for finalization
+                            # This sector's contribution to the 70%
+                            overall_progress_for_sector = (progress_percent_sector / 100.0) / total_configured_sectors
+                            # Progress from previous sectors + current sector's partial progress
+                            current_overall_progress = 15 + int(((i + (progress_percent_sector / 100.0)) / total_configured_sectors) * 70)
+
+                            full_message = f"{current_sector_message_prefix} - {cb_message}"
+                            asyncio.run_coroutine_threadsafe(
+                                forecast_job_manager.update_job(
+                                    job_id,
+                                    progress=current_overall_progress,
+                                    current_message=full_message
+                                ),
+                                main_event_loop
+                            )
+                        else:
+                            logger.warning(f"Job {job_id}: Event loop not available or closed. Cannot update progress for {cb_sector_name} - {cb_message}")
+
+                    try:
+                        sector_df = sector_data_map[sec_name]
+                        # Ensure main_df is a DataFrame, not None or other type
+                        if not isinstance(sector_df, pd.DataFrame):
+                             raise TypeError(f"Data for sector '{sec_name}' is not a pandas DataFrame.")
+
+                        sector_forecast_result = await asyncio.to_thread(
+                            Main_forecasting_function,
+                            sheet_name=sec_name,
+                            forecast_path=str(project_results_dir),
+                            main_df=sector_df, # Pass the actual DataFrame for the sector
+                            selected_models=selected_models,
+                            model_params=model_params_cfg,
+                            target_year=config.target_year,
+                            exclude_covid=config.exclude_covid_years,
+                            progress_callback=_sector_progress_callback
                         )
-                    else: # Error status
+
+                        s_result = self._interpret_sector_result(
+                            sec_name, sec_cfg, selected_models, sector_forecast_result,
+                            round(time.time() - sector_start_time, 2)
+                        )
+                    except Exception as e_sec:
+                        logger.error(f"Job {job_id}: Unhandled error during forecasting sector '{sec_name}': {e_sec}", exc_info=True)
                         s_result = SectorProcessingResult(
                             sector_name=sec_name, status='failed',
-                            message=sector_forecast_result.get('message', 'Forecasting failed for this sector.'),
-                            error=sector_forecast_result.get('error_details', 'Unknown error during forecasting.'),
+                            message=f"An unexpected error occurred: {str(e_sec)}",
+                            error=str(e_sec),
                             processing_time_seconds=round(time.time() - sector_start_time, 2),
                             configuration_used=sec_cfg
                         )
-                except Exception as e_sec:
-                    logger.error(f"Job {job_id}: Unhandled error during forecasting sector '{sec_name}': {e_sec}", exc_info=True)
-                    s_result = SectorProcessingResult(
-                        sector_name=sec_name, status='failed',
-                        message=f"An unexpected error occurred: {str(e_sec)}",
-                        error=str(e_sec),
-                        processing_time_seconds=round(time.time() - sector_start_time, 2),
-                        configuration_used=sec_cfg
-                    )
 
-                all_sector_results.append(s_result)
-                await forecast_job_manager.add_sector_result(job_id, s_result)
-                # Update overall progress after each sector is fully processed by Main_forecasting_function
-                final_sector_progress = 15 + int(((i + 1) / total_configured_sectors) * 70)
-                await forecast_job_manager.update_job(job_id, progress=final_sector_progress, current_message=f"{current_sector_message_prefix} - {s_result.message}")
+                    all_sector_results.append(s_result)
+                    await forecast_job_manager.add_sector_result(job_id, s_result)
+                    # Update overall progress after each sector is fully processed by Main_forecasting_function
+                    final_sector_progress = 15 + int(((i + 1) / total_configured_sectors) * 70)
+                    await forecast_job_manager.update_job(job_id, progress=final_sector_progress, current_message=f"{current_sector_message_prefix} - {s_result.message}")
 
             # Finalize job: Set progress to 85 initially, then 100 upon completion of summary
             await forecast_job_manager.update_job(job_id, progress=85, current_message="Aggregating results...")
@@ -853,7 +864,9 @@ class DemandProjectionService:
                 "existing_data_sectors": existing_data_sectors_count, # If applicable
                 "processed_sector_details": [asdict(sr) for sr in all_sector_results], # Includes individual messages, errors, times
                 "overall_output_path": str(project_results_dir),
-                "total_forecast_processing_time_seconds": round(total_processing_time, 2)
+                "total_forecast_processing_time_seconds": round(total_processing_time, 2),
+                "execution_mode": "parallel" if worker_count > 1 else "serial",
+                "worker_count": worker_count
             }
 
             final_status = JOB_STATUS['COMPLETED']
@@ -888,4 +901,168 @@ class DemandProjectionService:
             logger.error(f"Unhandled exception in forecast job {job_id}: {e_gen}", exc_info=True)
             await forecast_job_manager.update_job(job_id, status=JOB_STATUS['FAILED'], error_message="An unexpected server error occurred.", current_message="Critical error.")
 
+    def _build_model_params(self, job_id: str, sec_name: str, sec_cfg: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+        """Translates a sector's UI configuration into selected models and model parameters."""
+        selected_models = sec_cfg.get('models', [])
+        model_params_cfg = {} # Ensure it's always a dict
+
+        # Prepare model_params carefully, converting windowSize if present
+        raw_wam_params = sec_cfg.get('wamParams', {})
+
+        if 'MLR' in selected_models:
+            model_params_cfg['MLR'] = {'independent_vars': sec_cfg.get('independentVars', [])}
+        if 'WAM' in selected_models:
+            window_size_val = sec_cfg.get('windowSize', raw_wam_params.get('window_size', 10)) # Check sec_cfg then wamParams
+            try:
+                # Ensure window_size_val is treated as potentially string from config
+                model_params_cfg['WAM'] = {'window_size': int(str(window_size_val))}
+            except (ValueError, TypeError):
+                logger.warning(f"Job {job_id}, Sector {sec_name}: Invalid window size '{window_size_val}'. Defaulting to 10.")
+                model_params_cfg['WAM'] = {'window_size': 10} # Default WAM window size
+        return selected_models, model_params_cfg
+
+    def _interpret_sector_result(self, sec_name: str, sec_cfg: Dict[str, Any], selected_models: List[str],
+                                 sector_forecast_result: Dict[str, Any], processing_time_seconds: float) -> SectorProcessingResult:
+        """Maps the dict returned by Main_forecasting_function onto a SectorProcessingResult."""
+        if sector_forecast_result.get('status') == 'success':
+            s_status = 'success'
+            if sector_forecast_result.get('used_existing_data', False):
+                s_status = 'existing_data' # Special status if no forecast was run
+
+            return SectorProcessingResult(
+                sector_name=sec_name, status=s_status,
+                message=sector_forecast_result.get('message', 'Completed successfully.'),
+                models_used=sector_forecast_result.get('models_used', selected_models),
+                processing_time_seconds=processing_time_seconds,
+                configuration_used=sec_cfg
+            )
+        elif sector_forecast_result.get('status') == 'warning': # Handle warnings as partial success or note
+            return SectorProcessingResult(
+                sector_name=sec_name, status='warning', # Or map to 'success' with notes
+                message=sector_forecast_result.get('message', 'Completed with warnings.'),
+                error=sector_forecast_result.get('error_details'), # Optional error detail
+                models_used=sector_forecast_result.get('models_used', []),
+                processing_time_seconds=processing_time_seconds,
+                configuration_used=sec_cfg
+            )
+        # Error status
+        return SectorProcessingResult(
+            sector_name=sec_name, status='failed',
+            message=sector_forecast_result.get('message', 'Forecasting failed for this sector.'),
+            error=sector_forecast_result.get('error_details', 'Unknown error during forecasting.'),
+            processing_time_seconds=processing_time_seconds,
+            configuration_used=sec_cfg
+        )
+
+    def _resolve_worker_count(self, config: ForecastJobConfig) -> int:
+        """Worker processes to use for a job, bounded by the CPU count and the number of sectors."""
+        requested = int(config.max_workers or 1)
+        return max(1, min(requested, os.cpu_count() or 1, len(config.sector_configs)))
+
+    async def _execute_sectors_parallel(self, job_id: str, config: ForecastJobConfig, project_results_dir: Path,
+                                        sector_data_map: Dict[str, Any], worker_count: int) -> Optional[List[SectorProcessingResult]]:
+        """
+        Forecasts all configured sectors in a process pool.
+        Worker progress arrives through a managed queue and is aggregated into one job progress value.
+        Each sector succeeds or fails independently. Returns None when the job is cancelled:
+        queued sectors are skipped, and sectors already running finish their current fit.
+        """
+        total_configured_sectors = len(config.sector_configs)
+        sector_progress = {sec_name: 0 for sec_name in config.sector_configs}
+        results: List[SectorProcessingResult] = []
+        cancelled = False
+
+        mp_context = multiprocessing.get_context('spawn') # Never fork the running event loop process
+        manager = mp_context.Manager()
+        executor = ProcessPoolExecutor(max_workers=worker_count, mp_context=mp_context)
+        try:
+            progress_queue = manager.Queue()
+            cancel_event = manager.Event()
+
+            pending: Dict[asyncio.Future, Tuple[str, Dict[str, Any], List[str]]] = {}
+            for sec_name, sec_cfg in config.sector_configs.items():
+                if sec_name not in sector_data_map or sector_data_map[sec_name].empty:
+                    logger.warning(f"Job {job_id}: No data for sector '{sec_name}'. Skipping forecast.")
+                    s_result = SectorProcessingResult(
+                        sector_name=sec_name, status='failed',
+                        message="No input data found for this sector or data is empty.",
+                        error="Missing or empty sector data sheet.",
+                        configuration_used=sec_cfg
+                    )
+                    results.append(s_result)
+                    await forecast_job_manager.add_sector_result(job_id, s_result)
+                    sector_progress[sec_name] = 100
+                    continue
+
+                selected_models, model_params_cfg = self._build_model_params(job_id, sec_name, sec_cfg)
+                concurrent_future = executor.submit(
+                    _forecast_sector_in_process,
+                    sec_name, sector_data_map[sec_name], str(project_results_dir),
+                    selected_models, model_params_cfg,
+                    config.target_year, config.exclude_covid_years,
+                    progress_queue, cancel_event
+                )
+                pending[asyncio.wrap_future(concurrent_future)] = (sec_name, sec_cfg, selected_models)
+
+            while pending:
+                done, _ = await asyncio.wait(pending.keys(), timeout=0.5, return_when=asyncio.FIRST_COMPLETED)
+
+                latest_message = None
+                while True: # Drain progress reported by the workers
+                    try:
+                        cb_sector_name, progress_percent_sector, cb_message = progress_queue.get_nowait()
+                    except Empty:
+                        break
+                    if cb_sector_name in sector_progress:
+                        sector_progress[cb_sector_name] = max(sector_progress[cb_sector_name], progress_percent_sector)
+                    latest_message = f"'{cb_sector_name}' - {cb_message}"
+
+                for finished in done:
+                    sec_name, sec_cfg, selected_models = pending.pop(finished)
+                    sector_progress[sec_name] = 100
+                    if finished.cancelled():
+                        continue
+                    try:
+                        sector_forecast_result = finished.result()
+                        if sector_forecast_result.get('status') == 'cancelled':
+                            continue
+                        s_result = self._interpret_sector_result(
+                            sec_name, sec_cfg, selected_models, sector_forecast_result,
+                            sector_forecast_result.get('processing_time_seconds', 0.0)
+                        )
+                    except Exception as e_sec: # Includes a worker process dying (BrokenProcessPool)
+                        logger.error(f"Job {job_id}: Worker error during forecasting sector '{sec_name}': {e_sec}", exc_info=True)
+                        s_result = SectorProcessingResult(
+                            sector_name=sec_name, status='failed',
+                            message=f"An unexpected error occurred: {str(e_sec)}",
+                            error=str(e_sec),
+                            configuration_used=sec_cfg
+                        )
+                    results.append(s_result)
+                    await forecast_job_manager.add_sector_result(job_id, s_result)
+                    latest_message = f"'{sec_name}' - {s_result.message}"
+
+                if cancelled:
+                    continue
+
+                current_job_status_obj = await forecast_job_manager.get_job(job_id)
+                if current_job_status_obj and current_job_status_obj.get('status') == JOB_STATUS['CANCELLED']:
+                    logger.info(f"Job {job_id}: Detected cancellation. Skipping queued sectors and waiting for running ones.")
+                    cancelled = True
+                    cancel_event.set()
+                    for waiting in pending:
+                        waiting.cancel()
+                    continue
+
+                overall_progress = 15 + int((sum(sector_progress.values()) / (100 * total_configured_sectors)) * 70)
+                updates: Dict[str, Any] = {'progress': overall_progress}
+                if latest_message:
+                    updates['current_message'] = f"Parallel forecast ({len(results)}/{total_configured_sectors} sectors done): {latest_message}"
+                await forecast_job_manager.update_job(job_id, **updates)
+        finally:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+            manager.shutdown()
+
+        return None if cancelled else results
+
 print("Defining demand projection service for FastAPI... (merged and adapted)")
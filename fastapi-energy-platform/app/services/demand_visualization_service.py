@@ -13,6 +13,9 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from app.utils.forecast_store import read_sector_sheet
+from app.utils.demand_utils import calculate_consolidated_demand_for_scenarios
+
 # Assuming utilities are adapted and available
 # from app.utils.helpers import ... # Specific helpers if needed
 # from app.config import Settings # For configured paths
@@ -212,6 +215,10 @@ class DemandVisualizationService:
         try:
             # Asynchronously read Excel file using pandas in a thread
             def _read_excel_sync():
+                # Prefer the columnar sidecar written by the forecast pipeline
+                sidecar_df = read_sector_sheet(str(file_path.parent), sector_name, 'Results')
+                if sidecar_df is not None:
+                    return sidecar_df
                 # Determine sheet name (Results or first sheet)
                 # pd.ExcelFile is also I/O bound
                 xls_file = pd.ExcelFile(file_path)
@@ -282,6 +289,7 @@ class DemandVisualizationService:
         }
 
         common_sectors = set(data_s1.sectors_data.keys()) & set(data_s2.sectors_data.keys())
+        comparison_by_sector = {}
 
         for sector_name in common_sectors:
             s1_sector_data = data_s1.sectors_data[sector_name]
@@ -319,8 +327,49 @@ class DemandVisualizationService:
                     comparison_by_sector[sector_name]["models_comparison"][model_name] = model_comp_data
 
         comparison_result["comparison_by_sector"] = comparison_by_sector
+
+        all_years = set(data_s1.all_years_in_scenario) | set(data_s2.all_years_in_scenario)
+        if all_years:
+            comparison_result["consolidated_comparison"] = await self._compare_consolidated_demand(
+                project_name, [scenario_name1, scenario_name2],
+                {'from': min(all_years), 'to': max(all_years)}, (filters or {}).get('unit', 'TWh')
+            )
         return comparison_result
 
+    async def _compare_consolidated_demand(self, project_name: str, scenario_names: List[str],
+                                           year_range: Dict[str, int], display_unit: str) -> Dict[str, Any]:
+        """
+        On-grid demand of each scenario from its saved model selection and T&D losses,
+        consolidated for all scenarios in one call. Scenarios without a model selection are skipped.
+        """
+        import asyncio # Ensure asyncio is imported
+        scenarios_base_path = self._get_scenario_base_path(project_name)
+        scenarios = {}
+        for scenario_name in scenario_names:
+            model_selection = (await self.get_model_selection(project_name, scenario_name)).get('model_selection') or {}
+            if not model_selection:
+                continue
+            scenarios[scenario_name] = {
+                'scenario_path': str(scenarios_base_path / scenario_name),
+                'sector_models': model_selection,
+                'td_losses': (await self.get_td_losses(project_name, scenario_name)).get('td_losses') or []
+            }
+        if not scenarios:
+            return {}
+
+        results = await asyncio.to_thread(calculate_consolidated_demand_for_scenarios, scenarios, [], year_range)
+
+        conversion_factor = self.unit_factors['kWh'] / self.unit_factors.get(display_unit, 1e9) # kWh to display_unit
+        return {
+            scenario_name: {
+                "display_unit": display_unit,
+                "years": df['Year'].astype(int).tolist(),
+                "td_losses": (df['T&D_Losses'] * conversion_factor).round(3).tolist(),
+                "total_on_grid_demand": (df['Total_On_Grid_Demand'] * conversion_factor).round(3).tolist()
+            }
+            for scenario_name, df in results.items()
+        }
+
     async def get_model_selection(self, project_name: str, scenario_name: str) -> Dict[str, Any]:
         return await self.load_ui_configuration(project_name, scenario_name, "model_selection") or {"model_selection": {}}
 
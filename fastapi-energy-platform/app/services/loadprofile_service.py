@@ -18,13 +18,44 @@ from fastapi import UploadFile
 # Assuming the original LoadProfileGenerator is in the root 'models' directory
 # This might require PYTHONPATH adjustments or a different import strategy
 # depending on how the FastAPI app is run.
-from models.load_profile_generator import LoadProfileGenerator
+from models.load_profile_generator import GenerationCancelled, LoadProfileGenerator, report_progress
 from app.utils.helpers import get_file_info, ensure_directory, safe_filename
-from app.utils.constants import VALIDATION_RULES, UNIT_FACTORS # Check relevance
+from app.utils.constants import VALIDATION_RULES, UNIT_FACTORS, JOB_STATUS # Check relevance
 from app.utils.error_handlers import ValidationError, ProcessingError, ResourceNotFoundError
+from app.utils.job_manager import JobManager
+from app.utils.profile_store import get_profile_path
 
 logger = logging.getLogger(__name__)
 
+# Job progress (percent) reported when each generation stage starts
+GENERATION_STAGES = {
+    'template': 5,
+    'decomposition': 15,
+    'forecast': 45,
+    'constraints': 70,
+    'save': 90
+}
+
+
+def stage_progress(stage: str, fraction: float = 0.0) -> float:
+    """Job progress for a point within a stage (fraction 0-1 of the way to the next stage)"""
+    stages = list(GENERATION_STAGES)
+    start = GENERATION_STAGES[stage]
+    index = stages.index(stage)
+    end = GENERATION_STAGES[stages[index + 1]] if index + 1 < len(stages) else 100
+    return round(start + min(max(fraction, 0.0), 1.0) * (end - start), 1)
+
+
+# Batch key of the profile generated from the template's total demand
+TEMPLATE_SCENARIO_NAME = 'template'
+
+# Interval of the keep-alive updates sent while a stage runs; well under the
+# job manager's 10 minute stall limit, which a long STL decomposition can exceed
+GENERATION_HEARTBEAT_SECONDS = 60
+
+# Background load profile generation jobs of this process (thread-safe, usable from worker threads)
+profile_job_manager = JobManager()
+
 # Basic Async In-Memory Cache
 class AsyncInMemoryCache:
     def __init__(self, default_ttl_seconds: int = 300):
@@ -77,6 +108,9 @@ class LoadProfileService:
     def __init__(self, project_data_root: Path):
         self.project_data_root = project_data_root
         self.cache = AsyncInMemoryCache(default_ttl_seconds=600) # 10 min TTL
+        # Generators only hold project paths and the shared holiday calendar, so one per project is reused
+        self._generators: Dict[str, LoadProfileGenerator] = {}
+        self._generators_lock = asyncio.Lock()
 
     def _get_project_specific_path(self, project_name: str) -> Path:
         # Sanitize project_name to prevent path traversal if it's ever sourced unsafely
@@ -88,15 +122,29 @@ class LoadProfileService:
 
     async def _get_generator_for_project(self, project_name: str) -> LoadProfileGenerator:
         project_path = self._get_project_specific_path(project_name)
-        # Ensure project directories exist (idempotent)
-        # These are synchronous but should be quick. If problematic, make them async.
-        # LoadProfileGenerator itself might also ensure these.
-        await asyncio.to_thread(ensure_directory, project_path / "inputs")
-        await asyncio.to_thread(ensure_directory, project_path / "results" / "load_profiles")
-        await asyncio.to_thread(ensure_directory, project_path / "config")
-
-        # LoadProfileGenerator instantiation is synchronous.
-        return await asyncio.to_thread(LoadProfileGenerator, str(project_path))
+        generator_key = str(project_path)
+
+        generator = self._generators.get(generator_key)
+        if generator is not None and await asyncio.to_thread(project_path.is_dir):
+            return generator
+
+        async with self._generators_lock:
+            generator = self._generators.get(generator_key)
+            if generator is not None and await asyncio.to_thread(project_path.is_dir):
+                return generator
+
+            # Ensure project directories exist (idempotent)
+            # These are synchronous but should be quick. If problematic, make them async.
+            # LoadProfileGenerator itself might also ensure these.
+            await asyncio.to_thread(ensure_directory, project_path / "inputs")
+            await asyncio.to_thread(ensure_directory, project_path / "results" / "load_profiles")
+            await asyncio.to_thread(ensure_directory, project_path / "config")
+
+            # LoadProfileGenerator instantiation is synchronous.
+            generator = await asyncio.to_thread(LoadProfileGenerator, str(project_path))
+            self._generators[generator_key] = generator
+            logger.debug(f"Created load profile generator for project '{project_name}'")
+            return generator
 
     # --- Ported/Adapted Methods from Flask Service ---
 
@@ -197,11 +245,18 @@ class LoadProfileService:
             raise ProcessingError(f"Failed to get scenario info: {str(e)}")
 
 
-    async def generate_profile(self, project_name: str, generation_type: str, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate a load profile (base or STL) for a project."""
+    async def generate_profile(self, project_name: str, generation_type: str, config: Dict[str, Any],
+                               progress_callback=None) -> Dict[str, Any]:
+        """
+        Generate a load profile (base or STL) for a project.
+        progress_callback(stage, message[, fraction]) is called as each GENERATION_STAGES stage
+        starts, and with a fraction of the stage while long stages run;
+        GenerationCancelled raised by it propagates to the caller.
+        """
         generator = await self._get_generator_for_project(project_name)
 
         # Load template data once
+        report_progress(progress_callback, 'template', "Loading load curve template")
         try:
             template_data = await asyncio.to_thread(generator.load_template_data)
             historical_data_df = template_data.get('historical_demand', pd.DataFrame())
@@ -236,7 +291,8 @@ class LoadProfileService:
                     start_fy=int(config['start_fy']),
                     end_fy=int(config['end_fy']),
                     frequency=config.get('frequency', 'hourly'),
-                    constraints=constraints
+                    constraints=constraints,
+                    progress_callback=progress_callback
                 )
             elif generation_type == "stl_profile":
                 result = await asyncio.to_thread(
@@ -248,12 +304,14 @@ class LoadProfileService:
                     frequency=config.get('frequency', 'hourly'),
                     stl_params=config.get('stl_params', {}),
                     constraints=constraints,
-                    lf_improvement=config.get('lf_improvement')
+                    lf_improvement=config.get('lf_improvement'),
+                    progress_callback=progress_callback
                 )
             else:
                 raise ValidationError(f"Unknown profile generation type: {generation_type}")
 
             if result.get('status') == 'success':
+                report_progress(progress_callback, 'save', "Saving profile")
                 custom_name = config.get('custom_name', '').strip()
                 profile_id_suggestion = f"{custom_name}_{generation_type}" if custom_name else None
 
@@ -280,11 +338,150 @@ class LoadProfileService:
                 }
             else:
                 raise ProcessingError(result.get('message', "Profile generation failed internally."))
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.exception(f"Error during {generation_type} profile generation for project '{project_name}': {e}")
             raise ProcessingError(f"Failed to generate {generation_type} profile: {str(e)}")
 
 
+    async def execute_generation_job(self, project_name: str, generation_type: str,
+                                     config: Dict[str, Any], job_id: str) -> Dict[str, Any]:
+        """
+        Run generate_profile as a background job tracked by profile_job_manager.
+        Progress is reported as each stage starts, and the job is checked for cancellation at
+        the same points, so a cancelled job stops at the next stage without saving a profile.
+        """
+        def progress_callback(stage: str, message: str, fraction: float = 0.0):
+            job = profile_job_manager.get_job(job_id)
+            if job is None or job['status'] not in (JOB_STATUS['RUNNING'], JOB_STATUS['STARTING']):
+                raise GenerationCancelled(f"Job stopped before stage '{stage}'")
+            updates = {'progress': stage_progress(stage, fraction), 'message': message}
+            if job.get('current_step') != stage:
+                updates['current_step'] = stage
+            profile_job_manager.update_job(job_id, **updates)
+
+        profile_job_manager.update_job(job_id, status=JOB_STATUS['RUNNING'], message=f"{generation_type} generation started")
+        heartbeat = asyncio.create_task(self._send_heartbeats(job_id))
+        try:
+            result = await self.generate_profile(project_name, generation_type, config, progress_callback)
+        except GenerationCancelled as e:
+            logger.info(f"Load profile job {job_id} cancelled: {e}")
+            return {'status': 'cancelled', 'message': str(e)}
+        except Exception as e:
+            logger.error(f"Load profile job {job_id} failed: {e}")
+            with profile_job_manager.lock:
+                job = profile_job_manager.get_job(job_id)
+                if job is not None and job['status'] != JOB_STATUS['CANCELLED']:
+                    profile_job_manager.complete_job(job_id, error=str(e))
+            return {'status': 'failed', 'error': str(e)}
+        finally:
+            heartbeat.cancel()
+
+        # Check and complete under the manager's lock, so a cancel either lands before
+        # the check or is rejected because the job is no longer running
+        with profile_job_manager.lock:
+            job = profile_job_manager.get_job(job_id)
+            cancelled = job is not None and job['status'] == JOB_STATUS['CANCELLED']
+            if not cancelled:
+                profile_job_manager.complete_job(job_id, result=result)
+
+        if cancelled:
+            # Cancelled after the last stage check: honour it and drop the saved profile
+            await self.delete_profile(project_name, result['profile_id'])
+            logger.info(f"Load profile job {job_id} cancelled after generation finished")
+            return {'status': 'cancelled', 'message': 'Job cancelled before completion'}
+        return {'status': 'success', 'profile_id': result['profile_id']}
+
+    async def _send_heartbeats(self, job_id: str):
+        """Refresh the job's last update while it runs, so a long stage is not taken for a stall"""
+        while True:
+            await asyncio.sleep(GENERATION_HEARTBEAT_SECONDS)
+            job = profile_job_manager.get_job(job_id)
+            if job is None or job['status'] not in (JOB_STATUS['RUNNING'], JOB_STATUS['STARTING']):
+                return
+            profile_job_manager.update_job(job_id)
+
+    async def generate_base_profiles_batch(self, project_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate and save base profiles for several demand scenarios in one job."""
+        generator = await self._get_generator_for_project(project_name)
+
+        try:
+            template_data = await asyncio.to_thread(generator.load_template_data)
+            historical_data_df = template_data.get('historical_demand', pd.DataFrame())
+        except FileNotFoundError:
+            raise ProcessingError(f"Load curve template not found for project '{project_name}'. Cannot generate profiles.")
+        except Exception as e:
+            raise ProcessingError(f"Error loading template data for profile generation: {str(e)}")
+
+        # No scenario names means every consolidated scenario of the project
+        available = {s['name']: s['path'] for s in await self._get_available_scenarios(project_name)}
+        scenario_names = config.get('scenario_names') or list(available)
+        missing = [name for name in scenario_names if name not in available]
+        if missing:
+            raise ValidationError(f"Demand scenarios not found: {', '.join(missing)}")
+
+        demand_scenarios_by_name: Dict[str, pd.DataFrame] = {}
+        if config.get('include_template'):
+            # The template's profile is keyed 'template', so a scenario of that name would replace it
+            if TEMPLATE_SCENARIO_NAME in scenario_names:
+                raise ValidationError(f"Demand scenario '{TEMPLATE_SCENARIO_NAME}' cannot be combined with include_template.")
+            demand_scenarios_by_name[TEMPLATE_SCENARIO_NAME] = template_data.get('total_demand', pd.DataFrame())
+        failed_scenarios: Dict[str, str] = {}
+        for name in scenario_names:
+            try:
+                demand_scenarios_by_name[name] = await asyncio.to_thread(generator.load_scenario_data, Path(available[name]))
+            except Exception as e:
+                logger.warning(f"Skipping demand scenario '{name}' in batch for project '{project_name}': {e}")
+                failed_scenarios[name] = str(e)
+        if not demand_scenarios_by_name:
+            raise ValidationError(f"No demand scenarios available for batch generation. Failed: {failed_scenarios}")
+
+        constraints = await asyncio.to_thread(self._prepare_constraints, config, template_data)
+
+        try:
+            result = await asyncio.to_thread(
+                generator.generate_base_profile_forecasts,
+                historical_data=historical_data_df,
+                demand_scenarios_by_name=demand_scenarios_by_name,
+                base_year=int(config['base_year']),
+                start_fy=int(config['start_fy']),
+                end_fy=int(config['end_fy']),
+                frequency=config.get('frequency', 'hourly'),
+                constraints=constraints
+            )
+            if result.get('status') != 'success':
+                raise ProcessingError(result.get('message', "Batch profile generation failed internally."))
+
+            # The scenario name keeps profile ids unique within the batch
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            prefix = (config.get('custom_name') or '').strip() or 'base_profile'
+            profiles = {}
+            for scenario_name, forecast_data in result['data']['forecasts'].items():
+                profile_id = safe_filename(f"{prefix}_{scenario_name}_{timestamp}")
+                save_info = await asyncio.to_thread(generator.save_forecast, forecast_data, profile_id_override=profile_id)
+                forecast_data.update({'method': 'base_profile', 'start_fy': config['start_fy'],
+                                      'end_fy': config['end_fy'], 'frequency': config.get('frequency', 'hourly')})
+                profiles[scenario_name] = {
+                    'profile_id': save_info['profile_id'],
+                    'file_path': str(save_info['file_path']),
+                    'metadata_path': str(save_info['metadata_path']),
+                    'summary': self._create_generation_summary(forecast_data)
+                }
+
+            await self.cache.clear_pattern(f"lp_profiles_list:{project_name}")
+            return {
+                'success': True,
+                'generation_config': config,
+                'profiles': profiles,
+                'failed': {**failed_scenarios, **result['data']['failed']}
+            }
+        except (ValidationError, ProcessingError):
+            raise
+        except Exception as e:
+            logger.exception(f"Error during batch base profile generation for project '{project_name}': {e}")
+            raise ProcessingError(f"Failed to generate base profiles: {str(e)}")
+
     async def get_saved_profiles_with_metadata(self, project_name: str) -> Dict[str, Any]:
         cache_key = f"lp_profiles_list:{project_name}"
         cached = await self.cache.get(cache_key)
@@ -298,11 +495,11 @@ class LoadProfileService:
             for profile_meta in profiles:
                 profile_id = profile_meta.get("profile_id")
                 if profile_id:
-                    csv_path = generator.results_profiles_path / f"{profile_id}.csv"
-                    if await asyncio.to_thread(csv_path.exists):
-                        profile_meta['file_info'] = await get_file_info(csv_path)
+                    profile_path = await asyncio.to_thread(get_profile_path, generator.results_path, profile_id)
+                    if profile_path is not None:
+                        profile_meta['file_info'] = await get_file_info(profile_path)
                     else:
-                         profile_meta['file_info'] = {'exists': False, 'error': 'CSV missing.'}
+                         profile_meta['file_info'] = {'exists': False, 'error': 'Profile file missing.'}
                 enhanced_profiles.append(profile_meta)
 
             enhanced_profiles.sort(key=lambda x: x.get('generated_at', ''), reverse=True)
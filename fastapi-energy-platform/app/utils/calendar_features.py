@@ -0,0 +1,164 @@
+# app/utils/calendar_features.py
+"""
+Vectorized calendar features for load profiles.
+
+Every hourly or sub-hourly profile needs the same calendar columns (hour, day of
+week, month, financial year and month, season, ...). They are computed here
+once from the int64 nanosecond timestamps with NumPy datetime arithmetic, as
+int8/int16 arrays; labels such as season or day name are categorical codes
+rather than per-row strings. Regular series are cached per
+(start, periods, freq, fy_start_month), so the generator, the analyzer and the
+data-flow pipeline share one computation for the same profile range.
+"""
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_FY_START_MONTH = 4
+
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+DAY_TYPES = ('Weekday', 'Weekend')
+TIME_OF_DAY = ('Night', 'Morning', 'Afternoon', 'Evening')
+
+# Season categories and the category code of each calendar month (January first)
+SEASON_SCHEMES = {
+    'india': (('Winter', 'Summer', 'Monsoon'), (0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 0)),
+    'meteorological': (('Winter', 'Spring', 'Summer', 'Autumn'), (0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0)),
+}
+
+# Night 22-05, Morning 06-11, Afternoon 12-17, Evening 18-21
+_TIME_OF_DAY_BY_HOUR = np.array([0] * 6 + [1] * 6 + [2] * 6 + [3] * 4 + [0] * 2, dtype=np.int8)
+
+_NS_PER_MINUTE = 60 * 10**9
+_NS_PER_HOUR = 60 * _NS_PER_MINUTE
+_NS_PER_DAY = 24 * _NS_PER_HOUR
+
+# Entries are a few bytes per row, so a handful of multi-year profiles fit comfortably
+_CACHE_SIZE = 16
+
+
+def _to_nanoseconds(timestamps) -> np.ndarray:
+    """int64 wall-clock nanoseconds; timezone-aware input is converted to local time"""
+    index = pd.DatetimeIndex(timestamps)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    if index.hasnans:
+        raise ValueError("Calendar features cannot be computed for missing timestamps")
+    return index.as_unit('ns').asi8 if hasattr(index, 'as_unit') else index.asi8
+
+
+def _compute(nanos: np.ndarray, fy_start_month: int) -> Dict[str, np.ndarray]:
+    values = nanos.view('M8[ns]')
+    days = values.astype('M8[D]')
+    months = values.astype('M8[M]')
+    years = values.astype('M8[Y]')
+
+    day_index = days.astype(np.int64)
+    year = years.astype(np.int64) + 1970
+    month = months.astype(np.int64) - (year - 1970) * 12 + 1
+    day = (days - months.astype('M8[D]')).astype(np.int64) + 1
+    dayofyear = (days - years.astype('M8[D]')).astype(np.int64) + 1
+    dayofweek = (day_index + 3) % 7  # 1970-01-01 was a Thursday; Monday=0
+
+    # ISO week: the week belongs to the year of its Thursday
+    thursday = (day_index - dayofweek + 3).astype('M8[D]')
+    week_of_year = (thursday - thursday.astype('M8[Y]').astype('M8[D]')).astype(np.int64) // 7 + 1
+
+    time_in_day = nanos - day_index * _NS_PER_DAY
+    hour = time_in_day // _NS_PER_HOUR
+    minute = (time_in_day // _NS_PER_MINUTE) % 60
+
+    fiscal_month = (month - fy_start_month) % 12 + 1
+
+    features = {
+        'year': year.astype(np.int16),
+        'month': month.astype(np.int8),
+        'day': day.astype(np.int8),
+        'hour': hour.astype(np.int8),
+        'minute': minute.astype(np.int8),
+        'dayofweek': dayofweek.astype(np.int8),
+        'dayofyear': dayofyear.astype(np.int16),
+        'week_of_year': week_of_year.astype(np.int8),
+        'is_weekend': dayofweek >= 5,
+        'fiscal_year': (year + (month >= fy_start_month)).astype(np.int16),
+        'fiscal_month': fiscal_month.astype(np.int8),
+        'fiscal_quarter': ((fiscal_month - 1) // 3 + 1).astype(np.int8),
+    }
+    for array in features.values():
+        array.setflags(write=False)
+    return features
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _regular_features(start: int, periods: int, step: int, fy_start_month: int) -> Dict[str, np.ndarray]:
+    nanos = start + step * np.arange(periods, dtype=np.int64)
+    return _compute(nanos, fy_start_month)
+
+
+def _regular_step(nanos: np.ndarray):
+    """Spacing in nanoseconds if the series is evenly spaced, else None"""
+    if len(nanos) < 2:
+        return 0
+    steps = np.diff(nanos)
+    step = int(steps[0])
+    if step > 0 and (steps == step).all():
+        return step
+    return None
+
+
+def calendar_features(timestamps, fy_start_month: int = DEFAULT_FY_START_MONTH) -> Dict[str, np.ndarray]:
+    """
+    Calendar features for a timestamp sequence
+
+    Args:
+        timestamps: Series, DatetimeIndex or array of datetimes without missing values
+        fy_start_month: First calendar month of the financial year (April by default)
+
+    Returns:
+        dict: year, month, day, hour, minute, dayofweek (Monday=0), dayofyear,
+        week_of_year (ISO), is_weekend, fiscal_year (named after the year it ends in),
+        fiscal_month (1 = fy_start_month) and fiscal_quarter, one array per feature
+    """
+    if not 1 <= int(fy_start_month) <= 12:
+        raise ValueError(f"fy_start_month must be between 1 and 12, got {fy_start_month}")
+
+    nanos = _to_nanoseconds(timestamps)
+    step = _regular_step(nanos)
+    if step is None or len(nanos) == 0:
+        features = _compute(nanos, int(fy_start_month))
+    else:
+        features = _regular_features(int(nanos[0]), len(nanos), step, int(fy_start_month))
+
+    # Cached arrays are shared and read-only; callers get their own copies to put in frames
+    return {name: array.copy() for name, array in features.items()}
+
+
+def season_categorical(month, scheme: str = 'india') -> pd.Categorical:
+    """Season of each calendar month as a categorical ('india' or 'meteorological' scheme)"""
+    categories, codes_by_month = SEASON_SCHEMES[scheme]
+    codes = np.asarray(codes_by_month, dtype=np.int8)[np.asarray(month, dtype=np.intp) - 1]
+    return pd.Categorical.from_codes(codes, categories=list(categories))
+
+
+def time_of_day_categorical(hour) -> pd.Categorical:
+    """Night/Morning/Afternoon/Evening of each hour as a categorical"""
+    codes = _TIME_OF_DAY_BY_HOUR[np.asarray(hour, dtype=np.intp)]
+    return pd.Categorical.from_codes(codes, categories=list(TIME_OF_DAY))
+
+
+def day_name_categorical(dayofweek) -> pd.Categorical:
+    """Monday..Sunday as a categorical"""
+    return pd.Categorical.from_codes(np.asarray(dayofweek, dtype=np.int8), categories=list(DAY_NAMES))
+
+
+def day_type_categorical(dayofweek) -> pd.Categorical:
+    """Weekday/Weekend as a categorical"""
+    codes = (np.asarray(dayofweek) >= 5).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=list(DAY_TYPES))
+
+
+def clear_calendar_cache() -> None:
+    """Drop cached feature arrays"""
+    _regular_features.cache_clear()
@@ -107,7 +107,18 @@ VALIDATION_RULES = {
     'MAX_WINDOW_SIZE': 50,
     'MAX_INDEPENDENT_VARS': 20,
     'MIN_YEAR': 1990,
-    'MAX_YEAR': 2100
+    'MAX_YEAR': 2100,
+    'MIN_FORECAST_WORKERS': 1,
+    'MAX_FORECAST_WORKERS': 32
+}
+
+# On-disk model caches, stored under <project>/results/<DIR_NAME>
+MODEL_CACHE = {
+    'DIR_NAME': 'cache',
+    'TIME_SERIES_SUBDIR': 'time_series_forecasts',
+    'TIME_SERIES_MAX_BYTES': 64 * 1024 * 1024,  # 64MB
+    'STL_SUBDIR': 'stl_decompositions',
+    'STL_MAX_BYTES': 256 * 1024 * 1024  # 256MB
 }
 
 # Default configuration - These should ideally be managed by app.config.py using Pydantic BaseSettings
@@ -804,6 +804,7 @@ from flask import current_app
 
 from utils.constants import UNIT_FACTORS, VALIDATION_RULES, ERROR_MESSAGES
 from utils.response_utils import handle_exception_response
+from app.utils.forecast_store import read_sector_sheet
 
 logger = logging.getLogger(__name__)
 
@@ -1013,23 +1014,28 @@ def get_forecast_data_for_sector(scenario_path, sector, from_year, to_year, unit
         # Construct file path
         file_path = os.path.join(scenario_path, f"{sector}.xlsx")
         
-        if not os.path.exists(file_path):
-            logger.debug(f"Sector file not found: {file_path}")
-            return None
-        
-        # FIXED: Try to read Results sheet first, then fallback
-        try:
-            df = pd.read_excel(file_path, sheet_name='Results')
-            logger.debug(f"Successfully read Results sheet from {file_path}")
-        except Exception as read_error:
-            logger.warning(f"Could not read Results sheet from {file_path}: {read_error}")
-            try:
-                # Try first sheet as fallback
-                df = pd.read_excel(file_path, sheet_name=0)
-                logger.debug(f"Used first sheet as fallback for {file_path}")
-            except Exception as fallback_error:
-                logger.error(f"Could not read any sheet from {file_path}: {fallback_error}")
+        # Prefer the columnar sidecar written by the forecast pipeline
+        df = read_sector_sheet(scenario_path, sector, 'Results')
+        if df is not None:
+            logger.debug(f"Read Results for {sector} from forecast sidecar")
+        else:
+            if not os.path.exists(file_path):
+                logger.debug(f"Sector file not found: {file_path}")
                 return None
+            
+            # FIXED: Try to read Results sheet first, then fallback
+            try:
+                df = pd.read_excel(file_path, sheet_name='Results')
+                logger.debug(f"Successfully read Results sheet from {file_path}")
+            except Exception as read_error:
+                logger.warning(f"Could not read Results sheet from {file_path}: {read_error}")
+                try:
+                    # Try first sheet as fallback
+                    df = pd.read_excel(file_path, sheet_name=0)
+                    logger.debug(f"Used first sheet as fallback for {file_path}")
+                except Exception as fallback_error:
+                    logger.error(f"Could not read any sheet from {file_path}: {fallback_error}")
+                    return None
         
         # Validate DataFrame structure
         if df.empty:
@@ -1083,6 +1089,63 @@ def get_forecast_data_for_sector(scenario_path, sector, from_year, to_year, unit
 
 # ========== T&D Losses Calculation ==========
 
+def _validated_td_loss_points(td_losses_points):
+    """
+    Clean T&D loss points into (years, first_losses, last_losses) arrays sorted by year.
+    A year given more than once has the first and the last of its points, in input order.
+    """
+    valid_points = []
+    for point in td_losses_points:
+        try:
+            year = int(safe_numeric_conversion(point.get('year', 0)))
+            loss_pct = safe_numeric_conversion(point.get('loss_percentage', 0))
+            
+            # Validate loss percentage is reasonable
+            if loss_pct < 0:
+                logger.warning(f"Negative loss percentage {loss_pct} for year {year}, setting to 0")
+                loss_pct = 0
+            elif loss_pct > 50:
+                logger.warning(f"Very high loss percentage {loss_pct} for year {year}")
+            
+            valid_points.append((year, loss_pct))
+            
+        except Exception as point_error:
+            logger.warning(f"Invalid T&D loss point {point}: {point_error}")
+    
+    # Stable sort keeps duplicate years in input order
+    valid_points.sort(key=lambda p: p[0])
+    point_years = np.array([p[0] for p in valid_points], dtype=float)
+    point_losses = np.array([p[1] for p in valid_points], dtype=float)
+    point_years, first_index, counts = np.unique(point_years, return_index=True, return_counts=True)
+    return point_years, point_losses[first_index], point_losses[first_index + counts - 1]
+
+def interpolate_td_losses_array(td_losses_points, years):
+    """
+    T&D loss percentage per year as an array aligned with years.
+    Linear between points, held constant before the first and after the last point.
+    For a year given more than once, the first point applies at that year and the last
+    one after it (and from the last year on), as in the original per-year loop.
+    """
+    year_array = np.asarray([int(year) for year in years], dtype=float)
+    if not td_losses_points or year_array.size == 0:
+        return np.zeros(year_array.size)
+    
+    point_years, first_losses, last_losses = _validated_td_loss_points(td_losses_points)
+    if point_years.size == 0:
+        logger.warning("No valid T&D losses points after validation")
+        return np.zeros(year_array.size)
+    
+    # Segment point_years[k] <= year < point_years[k + 1], from the last point of k to the first of k + 1
+    k = np.clip(np.searchsorted(point_years, year_array, side='right') - 1, 0, point_years.size - 1)
+    following = np.minimum(k + 1, point_years.size - 1)
+    span = point_years[following] - point_years[k]
+    weight = np.divide(year_array - point_years[k], span, out=np.zeros_like(year_array), where=span > 0)
+    losses = last_losses[k] + weight * (first_losses[following] - last_losses[k])
+    
+    losses = np.where(year_array == point_years[k], first_losses[k], losses)
+    losses = np.where(year_array >= point_years[-1], last_losses[-1], losses)
+    return np.where(year_array <= point_years[0], first_losses[0], losses)
+
 def interpolate_td_losses(td_losses_points, years):
     """
     FIXED: T&D losses interpolation with validation
@@ -1096,63 +1159,8 @@ def interpolate_td_losses(td_losses_points, years):
             logger.debug("No years provided for T&D losses interpolation")
             return {}
         
-        # Validate and clean points
-        valid_points = []
-        for point in td_losses_points:
-            try:
-                year = int(safe_numeric_conversion(point.get('year', 0)))
-                loss_pct = safe_numeric_conversion(point.get('loss_percentage', 0))
-                
-                # Validate loss percentage is reasonable
-                if loss_pct < 0:
-                    logger.warning(f"Negative loss percentage {loss_pct} for year {year}, setting to 0")
-                    loss_pct = 0
-                elif loss_pct > 50:
-                    logger.warning(f"Very high loss percentage {loss_pct} for year {year}")
-                
-                valid_points.append({'year': year, 'loss_percentage': loss_pct})
-                
-            except Exception as point_error:
-                logger.warning(f"Invalid T&D loss point {point}: {point_error}")
-        
-        if not valid_points:
-            logger.warning("No valid T&D losses points after validation")
-            return {year: 0.0 for year in years}
-        
-        # Sort points by year
-        sorted_points = sorted(valid_points, key=lambda x: x['year'])
-        interpolated = {}
-        
-        for year in years:
-            try:
-                year = int(year)
-                
-                if year <= sorted_points[0]['year']:
-                    # Before first point - use first value
-                    interpolated[year] = sorted_points[0]['loss_percentage']
-                elif year >= sorted_points[-1]['year']:
-                    # After last point - use last value
-                    interpolated[year] = sorted_points[-1]['loss_percentage']
-                else:
-                    # Linear interpolation between points
-                    for i in range(len(sorted_points) - 1):
-                        if sorted_points[i]['year'] <= year <= sorted_points[i + 1]['year']:
-                            prev_point = sorted_points[i]
-                            next_point = sorted_points[i + 1]
-                            
-                            # Linear interpolation formula
-                            year_diff = next_point['year'] - prev_point['year']
-                            if year_diff == 0:
-                                interpolated[year] = prev_point['loss_percentage']
-                            else:
-                                loss_diff = next_point['loss_percentage'] - prev_point['loss_percentage']
-                                weight = (year - prev_point['year']) / year_diff
-                                interpolated[year] = prev_point['loss_percentage'] + (weight * loss_diff)
-                            break
-            
-            except Exception as year_error:
-                logger.warning(f"Error interpolating T&D losses for year {year}: {year_error}")
-                interpolated[year] = 0.0
+        losses = interpolate_td_losses_array(td_losses_points, years)
+        interpolated = {int(year): float(loss) for year, loss in zip(years, losses)}
         
         logger.debug(f"Interpolated T&D losses for {len(interpolated)} years")
         return interpolated
@@ -1163,6 +1171,119 @@ def interpolate_td_losses(td_losses_points, years):
 
 # ========== Consolidated Demand Calculation ==========
 
+def _numeric_demand_values(series):
+    """Finite float array for a demand column; unparseable, NaN and infinite values become 0"""
+    if pd.api.types.is_numeric_dtype(series):
+        # copy=True: with copy-on-write the array may be a read-only view of the column
+        values = series.to_numpy(dtype=float, na_value=np.nan, copy=True)
+    else:
+        values = series.map(lambda value: safe_numeric_conversion(value, 0)).to_numpy(dtype=float)
+    values[~np.isfinite(values)] = 0.0
+    return values
+
+def _load_sector_demand_matrix(scenario_path, sector_models, from_year, to_year, years):
+    """
+    Year x sector matrix of the selected model's demand (kWh), aligned on years.
+    Sectors without data for their model get a zero column.
+
+    Returns:
+        tuple: (matrix, successful_sectors, failed_sectors)
+    """
+    matrix = np.zeros((len(years), len(sector_models)))
+    successful_sectors = []
+    failed_sectors = []
+    
+    for col_idx, (sector, selected_model) in enumerate(sector_models.items()):
+        logger.debug(f"Processing sector {sector} with model {selected_model}")
+        
+        try:
+            # FIXED: Use get_forecast_data_for_sector which handles Results sheet
+            sector_df = get_forecast_data_for_sector(
+                scenario_path, sector, from_year, to_year, 'kWh'
+            )
+            
+            if sector_df is not None and selected_model in sector_df.columns:
+                # Last row wins for repeated years; missing years are 0
+                demand = pd.Series(
+                    _numeric_demand_values(sector_df[selected_model]),
+                    index=sector_df['Year'].astype(int).to_numpy()
+                )
+                demand = demand[~demand.index.duplicated(keep='last')]
+                matrix[:, col_idx] = demand.reindex(years, fill_value=0.0).to_numpy()
+                successful_sectors.append(sector)
+                logger.debug(f"Successfully processed sector {sector}")
+                
+            else:
+                # No data available for this sector/model combination
+                logger.warning(f"No data available for sector {sector} with model {selected_model}")
+                failed_sectors.append(sector)
+                
+        except Exception as sector_error:
+            logger.error(f"Error processing sector {sector}: {sector_error}")
+            matrix[:, col_idx] = 0.0
+            failed_sectors.append(sector)
+    
+    return matrix, successful_sectors, failed_sectors
+
+def _apply_td_losses(gross_demand, loss_percentages):
+    """
+    On-grid demand and T&D losses from gross demand, element-wise for any array shape.
+
+    gross_demand = on_grid_demand * (1 - loss_fraction), so
+    on_grid_demand = gross_demand / (1 - loss_fraction). Years whose loss fraction
+    is outside [0, 1) keep on-grid = gross and zero losses. Both results are clipped at 0.
+    """
+    loss_fraction = np.asarray(loss_percentages, dtype=float) / 100
+    valid = (loss_fraction >= 0) & (loss_fraction < 1)
+    if not valid.all():
+        logger.warning(f"Invalid loss fractions {np.unique(loss_fraction[~valid]).tolist()} ignored")
+    
+    divisor = np.where(valid, 1 - loss_fraction, 1.0)
+    on_grid_demand = gross_demand / divisor
+    td_losses = np.where(valid, on_grid_demand - gross_demand, 0.0)
+    return np.maximum(td_losses, 0.0), np.maximum(on_grid_demand, 0.0)
+
+def _consolidated_frame(years, sectors, sector_matrix, td_losses, total_on_grid):
+    """Consolidated demand DataFrame with non-negative, finite values"""
+    result_df = pd.DataFrame(np.maximum(np.nan_to_num(sector_matrix, nan=0.0, posinf=0.0, neginf=0.0), 0.0),
+                             columns=list(sectors))
+    result_df.insert(0, 'Year', years)
+    result_df['T&D_Losses'] = np.nan_to_num(td_losses, nan=0.0, posinf=0.0, neginf=0.0)
+    result_df['Total_On_Grid_Demand'] = np.nan_to_num(total_on_grid, nan=0.0, posinf=0.0, neginf=0.0)
+    return result_df
+
+def _fallback_consolidated_frame(sector_models, year_range):
+    """Zero-filled consolidated frame returned when the calculation fails"""
+    try:
+        from_year = year_range.get('from', 2025)
+        to_year = year_range.get('to', 2037)
+        years = list(range(from_year, to_year + 1))
+        
+        fallback_data = {'Year': years}
+        for sector in sector_models.keys():
+            fallback_data[sector] = [0] * len(years)
+        fallback_data['T&D_Losses'] = [0] * len(years)
+        fallback_data['Total_On_Grid_Demand'] = [0] * len(years)
+        
+        return pd.DataFrame(fallback_data)
+        
+    except Exception as fallback_error:
+        logger.exception(f"Error creating fallback DataFrame: {fallback_error}")
+        return pd.DataFrame()
+
+def _resolve_consolidation_years(year_range):
+    if not year_range or 'from' not in year_range or 'to' not in year_range:
+        raise ValueError("Invalid year range specification")
+    
+    from_year, to_year, year_warnings = validate_year_range(
+        year_range['from'], year_range['to']
+    )
+    
+    for warning in year_warnings:
+        logger.warning(f"Year range validation: {warning}")
+    
+    return from_year, to_year, list(range(from_year, to_year + 1))
+
 def calculate_consolidated_demand(scenario_path, sector_models, td_losses_data, year_range):
     """
     FIXED: consolidated demand calculation with comprehensive error handling and Results sheet reading
@@ -1177,114 +1298,37 @@ def calculate_consolidated_demand(scenario_path, sector_models, td_losses_data,
         if not sector_models:
             raise ValueError("No sector models provided")
         
-        if not year_range or 'from' not in year_range or 'to' not in year_range:
-            raise ValueError("Invalid year range specification")
-        
-        from_year, to_year, year_warnings = validate_year_range(
-            year_range['from'], year_range['to']
-        )
-        
-        for warning in year_warnings:
-            logger.warning(f"Year range validation: {warning}")
-        
-        years = list(range(from_year, to_year + 1))
-        consolidated_data = {'Year': years}
+        from_year, to_year, years = _resolve_consolidation_years(year_range)
         
         # Load data for each sector using selected model
-        gross_demand_by_year = {year: 0.0 for year in years}
-        successful_sectors = []
-        failed_sectors = []
-        
-        for sector, selected_model in sector_models.items():
-            logger.debug(f"Processing sector {sector} with model {selected_model}")
-            
-            try:
-                # FIXED: Use get_forecast_data_for_sector which handles Results sheet
-                sector_df = get_forecast_data_for_sector(
-                    scenario_path, sector, from_year, to_year, 'kWh'
-                )
-                
-                if sector_df is not None and selected_model in sector_df.columns:
-                    # Create mapping of year to demand
-                    year_to_demand = {}
-                    for _, row in sector_df.iterrows():
-                        year = int(row['Year'])
-                        demand = safe_numeric_conversion(row[selected_model], 0)
-                        year_to_demand[year] = demand
-                    
-                    sector_demands = []
-                    for year in years:
-                        demand = year_to_demand.get(year, 0)
-                        sector_demands.append(demand)
-                        gross_demand_by_year[year] += demand
-                    
-                    consolidated_data[sector] = sector_demands
-                    successful_sectors.append(sector)
-                    logger.debug(f"Successfully processed sector {sector}")
-                    
-                else:
-                    # No data available for this sector/model combination
-                    logger.warning(f"No data available for sector {sector} with model {selected_model}")
-                    consolidated_data[sector] = [0] * len(years)
-                    failed_sectors.append(sector)
-                    
-            except Exception as sector_error:
-                logger.error(f"Error processing sector {sector}: {sector_error}")
-                consolidated_data[sector] = [0] * len(years)
-                failed_sectors.append(sector)
+        sector_matrix, successful_sectors, failed_sectors = _load_sector_demand_matrix(
+            scenario_path, sector_models, from_year, to_year, years
+        )
         
         # Log processing results
         logger.info(f"Sector processing: {len(successful_sectors)} successful, {len(failed_sectors)} failed")
         if failed_sectors:
             logger.warning(f"Failed sectors: {failed_sectors}")
         
+        gross_demand = sector_matrix.sum(axis=1)
+        
         # Calculate T&D losses and total on-grid demand
         try:
-            interpolated_losses = interpolate_td_losses(td_losses_data, years)
-            
-            td_losses = []
-            total_on_grid = []
-            
-            for year in years:
-                gross_demand = gross_demand_by_year[year]
-                loss_percentage = interpolated_losses.get(year, 0)
-                loss_fraction = loss_percentage / 100
-                
-                # Calculate on-grid demand: gross_demand = on_grid_demand * (1 - loss_fraction)
-                # Therefore: on_grid_demand = gross_demand / (1 - loss_fraction)
-                if loss_fraction < 1 and loss_fraction >= 0:  # Avoid division by zero and negative losses
-                    on_grid_demand = gross_demand / (1 - loss_fraction)
-                    td_loss = on_grid_demand - gross_demand
-                else:
-                    logger.warning(f"Invalid loss fraction {loss_fraction} for year {year}")
-                    on_grid_demand = gross_demand
-                    td_loss = 0
-                
-                td_losses.append(max(0, td_loss))  # Ensure non-negative
-                total_on_grid.append(max(0, on_grid_demand))  # Ensure non-negative
-            
-            consolidated_data['T&D_Losses'] = td_losses
-            consolidated_data['Total_On_Grid_Demand'] = total_on_grid
-            
+            td_losses, total_on_grid = _apply_td_losses(
+                gross_demand, interpolate_td_losses_array(td_losses_data, years)
+            )
         except Exception as td_error:
             logger.exception(f"Error calculating T&D losses: {td_error}")
             # Add zero losses as fallback
-            consolidated_data['T&D_Losses'] = [0] * len(years)
-            consolidated_data['Total_On_Grid_Demand'] = [gross_demand_by_year[year] for year in years]
+            td_losses, total_on_grid = np.zeros(len(years)), np.maximum(gross_demand, 0.0)
         
-        # Create DataFrame
-        result_df = pd.DataFrame(consolidated_data)
+        result_df = _consolidated_frame(years, sector_models.keys(), sector_matrix, td_losses, total_on_grid)
         
         # Validate result
         if result_df.empty:
             logger.error("Consolidated demand calculation resulted in empty DataFrame")
             raise ValueError("Consolidated demand calculation failed")
         
-        # Apply final validation and cleaning
-        for col in result_df.columns:
-            if col != 'Year':
-                result_df[col] = result_df[col].apply(lambda x: max(0, safe_numeric_conversion(x, 0)))
-        
         logger.info(f"Successfully calculated consolidated demand for {len(years)} years")
         return result_df
         
@@ -1292,22 +1336,71 @@ def calculate_consolidated_demand(scenario_path, sector_models, td_losses_data,
         logger.exception(f"Error calculating consolidated demand: {e}")
         
         # Return safe fallback DataFrame
-        try:
-            from_year = year_range.get('from', 2025)
-            to_year = year_range.get('to', 2037)
-            years = list(range(from_year, to_year + 1))
-            
-            fallback_data = {'Year': years}
-            for sector in sector_models.keys():
-                fallback_data[sector] = [0] * len(years)
-            fallback_data['T&D_Losses'] = [0] * len(years)
-            fallback_data['Total_On_Grid_Demand'] = [0] * len(years)
-            
-            return pd.DataFrame(fallback_data)
-            
-        except Exception as fallback_error:
-            logger.exception(f"Error creating fallback DataFrame: {fallback_error}")
-            return pd.DataFrame()
+        return _fallback_consolidated_frame(sector_models, year_range)
+
+def calculate_consolidated_demand_for_scenarios(scenarios, td_losses_data, year_range):
+    """
+    Consolidate several scenarios in one call, e.g. for scenario comparison.
+
+    Args:
+        scenarios: {scenario_name: {'scenario_path': str, 'sector_models': {sector: model},
+                    'td_losses': optional points overriding td_losses_data}}
+        td_losses_data: T&D loss points shared by scenarios without their own
+        year_range: {'from': year, 'to': year} applied to every scenario
+
+    Returns:
+        dict: scenario_name -> consolidated DataFrame (same layout as calculate_consolidated_demand)
+    """
+    logger.info(f"Calculating consolidated demand for {len(scenarios)} scenarios")
+    
+    try:
+        from_year, to_year, years = _resolve_consolidation_years(year_range)
+    except Exception as e:
+        logger.exception(f"Error calculating consolidated demand: {e}")
+        return {name: _fallback_consolidated_frame(spec.get('sector_models') or {}, year_range)
+                for name, spec in scenarios.items()}
+    
+    results = {}
+    loaded = []
+    for scenario_name, spec in scenarios.items():
+        scenario_path = spec.get('scenario_path')
+        sector_models = spec.get('sector_models') or {}
+        if not scenario_path or not os.path.exists(scenario_path) or not sector_models:
+            logger.error(f"Invalid scenario '{scenario_name}': missing path or sector models")
+            results[scenario_name] = _fallback_consolidated_frame(sector_models, year_range)
+            continue
+        
+        sector_matrix, successful_sectors, failed_sectors = _load_sector_demand_matrix(
+            scenario_path, sector_models, from_year, to_year, years
+        )
+        logger.info(f"Scenario '{scenario_name}': {len(successful_sectors)} sectors successful, "
+                    f"{len(failed_sectors)} failed")
+        loaded.append((scenario_name, sector_models, sector_matrix))
+    
+    if not loaded:
+        return results
+    
+    # Scenario x year arrays, so losses for all scenarios are applied in one operation
+    shared_losses = None
+    loss_rows = []
+    for scenario_name, _, _ in loaded:
+        own_losses = scenarios[scenario_name].get('td_losses')
+        if own_losses is not None:
+            loss_rows.append(interpolate_td_losses_array(own_losses, years))
+        else:
+            if shared_losses is None:
+                shared_losses = interpolate_td_losses_array(td_losses_data, years)
+            loss_rows.append(shared_losses)
+    
+    gross_demand = np.vstack([matrix.sum(axis=1) for _, _, matrix in loaded])
+    td_losses, total_on_grid = _apply_td_losses(gross_demand, np.vstack(loss_rows))
+    
+    for row, (scenario_name, sector_models, sector_matrix) in enumerate(loaded):
+        results[scenario_name] = _consolidated_frame(
+            years, sector_models.keys(), sector_matrix, td_losses[row], total_on_grid[row]
+        )
+    
+    return results
 
 # ========== Workflow Management ==========
 
@@ -0,0 +1,123 @@
+# app/utils/forecast_store.py
+"""
+Columnar sidecar store for sector forecast results.
+
+Next to each {scenario}/{sector}.xlsx the forecast pipeline writes one Parquet
+file per sheet under {scenario}/_store/{sector}/. Readers load the sidecar and
+only fall back to openpyxl parsing of the workbook when no fresh sidecar exists
+(older scenarios, pyarrow not installed, workbook edited by hand afterwards).
+"""
+import os
+import shutil
+import logging
+from typing import Dict, Optional
+
+import pandas as pd
+
+from app.utils.constants import REQUIRED_SHEETS
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+    logger.info("pyarrow not available - forecast results are stored as Excel only")
+
+STORE_DIR_NAME = '_store'
+
+# Workbook sheets mirrored into the sidecar store
+SIDECAR_SHEETS = (
+    REQUIRED_SHEETS['INPUTS'],
+    REQUIRED_SHEETS['RESULTS'],
+    REQUIRED_SHEETS['CORRELATIONS'],
+    REQUIRED_SHEETS['INDEPENDENT_PARAMS'],
+    REQUIRED_SHEETS['TEST_RESULTS']
+)
+
+
+def _sheet_file_name(sheet_name: str) -> str:
+    return sheet_name.lower().replace(' ', '_') + '.parquet'
+
+
+def get_sector_store_dir(scenario_path: str, sector: str) -> str:
+    """Directory holding the sidecar files of one sector"""
+    return os.path.join(scenario_path, STORE_DIR_NAME, sector)
+
+
+def write_sector_sidecar(scenario_path: str, sector: str, sheets: Dict[str, pd.DataFrame]) -> bool:
+    """
+    Write the sheets of a sector workbook as Parquet files.
+
+    Must be called after the workbook itself is written, so the sidecar is never
+    older than the workbook it mirrors. Sheets that cannot be stored are skipped
+    and readers fall back to Excel for them.
+
+    Returns:
+        bool: True if at least the Results sheet was stored
+    """
+    if not PARQUET_AVAILABLE:
+        return False
+
+    store_dir = get_sector_store_dir(scenario_path, sector)
+    try:
+        # Drop sheets left over from a previous run of this sector
+        if os.path.isdir(store_dir):
+            shutil.rmtree(store_dir)
+        os.makedirs(store_dir, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not prepare forecast store for {sector}: {e}")
+        return False
+
+    for sheet_name, df in sheets.items():
+        if sheet_name not in SIDECAR_SHEETS or not isinstance(df, pd.DataFrame) or df.empty:
+            continue
+
+        target_path = os.path.join(store_dir, _sheet_file_name(sheet_name))
+        tmp_path = target_path + '.tmp'
+        try:
+            frame = df.copy()
+            frame.columns = [str(col) for col in frame.columns]
+            frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, target_path)
+        except Exception as e:
+            logger.warning(f"Could not store sheet '{sheet_name}' of {sector} as Parquet: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    stored = os.path.exists(os.path.join(store_dir, _sheet_file_name(REQUIRED_SHEETS['RESULTS'])))
+    if stored:
+        logger.debug(f"Stored forecast sidecar for {sector} in {store_dir}")
+    return stored
+
+
+def read_sector_sheet(scenario_path: str, sector: str,
+                      sheet_name: str = REQUIRED_SHEETS['RESULTS']) -> Optional[pd.DataFrame]:
+    """
+    Read one sheet of a sector forecast from the sidecar store.
+
+    Returns:
+        pd.DataFrame or None: None if there is no sidecar for the sheet, the
+        workbook no longer exists or it has been modified since the sidecar was written
+    """
+    if not PARQUET_AVAILABLE:
+        return None
+
+    sidecar_path = os.path.join(get_sector_store_dir(scenario_path, sector), _sheet_file_name(sheet_name))
+    if not os.path.exists(sidecar_path):
+        return None
+
+    workbook_path = os.path.join(scenario_path, f"{sector}.xlsx")
+    if not os.path.exists(workbook_path):
+        logger.debug(f"Forecast workbook for {sector} was removed, ignoring its sidecar")
+        return None
+
+    try:
+        if os.path.getmtime(workbook_path) > os.path.getmtime(sidecar_path):
+            logger.debug(f"Forecast sidecar for {sector} is older than its workbook, ignoring it")
+            return None
+        return pd.read_parquet(sidecar_path)
+    except Exception as e:
+        logger.warning(f"Could not read forecast sidecar {sidecar_path}: {e}")
+        return None
@@ -359,6 +359,24 @@ async def copy_missing_templates(project_path: Union[Path, str], missing_templat
     return {'success': is_operation_success, 'copied': copied_list, 'failed': failed_list, 'message': message}
 
 
+def _marker_mask(df: pd.DataFrame, marker: str) -> np.ndarray:
+    """Boolean (rows, cols) mask of string cells starting with `marker`, built column-wise."""
+    mask = np.zeros(df.shape, dtype=bool)
+    for c_idx_pos, dtype in enumerate(df.dtypes):
+        # Numeric and datetime columns cannot hold marker strings
+        if not (dtype == object or pd.api.types.is_string_dtype(dtype)):
+            continue
+        try:
+            mask[:, c_idx_pos] = df.iloc[:, c_idx_pos].str.startswith(marker, na=False).to_numpy(dtype=bool)
+        except AttributeError: # Object column without any strings
+            continue
+    return mask
+
+def _first_false(flags: np.ndarray, offset: int) -> int:
+    """Absolute position of the first False in `flags`, or offset + len(flags) if there is none."""
+    gaps = np.flatnonzero(~flags)
+    return offset + (int(gaps[0]) if gaps.size else len(flags))
+
 def find_special_symbols(df: pd.DataFrame, marker: str) -> List[Tuple[int, int, str]]:
     """
     Finds cells in a DataFrame that start with a specific marker string.
@@ -376,16 +394,18 @@ def find_special_symbols(df: pd.DataFrame, marker: str) -> List[Tuple[int, int,
     """
     markers_found = []
     try:
-        for r_idx, row_series in df.iterrows(): # r_idx is the DataFrame index label
-            for c_idx_pos, cell_value in enumerate(row_series.values): # c_idx_pos is integer position
-                if isinstance(cell_value, str) and cell_value.startswith(marker):
-                    content_after_marker = cell_value[len(marker):].strip()
-                    markers_found.append((r_idx, c_idx_pos, content_after_marker))
+        # Row-major order, same as scanning row by row
+        r_positions, c_positions = np.nonzero(_marker_mask(df, marker))
+        for r_pos, c_idx_pos in zip(r_positions, c_positions):
+            cell_value = df.iat[r_pos, c_idx_pos]
+            content_after_marker = cell_value[len(marker):].strip()
+            markers_found.append((df.index[r_pos], int(c_idx_pos), content_after_marker)) # Index label, integer position
     except Exception as e:
         logger.error(f"Error finding special symbols ('{marker}') in DataFrame: {e}", exc_info=True)
     return markers_found
 
-def extract_table(df: pd.DataFrame, header_row_idx: int, data_start_col_idx: int) -> pd.DataFrame:
+def extract_table(df: pd.DataFrame, header_row_idx: int, data_start_col_idx: int,
+                  notnull: Optional[np.ndarray] = None) -> pd.DataFrame:
     """
     Extracts a table from a DataFrame. The table is defined by a header row
     and data starting from a specific column in the row immediately below the header.
@@ -396,6 +416,7 @@ def extract_table(df: pd.DataFrame, header_row_idx: int, data_start_col_idx: int
         df (pd.DataFrame): The DataFrame containing the table.
         header_row_idx (int): The 0-indexed integer row index where the table's header is located.
         data_start_col_idx (int): The 0-indexed integer column index where the table's data (and header) begins.
+        notnull (Optional[np.ndarray]): Precomputed df.notna() array, shared when extracting several tables.
 
     Returns:
         pd.DataFrame: The extracted table with headers set from the specified header_row_idx.
@@ -411,15 +432,14 @@ def extract_table(df: pd.DataFrame, header_row_idx: int, data_start_col_idx: int
             logger.warning(f"No data rows available below header at row {header_row_idx}.")
             return pd.DataFrame()
 
+        if notnull is None:
+            notnull = df.notna().to_numpy()
+
         # Determine end_row for data: first row where the data_start_col_idx is null/empty
-        end_row_data = data_start_row_idx
-        while end_row_data < len(df) and pd.notnull(df.iloc[end_row_data, data_start_col_idx]):
-            end_row_data += 1
+        end_row_data = _first_false(notnull[data_start_row_idx:, data_start_col_idx], data_start_row_idx)
 
         # Determine end_col for header/data: first col in header_row_idx where value is null/empty
-        end_col_data = data_start_col_idx
-        while end_col_data < len(df.columns) and pd.notnull(df.iloc[header_row_idx, end_col_data]):
-            end_col_data += 1
+        end_col_data = _first_false(notnull[header_row_idx, data_start_col_idx:], data_start_col_idx)
 
         if data_start_row_idx >= end_row_data or data_start_col_idx >= end_col_data:
             logger.warning(f"Table dimensions are invalid or no data found for table starting with header at ({header_row_idx},{data_start_col_idx}).")
@@ -453,6 +473,7 @@ def extract_tables_by_markers(df: pd.DataFrame, marker_prefix: str) -> Dict[str,
     """
     marker_positions = find_special_symbols(df, marker_prefix) # List of (row_idx, col_idx_pos, table_name)
     extracted_tables = {}
+    notnull = df.notna().to_numpy() if marker_positions else None
     for r_marker_idx, c_marker_idx_pos, table_name in marker_positions:
         if not table_name: # Skip if marker has no name after it
             logger.warning(f"Marker '{marker_prefix}' found at ({r_marker_idx},{c_marker_idx_pos}) but no table name provided. Skipping.")
@@ -464,7 +485,7 @@ def extract_tables_by_markers(df: pd.DataFrame, marker_prefix: str) -> Dict[str,
         logger.info(f"Attempting to extract table '{table_name}' marked at df index {r_marker_idx}, column position {c_marker_idx_pos}. Expecting header at row index {header_row_for_table}.")
 
         try:
-            table_df = extract_table(df, header_row_for_table, data_col_for_table)
+            table_df = extract_table(df, header_row_for_table, data_col_for_table, notnull=notnull)
             if not table_df.empty:
                 extracted_tables[table_name] = table_df
                 logger.info(f"Successfully extracted table '{table_name}' with {len(table_df)} rows and {len(table_df.columns)} columns.")
@@ -0,0 +1,242 @@
+# app/utils/input_snapshot.py
+"""
+Persistent parsed-input snapshot for the demand input workbook.
+
+input_demand_data turns inputs/input_demand_file.xlsx into
+(sectors, missing_sectors, param_dict, sector_data, aggregated_ele). Parsing
+the workbook takes seconds; this module stores that tuple as Parquet frames
+plus a JSON manifest in inputs/.input_demand_file_snapshot/ so every worker
+process and every restart can load it in milliseconds.
+
+The snapshot is valid while the workbook's size and mtime match the manifest.
+If only the mtime changed (file copied or touched) the content hash decides.
+"""
+import os
+import json
+import uuid
+import hashlib
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+    logger.info("pyarrow not available - input snapshots disabled")
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+
+def get_snapshot_dir(input_file_path: str) -> str:
+    """Snapshot directory stored next to the input workbook"""
+    base_name = os.path.splitext(os.path.basename(input_file_path))[0]
+    return os.path.join(os.path.dirname(input_file_path), f'.{base_name}_snapshot')
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 of a file read in 1 MiB chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def json_default(value):
+    """Keep numpy scalars numeric in the manifest"""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def read_source_identity(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Size, mtime and content hash of a workbook, to be taken before it is parsed.
+
+    Returns None if the file cannot be read or changed while it was being hashed.
+    """
+    try:
+        before = os.stat(file_path)
+        source_hash = file_sha256(file_path)
+        after = os.stat(file_path)
+    except OSError as e:
+        logger.debug(f"Could not read source identity of {file_path}: {e}")
+        return None
+    if (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns):
+        return None
+    return {'size': before.st_size, 'mtime_ns': before.st_mtime_ns, 'sha256': source_hash}
+
+
+def source_unchanged(file_path: str, source: Optional[Dict[str, Any]]) -> bool:
+    """True if the file still has the size and mtime recorded in source"""
+    if source is None:
+        return False
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return False
+    return stat.st_size == source['size'] and stat.st_mtime_ns == source['mtime_ns']
+
+
+def check_frame(df: pd.DataFrame, label: str):
+    """Parquet needs string column names; refuse frames that would not round-trip"""
+    if not all(isinstance(col, str) for col in df.columns):
+        raise ValueError(f"{label} has non-string column names")
+
+
+def save_input_snapshot(input_file_path: str, data: Tuple, source: Optional[Dict[str, Any]]) -> bool:
+    """
+    Store the parsed input tuple next to the workbook.
+
+    Frames are written under a new generation prefix and the manifest is swapped
+    in atomically, so readers never see a half-written snapshot. source is the
+    read_source_identity of the workbook taken before it was parsed; nothing is
+    written if the workbook has changed since, so a snapshot never pairs old
+    frames with a newer file's identity.
+
+    Returns:
+        bool: True if the snapshot was written
+    """
+    if not PARQUET_AVAILABLE:
+        return False
+
+    if not source_unchanged(input_file_path, source):
+        logger.info(f"Input workbook {input_file_path} changed while it was parsed, snapshot not written")
+        return False
+
+    sectors, missing_sectors, param_dict, sector_data, aggregated_ele = data
+    snapshot_dir = get_snapshot_dir(input_file_path)
+    generation = uuid.uuid4().hex[:12]
+
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+
+        # Sector names can contain characters that are unsafe in file names
+        sector_files = {}
+        for index, (sector, df) in enumerate(sector_data.items()):
+            check_frame(df, f"Sector '{sector}'")
+            file_name = f'{generation}_sector_{index:03d}.parquet'
+            df.to_parquet(os.path.join(snapshot_dir, file_name), index=False)
+            sector_files[sector] = file_name
+
+        aggregated_file = None
+        if isinstance(aggregated_ele, pd.DataFrame) and not aggregated_ele.empty:
+            check_frame(aggregated_ele, 'Aggregated electricity')
+            aggregated_file = f'{generation}_aggregated.parquet'
+            aggregated_ele.to_parquet(os.path.join(snapshot_dir, aggregated_file), index=False)
+
+        manifest = {
+            'format_version': SNAPSHOT_FORMAT_VERSION,
+            'generation': generation,
+            'source': dict(source),
+            'sectors': list(sectors),
+            'missing_sectors': list(missing_sectors),
+            'param_dict': param_dict,
+            'sector_files': sector_files,
+            'aggregated_file': aggregated_file
+        }
+
+        # The workbook may have been replaced while the frames were written
+        if not source_unchanged(input_file_path, source):
+            logger.info(f"Input workbook {input_file_path} changed while its snapshot was written, snapshot discarded")
+            remove_generation_files(snapshot_dir, keep=None, only=generation)
+            return False
+
+        tmp_manifest = os.path.join(snapshot_dir, f'{MANIFEST_NAME}.{generation}.tmp')
+        with open(tmp_manifest, 'w') as f:
+            json.dump(manifest, f, default=json_default)
+        os.replace(tmp_manifest, os.path.join(snapshot_dir, MANIFEST_NAME))
+    except Exception as e:
+        logger.warning(f"Could not write input snapshot for {input_file_path}: {e}")
+        remove_generation_files(snapshot_dir, keep=None, only=generation)
+        return False
+
+    remove_generation_files(snapshot_dir, keep=generation)
+    logger.info(f"Saved input snapshot for {input_file_path} ({len(sector_files)} sectors)")
+    return True
+
+
+def load_input_snapshot(input_file_path: str) -> Optional[Tuple]:
+    """
+    Load the parsed input tuple if a snapshot matching the workbook exists.
+
+    Returns:
+        tuple or None: (sectors, missing_sectors, param_dict, sector_data, aggregated_ele)
+    """
+    if not PARQUET_AVAILABLE:
+        return None
+
+    snapshot_dir = get_snapshot_dir(input_file_path)
+    manifest_path = os.path.join(snapshot_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest_path) or not os.path.exists(input_file_path):
+        return None
+
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+
+        if manifest.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+            return None
+        if not source_matches(input_file_path, manifest, manifest_path):
+            return None
+
+        sector_data = {
+            sector: pd.read_parquet(os.path.join(snapshot_dir, file_name))
+            for sector, file_name in manifest['sector_files'].items()
+        }
+        aggregated_file = manifest.get('aggregated_file')
+        aggregated_ele = (
+            pd.read_parquet(os.path.join(snapshot_dir, aggregated_file)) if aggregated_file else pd.DataFrame()
+        )
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable input snapshot in {snapshot_dir}: {e}")
+        return None
+
+    logger.debug(f"Loaded input snapshot for {input_file_path}")
+    return (manifest['sectors'], manifest['missing_sectors'], manifest['param_dict'],
+            sector_data, aggregated_ele)
+
+
+def source_matches(input_file_path: str, manifest: Dict[str, Any], manifest_path: str) -> bool:
+    """Compare the workbook with the manifest by size and mtime, falling back to the content hash"""
+    source = manifest.get('source', {})
+    stat = os.stat(input_file_path)
+    if stat.st_size != source.get('size'):
+        return False
+    if stat.st_mtime_ns == source.get('mtime_ns'):
+        return True
+    if file_sha256(input_file_path) != source.get('sha256'):
+        return False
+
+    # Same content with a new mtime: refresh the manifest so the hash is not recomputed every load
+    try:
+        manifest['source']['mtime_ns'] = stat.st_mtime_ns
+        tmp_manifest = f'{manifest_path}.{uuid.uuid4().hex[:12]}.tmp'
+        with open(tmp_manifest, 'w') as f:
+            json.dump(manifest, f, default=json_default)
+        os.replace(tmp_manifest, manifest_path)
+    except OSError as e:
+        logger.debug(f"Could not refresh input snapshot manifest: {e}")
+    return True
+
+
+def remove_generation_files(snapshot_dir: str, keep: Optional[str], only: Optional[str] = None):
+    """Delete frame files of other (or one specific) snapshot generations"""
+    if not os.path.isdir(snapshot_dir):
+        return
+    for name in os.listdir(snapshot_dir):
+        if name == MANIFEST_NAME or name.endswith('.tmp'):
+            continue
+        generation = name.split('_', 1)[0]
+        if (only is not None and generation == only) or (only is None and generation != keep):
+            try:
+                os.remove(os.path.join(snapshot_dir, name))
+            except OSError:
+                pass
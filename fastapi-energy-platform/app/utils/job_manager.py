@@ -11,7 +11,7 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from collections import defaultdict
 
-from utils.constants import JOB_STATUS, MAX_JOB_RUNTIME, CLEANUP_INTERVAL
+from app.utils.constants import JOB_STATUS, MAX_JOB_RUNTIME, CLEANUP_INTERVAL
 
 logger = logging.getLogger(__name__)
 
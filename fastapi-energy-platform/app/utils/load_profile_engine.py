@@ -13,6 +13,8 @@ from abc import ABC, abstractmethod
 import warnings
 from pathlib import Path
 
+from app.utils.calendar_features import calendar_features, season_categorical, time_of_day_categorical
+
 warnings.filterwarnings('ignore', category=FutureWarning)
 logger = logging.getLogger(__name__)
 
@@ -88,6 +90,9 @@ class LoadShiftRule:
 class DataFlowAgent:
     """ agent for data ingestion, validation, and preparation"""
     
+    # Longest run of missing rows filled by linear interpolation
+    LINEAR_GAP_LIMIT = 6
+    
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
         self.inputs_folder = self.project_path / 'inputs'
@@ -110,8 +115,8 @@ class DataFlowAgent:
         else:
             return self._load_excel_totals(config)
     
-    def prepare_base_year_data(self, df: pd.DataFrame, config: LoadProfileConfig) -> pd.DataFrame:
-        """Prepare base year data withprocessing"""
+    def prepare_base_year_data(self, df: pd.DataFrame, config: LoadProfileConfig) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Prepare base year data withprocessing; also returns the gap statistics of the demand column"""
         logger.info(f"Preparing base year data for FY {config.base_year}")
         
         # Add comprehensive time features
@@ -128,13 +133,15 @@ class DataFlowAgent:
         
         # Handle missing values with pattern-aware interpolation
         if config.interpolate_missing_data:
-            base_data = self._intelligent_interpolation(base_data)
+            base_data, gap_statistics = self._intelligent_interpolation(base_data)
+        else:
+            gap_statistics = self._gap_statistics(base_data['demand'].isna().to_numpy())
         
         # Validate completeness
         self._validate_base_year_completeness(base_data, config)
         
         logger.info(f"Prepared {len(base_data)} records for base year {config.base_year}")
-        return base_data
+        return base_data, gap_statistics
 
 
     def _find_specific_column(self, df: pd.DataFrame, keywords: List[str], exclude: List[str] = None) -> Optional[str]:
@@ -218,7 +225,7 @@ class DataFlowAgent:
         try:
             df[datetime_col_name_in_df] = pd.to_datetime(df[datetime_col_name_in_df])
             df['demand'] = pd.to_numeric(df['demand'])
-        except Exception as e:s
+        except Exception as e:
             validation_report['issues_found'].append(f"Data type conversion failed: {e}")
 
         # Remove invalid rows
@@ -278,31 +285,33 @@ class DataFlowAgent:
 
     def _add_comprehensive_time_features(self, df: pd.DataFrame, fy_start_month: int) -> pd.DataFrame:
         """Add comprehensive time features for analysis"""
+        calendar = calendar_features(df['datetime'], fy_start_month)
+
         # Basic time components
-        df['year'] = df['datetime'].dt.year
-        df['month'] = df['datetime'].dt.month
-        df['day'] = df['datetime'].dt.day
-        df['hour'] = df['datetime'].dt.hour
-        df['minute'] = df['datetime'].dt.minute
+        df['year'] = calendar['year']
+        df['month'] = calendar['month']
+        df['day'] = calendar['day']
+        df['hour'] = calendar['hour']
+        df['minute'] = calendar['minute']
         
         # Day-based features
-        df['day_of_week'] = df['datetime'].dt.dayofweek  # Monday=0
-        df['day_of_year'] = df['datetime'].dt.dayofyear
-        df['week_of_year'] = df['datetime'].dt.isocalendar().week
-        df['is_weekend'] = df['day_of_week'].isin([5, 6])  # Saturday, Sunday
+        df['day_of_week'] = calendar['dayofweek']  # Monday=0
+        df['day_of_year'] = calendar['dayofyear']
+        df['week_of_year'] = calendar['week_of_year']
+        df['is_weekend'] = calendar['is_weekend']  # Saturday, Sunday
         
         # Fiscal year calculation
-        df['fiscal_year'] = df['datetime'].apply(lambda x: self._get_fiscal_year(x, fy_start_month))
-        df['fiscal_month'] = df.apply(lambda row: self._get_fiscal_month(row['month'], fy_start_month), axis=1)
-        df['fiscal_quarter'] = ((df['fiscal_month'] - 1) // 3) + 1
+        df['fiscal_year'] = calendar['fiscal_year']
+        df['fiscal_month'] = calendar['fiscal_month']
+        df['fiscal_quarter'] = calendar['fiscal_quarter']
         
         # Seasonal features
-        df['season'] = df['month'].apply(self._get_season)
+        df['season'] = season_categorical(calendar['month'], 'meteorological')
         df['is_summer'] = df['season'] == 'Summer'
         df['is_winter'] = df['season'] == 'Winter'
         
         # Time of day categories
-        df['time_of_day'] = df['hour'].apply(self._get_time_category)
+        df['time_of_day'] = time_of_day_categorical(calendar['hour'])
         df['is_peak_hour'] = df['hour'].isin([17, 18, 19, 20, 21])  # Evening peak
         df['is_off_peak'] = df['hour'].isin([23, 0, 1, 2, 3, 4, 5])  # Night hours
         
@@ -312,58 +321,107 @@ class DataFlowAgent:
         
         return df
     
-    def _intelligent_interpolation(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Intelligent interpolation for missing demand values"""
-        missing_count = df['demand'].isna().sum()
+    def _intelligent_interpolation(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Intelligent interpolation for missing demand values
         
-        if missing_count == 0:
-            return df
+        Gaps are found as runs of missing values. Runs of up to LINEAR_GAP_LIMIT rows
+        are filled by linear interpolation, longer runs (and gaps at either end) from
+        the seasonal pattern of the observed data. Returns the filled frame and the
+        gap statistics, including how many rows each stage filled.
+        """
+        missing = df['demand'].isna().to_numpy()
+        gap_statistics = self._gap_statistics(missing)
         
-        logger.info(f"Interpolating {missing_count} missing demand values")
+        if not missing.any():
+            gap_statistics.update({'linear_filled': 0, 'pattern_filled': 0, 'fallback_filled': 0, 'unfilled': 0})
+            return df, gap_statistics
+        
+        logger.info(f"Interpolating {gap_statistics['missing_values']} missing demand values "
+                    f"in {gap_statistics['gap_count']} gaps (longest {gap_statistics['longest_gap']} rows)")
         
         df = df.copy()
+        demand = df['demand'].to_numpy(dtype=float, copy=True)
+        
+        # Length of the gap each missing row belongs to
+        starts, lengths = self._find_gap_runs(missing)
+        run_length = np.zeros(len(demand), dtype=np.int64)
+        run_length[missing] = np.repeat(lengths, lengths)
+        
+        # Stage 1: Linear interpolation for short gaps between observed values
+        short_rows = np.flatnonzero(missing & (run_length <= self.LINEAR_GAP_LIMIT))
+        if len(short_rows):
+            linear = df['demand'].interpolate(method='linear', limit_area='inside').to_numpy()
+            demand[short_rows] = linear[short_rows]
+        linear_filled = int(np.count_nonzero(~np.isnan(demand[short_rows])))
         
-        # Multi-stage interpolation approach
-        # Stage 1: Linear interpolation for small gaps (≤6 hours)
-        df['demand'] = df['demand'].interpolate(method='linear', limit=6)
+        # Stage 2: Seasonal pattern for long gaps and anything linear could not bridge
+        pattern_rows = np.flatnonzero(np.isnan(demand))
+        if len(pattern_rows):
+            demand[pattern_rows] = self._seasonal_pattern_interpolation(df, pattern_rows)
+        pattern_filled = int(np.count_nonzero(~np.isnan(demand[pattern_rows])))
         
-        # Stage 2: Seasonal pattern interpolation for larger gaps
-        remaining_missing = df['demand'].isna().sum()
-        if remaining_missing > 0:
-            df = self._seasonal_pattern_interpolation(df)
+        df['demand'] = demand
+        fallback_rows = np.flatnonzero(np.isnan(demand))
         
         # Stage 3: Forward/backward fill for extreme cases
-        df['demand'] = df['demand'].fillna(method='ffill').fillna(method='bfill')
+        df['demand'] = df['demand'].ffill().bfill()
         
         # Final fallback: median value
         if df['demand'].isna().any():
             df['demand'] = df['demand'].fillna(df['demand'].median())
         
-        return df
+        still_missing = int(df['demand'].isna().sum())
+        gap_statistics.update({
+            'linear_filled': linear_filled,
+            'pattern_filled': pattern_filled,
+            'fallback_filled': int(df['demand'].iloc[fallback_rows].notna().sum()),
+            'unfilled': still_missing
+        })
+        if still_missing:
+            logger.warning(f"{still_missing} demand values could not be filled (no observed data)")
+        return df, gap_statistics
     
-    def _seasonal_pattern_interpolation(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Interpolate using seasonal patterns"""
-        # Calculate patterns for interpolation
-        hourly_patterns = df.groupby('hour')['demand'].median()
-        daily_patterns = df.groupby(['day_of_week', 'hour'])['demand'].median()
-        monthly_patterns = df.groupby(['month', 'hour'])['demand'].median()
-        
-        # Fill missing values using best available pattern
-        for idx in df[df['demand'].isna()].index:
-            row = df.loc[idx]
-            hour = row['hour']
-            day_of_week = row['day_of_week']
-            month = row['month']
-            
-            # Try most specific pattern first
-            if (month, hour) in monthly_patterns.index:
-                df.loc[idx, 'demand'] = monthly_patterns[(month, hour)]
-            elif (day_of_week, hour) in daily_patterns.index:
-                df.loc[idx, 'demand'] = daily_patterns[(day_of_week, hour)]
-            elif hour in hourly_patterns.index:
-                df.loc[idx, 'demand'] = hourly_patterns[hour]
+    @staticmethod
+    def _find_gap_runs(missing: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Start positions and lengths of the runs of True in a boolean array"""
+        edges = np.diff(np.concatenate(([0], missing.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return starts, ends - starts
+    
+    def _gap_statistics(self, missing: np.ndarray) -> Dict[str, Any]:
+        """Summary of the missing-value runs"""
+        starts, lengths = self._find_gap_runs(missing)
+        short_gaps = lengths <= self.LINEAR_GAP_LIMIT
+        return {
+            'missing_values': int(lengths.sum()),
+            'missing_percentage': float(lengths.sum() / len(missing) * 100) if len(missing) else 0.0,
+            'gap_count': int(len(lengths)),
+            'short_gaps': int(short_gaps.sum()),
+            'long_gaps': int((~short_gaps).sum()),
+            'longest_gap': int(lengths.max()) if len(lengths) else 0,
+            'mean_gap_length': float(lengths.mean()) if len(lengths) else 0.0,
+            'leading_gap': bool(len(starts) and starts[0] == 0),
+            'trailing_gap': bool(len(starts) and starts[-1] + lengths[-1] == len(missing))
+        }
+    
+    def _seasonal_pattern_interpolation(self, df: pd.DataFrame, rows: np.ndarray) -> np.ndarray:
+        """Seasonal pattern values (median of observed demand) for the given row positions"""
+        observed = df[df['demand'].notna()]
+        values = np.full(len(rows), np.nan)
+        
+        # Most specific pattern first; coarser ones only for combinations never observed
+        for keys in (['month', 'day_of_week', 'hour'], ['month', 'hour'], ['day_of_week', 'hour'], ['hour']):
+            pending = np.isnan(values)
+            if not pending.any() or observed.empty:
+                break
+            pattern = observed.groupby(keys)['demand'].median()
+            wanted = [df[key].to_numpy()[rows[pending]] for key in keys]
+            lookup = pd.MultiIndex.from_arrays(wanted) if len(keys) > 1 else wanted[0]
+            values[pending] = pattern.reindex(lookup).to_numpy(dtype=float)
         
-        return df
+        return values
     
     def _validate_base_year_completeness(self, df: pd.DataFrame, config: LoadProfileConfig):
         """Validate base year data completeness"""
@@ -524,42 +582,6 @@ class DataFlowAgent:
                 return col
         return None
 
-    def _get_fiscal_year(self, date_obj: datetime, fy_start_month: int) -> int:
-        """Convert datetime to fiscal year"""
-        if date_obj.month >= fy_start_month:
-            return date_obj.year + 1
-        else:
-            return date_obj.year
-
-    def _get_fiscal_month(self, calendar_month: int, fy_start_month: int) -> int:
-        """Convert calendar month to fiscal month"""
-        fiscal_month = calendar_month - fy_start_month + 1
-        if fiscal_month <= 0:
-            fiscal_month += 12
-        return fiscal_month
-
-    def _get_season(self, month: int) -> str:
-        """Get season from month"""
-        if month in [12, 1, 2]:
-            return 'Winter'
-        elif month in [3, 4, 5]:
-            return 'Spring'
-        elif month in [6, 7, 8]:
-            return 'Summer'
-        else:
-            return 'Autumn'
-
-    def _get_time_category(self, hour: int) -> str:
-        """Categorize hour into time periods"""
-        if 6 <= hour < 12:
-            return 'Morning'
-        elif 12 <= hour < 18:
-            return 'Afternoon'
-        elif 18 <= hour < 22:
-            return 'Evening'
-        else:
-            return 'Night'
-
     def _validate_custom_totals(self, totals: Dict[int, float], config: LoadProfileConfig) -> Dict[int, float]:
         """Validate custom totals"""
         validated_totals = {}
@@ -708,65 +730,127 @@ class MethodologyAgent:
                     logger.warning(f"Energy conservation error for year {year}: {error_percent:.3f}%")
     
     def _apply_load_shifting(self, profile_df: pd.DataFrame, config: LoadProfileConfig) -> pd.DataFrame:
-        """Applyload shifting with gradual implementation"""
-        if not config.enable_load_shifting or not config.peak_shifting_hours:
+        """
+        Apply load shifting with gradual implementation
+        
+        All rules (peak_shifting_hours and load_shift_rules) are compiled once into
+        per-fiscal-year shift fractions and row index arrays, then each rule is applied
+        to every year at once. The energy taken from a source hour in a fiscal year is
+        spread evenly over that year's target-hour rows, so yearly totals are preserved.
+        """
+        if not config.enable_load_shifting or not (config.peak_shifting_hours or config.load_shift_rules):
             return profile_df
         
-        logger.info("Applyingload shifting")
+        logger.info("Applying load shifting")
         
         df = profile_df.copy()
+        demand = df['Demand'].to_numpy(dtype=float, copy=True)
+        hours = df['Hour'].to_numpy(dtype=np.int64) if 'Hour' in df.columns else pd.DatetimeIndex(df['datetime']).hour.to_numpy()
+        year_values, year_codes = np.unique(df['Fiscal_Year'].to_numpy(dtype=np.int64), return_inverse=True)
+        original_totals = np.bincount(year_codes, weights=demand, minlength=len(year_values))
+        
+        compiled_rules = self._compile_shift_rules(config, year_values)
+        if not compiled_rules:
+            return profile_df
         
-        for year in range(config.start_year, config.end_year + 1):
-            year_mask = df['Fiscal_Year'] == year
+        # Row indices of each hour, in profile order
+        order = np.argsort(hours, kind='stable')
+        bounds = np.searchsorted(hours[order], np.arange(25))
+        hour_rows = [order[bounds[h]:bounds[h + 1]] for h in range(24)]
+        
+        # Calendar-class masks (days of week x months), built once per distinct filter
+        calendar = None
+        class_masks = {}
+        
+        for rule, year_fraction in compiled_rules:
+            source_rows = hour_rows[rule.from_hour]
+            target_rows = hour_rows[rule.to_hour]
             
-            # Calculate implementation progress
-            years_since_start = year - config.start_year
-            if config.gradual_shift_implementation:
-                implementation_factor = min(1.0, years_since_start / config.shift_implementation_years)
-            else:
-                implementation_factor = 1.0
+            class_key = (tuple(rule.days_of_week or ()), tuple(rule.months or ()))
+            if class_key != ((), ()):
+                if class_key not in class_masks:
+                    if calendar is None:
+                        calendar = calendar_features(df['datetime'], config.fiscal_year_start_month)
+                    mask = np.ones(len(df), dtype=bool)
+                    if rule.days_of_week:
+                        mask &= np.isin(calendar['dayofweek'], rule.days_of_week)
+                    if rule.months:
+                        mask &= np.isin(calendar['month'], rule.months)
+                    class_masks[class_key] = mask
+                source_rows = source_rows[class_masks[class_key][source_rows]]
+                target_rows = target_rows[class_masks[class_key][target_rows]]
+            
+            if len(source_rows) == 0 or len(target_rows) == 0:
+                continue
             
-            # Apply load shifting rules
-            for from_hour, to_hour in config.peak_shifting_hours.items():
-                self._apply_hourly_shift(df, year_mask, from_hour, to_hour, 
-                                       config.load_shift_percentage, implementation_factor)
+            # Years without target rows keep their load where it is
+            target_slots = np.bincount(year_codes[target_rows], minlength=len(year_values))
+            year_fraction = np.where(target_slots > 0, year_fraction, 0.0)
+            
+            shift_amount = demand[source_rows] * year_fraction[year_codes[source_rows]]
+            demand[source_rows] -= shift_amount
+            
+            shifted_by_year = np.bincount(year_codes[source_rows], weights=shift_amount, minlength=len(year_values))
+            per_slot = np.divide(shifted_by_year, target_slots, out=np.zeros_like(shifted_by_year), where=target_slots > 0)
+            demand[target_rows] += per_slot[year_codes[target_rows]]
         
         # Ensure no negative values
-        df['Demand'] = df['Demand'].clip(lower=0)
+        demand = np.clip(demand, 0, None)
         
         # Reapply energy conservation after shifting
-        for year, target_total in self._get_target_totals_from_df(df).items():
-            year_mask = df['Fiscal_Year'] == year
-            year_data = df[year_mask]
-            
-            if not year_data.empty:
-                current_total = year_data['Demand'].sum()
-                if abs(current_total - target_total) / target_total > config.energy_conservation_tolerance:
-                    scale_factor = target_total / current_total
-                    df.loc[year_mask, 'Demand'] *= scale_factor
-        
+        current_totals = np.bincount(year_codes, weights=demand, minlength=len(year_values))
+        drift = np.abs(current_totals - original_totals) > config.energy_conservation_tolerance * np.abs(original_totals)
+        if drift.any():
+            scale = np.divide(original_totals, current_totals, out=np.ones_like(current_totals),
+                              where=drift & (current_totals > 0))
+            demand *= scale[year_codes]
+        
+        df['Demand'] = demand
         return df
     
-    def _apply_hourly_shift(self, df: pd.DataFrame, year_mask: pd.Series, 
-                          from_hour: int, to_hour: int, shift_percentage: float, 
-                          implementation_factor: float):
-        """Apply hourly load shift"""
-        from_hour_mask = year_mask & (df['Hour'] == from_hour)
-        to_hour_mask = year_mask & (df['Hour'] == to_hour)
-        
-        if from_hour_mask.any() and to_hour_mask.any():
-            # Calculate amount to shift
-            from_hour_demand = df.loc[from_hour_mask, 'Demand']
-            shift_amount = from_hour_demand * (shift_percentage / 100) * implementation_factor
+    def _compile_shift_rules(self, config: LoadProfileConfig, year_values: np.ndarray) -> List[Tuple[LoadShiftRule, np.ndarray]]:
+        """
+        Turn the configured shifting rules into (rule, fraction shifted per fiscal year) pairs
+        
+        peak_shifting_hours becomes one rule per {from_hour: to_hour} entry using
+        load_shift_percentage and the config ramp-up; load_shift_rules entries are
+        LoadShiftRule fields. Rules keep their configured order.
+        """
+        rules = []
+        for from_hour, to_hour in (config.peak_shifting_hours or {}).items():
+            rules.append((
+                LoadShiftRule(from_hour=int(from_hour), to_hour=int(to_hour),
+                              shift_percentage=config.load_shift_percentage,
+                              start_year=config.start_year,
+                              ramp_up_years=config.shift_implementation_years if config.gradual_shift_implementation else 0),
+                config.end_year
+            ))
+        for rule in config.load_shift_rules or []:
+            rule = rule if isinstance(rule, LoadShiftRule) else LoadShiftRule(**rule)
+            rules.append((rule, config.end_year))
+        
+        compiled = []
+        for rule, end_year in rules:
+            if not (0 <= rule.from_hour <= 23 and 0 <= rule.to_hour <= 23) or rule.from_hour == rule.to_hour:
+                logger.warning(f"Ignoring load shift rule {rule.from_hour} -> {rule.to_hour}: hours must differ and be 0-23")
+                continue
+            
+            start_year = rule.start_year if rule.start_year is not None else config.start_year
+            in_range = (year_values >= start_year) & (year_values <= end_year)
             
-            # Apply the shift
-            df.loc[from_hour_mask, 'Demand'] -= shift_amount
+            # Share of the full shift reached in each year
+            if rule.ramp_up_years > 0 and rule.shift_type != 'step':
+                progress = np.clip((year_values - start_year) / rule.ramp_up_years, 0.0, 1.0)
+                if rule.shift_type == 'exponential':
+                    progress = np.expm1(3 * progress) / np.expm1(3)
+            else:
+                progress = np.ones(len(year_values))
             
-            # Distribute to target hour(s)
-            total_shift = shift_amount.sum()
-            to_hour_count = to_hour_mask.sum()
-            if to_hour_count > 0:
-                df.loc[to_hour_mask, 'Demand'] += total_shift / to_hour_count
+            year_fraction = np.where(in_range, progress * rule.shift_percentage / 100, 0.0)
+            if year_fraction.any():
+                compiled.append((rule, year_fraction))
+        
+        return compiled
     
     def _get_target_totals_from_df(self, df: pd.DataFrame) -> Dict[int, float]:
         """Extract target totals from existing dataframe"""
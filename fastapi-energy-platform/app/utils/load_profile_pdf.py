@@ -24,6 +24,8 @@ import json
 import logging
 from pathlib import Path
 
+from app.utils.profile_store import get_profile_path, read_profile_frame
+
 logger = logging.getLogger(__name__)
 
 class LoadProfileReportGenerator:
@@ -101,12 +103,12 @@ class LoadProfileReportGenerator:
     def _load_profile_data(self):
         """Load profile data and metadata"""
         try:
-            # Load CSV data
-            csv_path = self.project_path / 'results' / 'load_profiles' / f"{self.profile_id}.csv"
-            if not csv_path.exists():
+            # Load profile data (binary profiles come back with the CSV column layout)
+            profile_path = get_profile_path(self.project_path / 'results' / 'load_profiles', self.profile_id)
+            if profile_path is None:
                 raise FileNotFoundError(f"Profile {self.profile_id} not found")
             
-            self.data = pd.read_csv(csv_path)
+            self.data = read_profile_frame(profile_path)
             
             # Standardize columns
             self.data = self._standardize_columns(self.data)
@@ -9,38 +9,55 @@ import logging
 # if this module might be imported elsewhere.
 logger = logging.getLogger(__name__) # Use module's own logger
 
+def _marker_mask(df, marker):
+    """Boolean (rows, cols) mask of string cells starting with marker, built column-wise."""
+    mask = np.zeros(df.shape, dtype=bool)
+    for j, dtype in enumerate(df.dtypes):
+        # Numeric and datetime columns cannot hold marker strings
+        if not (dtype == object or pd.api.types.is_string_dtype(dtype)):
+            continue
+        try:
+            mask[:, j] = df.iloc[:, j].str.startswith(marker, na=False).to_numpy(dtype=bool)
+        except AttributeError: # Object column without any strings
+            continue
+    return mask
+
+def _first_false(flags, offset):
+    """Absolute position of the first False in flags, or offset + len(flags) if there is none."""
+    gaps = np.flatnonzero(~flags)
+    return offset + (int(gaps[0]) if gaps.size else len(flags))
+
 def find_special_symbols(df, marker):
     """Finds cells starting with a specific marker string."""
     markers = []
-    for i, row in df.iterrows():
-        for j, value in enumerate(row):
-            if isinstance(value, str) and value.startswith(marker):
-                # Ensure the actual table name is captured, not just the marker
-                table_name = value[len(marker):].strip()
-                if table_name: # Only add if there's a name after the marker
-                    markers.append((i, j, table_name))
+    rows, cols = np.nonzero(_marker_mask(df, marker)) # Row-major, same order as a row-by-row scan
+    for i, j in zip(rows, cols):
+        value = df.iat[i, j]
+        # Ensure the actual table name is captured, not just the marker
+        table_name = value[len(marker):].strip()
+        if table_name: # Only add if there's a name after the marker
+            markers.append((df.index[i], int(j), table_name))
     return markers
 
-def extract_table(df, start_row_data, start_col_data):
+def extract_table(df, start_row_data, start_col_data, notnull=None):
     """
     Extracts a table from a DataFrame starting at given data cell (after header and marker).
     The header is assumed to be at (start_row_data - 1, start_col_data).
+    notnull may hold a precomputed df.notna() array shared across tables of the same sheet.
     """
     header_row_idx = start_row_data - 1
     if header_row_idx < 0:
         logger.warning(f"Header row index ({header_row_idx}) is invalid. Cannot extract table.")
         return pd.DataFrame()
 
+    if notnull is None:
+        notnull = df.notna().to_numpy()
+
     # Determine end_row by finding first empty cell in the first column of the data block
-    end_row_data = start_row_data
-    while end_row_data < len(df) and pd.notnull(df.iloc[end_row_data, start_col_data]):
-        end_row_data += 1
+    end_row_data = _first_false(notnull[start_row_data:, start_col_data], start_row_data)
 
     # Determine end_col by finding first empty cell in the header row
-    end_col_data = start_col_data
-    # Check header row (header_row_idx) for end of columns
-    while end_col_data < len(df.columns) and pd.notnull(df.iloc[header_row_idx, end_col_data]):
-        end_col_data += 1
+    end_col_data = _first_false(notnull[header_row_idx, start_col_data:], start_col_data)
 
     if start_row_data >= end_row_data or start_col_data >= end_col_data:
         logger.warning(f"Table dimensions invalid or no data found at ({start_row_data}, {start_col_data}).")
@@ -66,6 +83,7 @@ def extract_tables_by_markers(df, marker_prefix):
     """
     table_markers_info = find_special_symbols(df, marker_prefix)
     tables = {}
+    notnull = df.notna().to_numpy() if table_markers_info else None
     for r_marker, c_marker, table_name in table_markers_info:
         # Data table starts on the row after the header row, which is row after marker row.
         # Header is at (r_marker + 1, c_marker). Data starts at (r_marker + 2, c_marker).
@@ -79,7 +97,7 @@ def extract_tables_by_markers(df, marker_prefix):
         
         # Check if there's space for header and at least one data row
         if r_marker + 2 < len(df):
-            extracted_df = extract_table(df, r_marker + 2, c_marker)
+            extracted_df = extract_table(df, r_marker + 2, c_marker, notnull=notnull)
             if not extracted_df.empty:
                 tables[table_name] = extracted_df
                 logger.info(f"Successfully extracted table '{table_name}' with {len(extracted_df)} rows and {len(extracted_df.columns)} columns.")
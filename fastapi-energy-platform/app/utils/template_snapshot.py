@@ -0,0 +1,137 @@
+# app/utils/template_snapshot.py
+"""
+Persistent parsed snapshot of the load curve template.
+
+LoadProfileGenerator.load_template_data turns inputs/load_curve_template.xlsx
+into the processed hourly history (with time features), the total demand by
+financial year, the monthly peak/load-factor sheets and the monthly constraints
+derived from history. With several years of hourly history the Excel parsing
+and derivation take seconds on every base-year, preview, STL and validation
+request. This module stores those frames as Parquet plus a JSON manifest in
+inputs/.load_curve_template_snapshot/, using the same layout and invalidation
+as the demand input snapshot (size and mtime, content hash if only the mtime
+changed).
+"""
+import os
+import json
+import uuid
+import logging
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from app.utils.input_snapshot import (
+    MANIFEST_NAME, PARQUET_AVAILABLE, check_frame, get_snapshot_dir, json_default,
+    remove_generation_files, source_matches, source_unchanged
+)
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SNAPSHOT_FORMAT_VERSION = 1
+
+# load_template_data keys stored in the snapshot; any of them may be None
+TEMPLATE_FRAMES = (
+    'historical_demand', 'total_demand', 'monthly_peaks', 'monthly_load_factors',
+    'calculated_monthly_peaks', 'calculated_load_factors'
+)
+
+
+def save_template_snapshot(template_path: str, template_data: Dict[str, Any],
+                           source: Optional[Dict[str, Any]]) -> bool:
+    """
+    Store the parsed template frames next to the template workbook.
+
+    source is the read_source_identity of the template taken before it was parsed;
+    nothing is written if the template has changed since.
+
+    Returns:
+        bool: True if the snapshot was written
+    """
+    if not PARQUET_AVAILABLE:
+        return False
+
+    template_path = str(template_path)
+    if not source_unchanged(template_path, source):
+        logger.info(f"Template {template_path} changed while it was parsed, snapshot not written")
+        return False
+
+    snapshot_dir = get_snapshot_dir(template_path)
+    generation = uuid.uuid4().hex[:12]
+
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+
+        frame_files = {}
+        for name in TEMPLATE_FRAMES:
+            df = template_data.get(name)
+            if df is None:
+                frame_files[name] = None
+                continue
+            check_frame(df, name)
+            file_name = f'{generation}_{name}.parquet'
+            df.to_parquet(os.path.join(snapshot_dir, file_name), index=False)
+            frame_files[name] = file_name
+
+        manifest = {
+            'format_version': TEMPLATE_SNAPSHOT_FORMAT_VERSION,
+            'generation': generation,
+            'source': dict(source),
+            'frame_files': frame_files
+        }
+
+        # The template may have been replaced while the frames were written
+        if not source_unchanged(template_path, source):
+            logger.info(f"Template {template_path} changed while its snapshot was written, snapshot discarded")
+            remove_generation_files(snapshot_dir, keep=None, only=generation)
+            return False
+
+        tmp_manifest = os.path.join(snapshot_dir, f'{MANIFEST_NAME}.{generation}.tmp')
+        with open(tmp_manifest, 'w') as f:
+            json.dump(manifest, f, default=json_default)
+        os.replace(tmp_manifest, os.path.join(snapshot_dir, MANIFEST_NAME))
+    except Exception as e:
+        logger.warning(f"Could not write template snapshot for {template_path}: {e}")
+        remove_generation_files(snapshot_dir, keep=None, only=generation)
+        return False
+
+    remove_generation_files(snapshot_dir, keep=generation)
+    logger.info(f"Saved template snapshot for {template_path}")
+    return True
+
+
+def load_template_snapshot(template_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the parsed template frames if a snapshot matching the workbook exists.
+
+    Returns:
+        dict or None: One entry per TEMPLATE_FRAMES name (DataFrame or None)
+    """
+    if not PARQUET_AVAILABLE:
+        return None
+
+    template_path = str(template_path)
+    snapshot_dir = get_snapshot_dir(template_path)
+    manifest_path = os.path.join(snapshot_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest_path) or not os.path.exists(template_path):
+        return None
+
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+
+        if manifest.get('format_version') != TEMPLATE_SNAPSHOT_FORMAT_VERSION:
+            return None
+        if not source_matches(template_path, manifest, manifest_path):
+            return None
+
+        frame_files = manifest['frame_files']
+        template_data = {
+            name: pd.read_parquet(os.path.join(snapshot_dir, frame_files[name])) if frame_files.get(name) else None
+            for name in TEMPLATE_FRAMES
+        }
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable template snapshot in {snapshot_dir}: {e}")
+        return None
+
+    logger.debug(f"Loaded template snapshot for {template_path}")
+    return template_data
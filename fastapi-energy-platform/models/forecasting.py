@@ -24,6 +24,8 @@ import logging # Use logging instead of print for server applications
 from typing import List, Dict, Any, Optional, Callable
 from pydantic import BaseModel, Field # For defining data structures if needed by services
 
+from app.utils.forecast_store import write_sector_sidecar
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,6 +118,9 @@ def main_forecasting_function(
                     result_df.to_excel(writer, sheet_name='Results', index=False)
                     # ... (correlation sheet logic from original)
 
+                # Columnar copy for readers, written after the workbook so it is never older
+                write_sector_sidecar(forecast_path, sheet_name, {'Inputs': main_df, 'Results': result_df})
+
                 report_progress(TOTAL_STEPS, TOTAL_STEPS, "Completed using existing data")
                 return {"status": "success", "message": f"Used existing data for {sheet_name}", "used_existing_data": True, "models_used": ["User Data"]}
 
@@ -203,7 +208,7 @@ def main_forecasting_function(
         report_progress(current_step := current_step + 1, TOTAL_STEPS, "Saving results to Excel file")
         # save_results(sheet_name, main_df, consolidated_df, evaluation_test_df, models_trained, X_forecast, independent_vars)
 
-        # Mock saving
+        # Mock saving; once the workbook is written here, mirror it with write_sector_sidecar
         scenario_sheet_path = os.path.join(forecast_path, f"{sheet_name}.xlsx")
         os.makedirs(os.path.dirname(scenario_sheet_path), exist_ok=True)
         # with pd.ExcelWriter(scenario_sheet_path, engine='xlsxwriter') as writer:
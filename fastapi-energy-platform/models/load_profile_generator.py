@@ -9,8 +9,12 @@ import numpy as np
 import os
 import json
 import logging
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 import holidays # For identifying holidays
 
 # Optional: STL decomposition (install statsmodels if using STL method)
@@ -23,11 +27,93 @@ except ImportError:
 
 # Assuming these utilities are adapted and available in the new structure
 from ..utils.helpers import ensure_directory, get_file_info # Path-aware
+from ..utils.calendar_features import calendar_features
+from ..utils.input_snapshot import read_source_identity
+from ..utils.template_snapshot import load_template_snapshot, save_template_snapshot
+from ..utils.profile_store import (
+    PARQUET_AVAILABLE as PROFILE_PARQUET_AVAILABLE, EXPORT_COLUMNS, delete_profile_files,
+    export_profile_csv, get_profile_path, read_profile_frame, series_to_export_frame, write_profile
+)
 # from ..utils.constants import UNIT_FACTORS, VALIDATION_RULES # Check relevance and source
 # from ..utils.response_utils import success_response, error_response # Response formatting is for routers
 
 logger = logging.getLogger(__name__)
 
+# Financial year months in order, April first
+FINANCIAL_MONTH_NAMES = ['Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar']
+
+
+class GenerationCancelled(Exception):
+    """Raised by a progress callback to stop a forecast between generation stages"""
+
+
+def report_progress(progress_callback, stage: str, message: str, fraction: Optional[float] = None) -> None:
+    """
+    Announce the start of a generation stage, or with fraction (0-1) how far a long stage
+    has got; the callback may raise GenerationCancelled
+    """
+    if progress_callback is None:
+        return
+    if fraction is None:
+        progress_callback(stage, message)
+    else:
+        progress_callback(stage, message, fraction)
+
+
+@dataclass(frozen=True, eq=False)
+class HolidayCalendar:
+    """Holidays for one (region, subdivision, year range), shared by all generator instances."""
+    region: str
+    subdiv: str
+    years_range: Tuple[int, int]
+    holidays_df: pd.DataFrame
+    dates: np.ndarray # Sorted unique datetime64[D]
+
+    @property
+    def empty(self) -> bool:
+        return self.dates.size == 0
+
+    def is_holiday(self, timestamps) -> np.ndarray:
+        """Boolean array marking timestamps whose calendar date is a holiday (searchsorted lookup)."""
+        index = pd.DatetimeIndex(timestamps)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        days = index.values.astype('datetime64[D]')
+        if self.empty:
+            return np.zeros(len(days), dtype=bool)
+        positions = np.minimum(np.searchsorted(self.dates, days), self.dates.size - 1)
+        return self.dates[positions] == days
+
+
+_holiday_calendar_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _build_holiday_calendar(region: str, subdiv: str, years_range: Tuple[int, int]) -> HolidayCalendar:
+    years = range(years_range[0], years_range[1] + 1) # Inclusive end year
+    holiday_calendar = holidays.country_holidays(region, subdiv=subdiv, years=list(years))
+
+    holidays_df = pd.DataFrame(
+        [(date, name) for date, name in holiday_calendar.items()],
+        columns=['Date', 'HolidayName']
+    )
+    holidays_df['Date'] = pd.to_datetime(holidays_df['Date'])
+    dates = np.unique(holidays_df['Date'].values.astype('datetime64[D]'))
+    logger.info(f"Loaded {len(holidays_df)} holidays for {region}-{subdiv} ({years_range[0]}-{years_range[1]}).")
+    return HolidayCalendar(region, subdiv, tuple(years_range), holidays_df, dates)
+
+
+def get_holiday_calendar(region: str = 'IN', subdiv: str = 'KL', years_range: Tuple[int, int] = (2017, 2040)) -> HolidayCalendar:
+    """Process-wide memoized holiday calendar. Failures are not cached so later calls can retry."""
+    try:
+        with _holiday_calendar_lock:
+            return _build_holiday_calendar(region, subdiv, tuple(years_range))
+    except Exception as e:
+        logger.warning(f"Could not load holidays data: {e}")
+        return HolidayCalendar(region, subdiv, tuple(years_range),
+                               pd.DataFrame(columns=['Date', 'HolidayName']),
+                               np.array([], dtype='datetime64[D]'))
+
 # --- Pydantic Models (Optional, for structuring inputs/outputs if used by services) ---
 # from pydantic import BaseModel
 # class LoadProfileGeneratorConfig(BaseModel):
@@ -53,40 +139,38 @@ class LoadProfileGenerator:
         ensure_directory(self.results_path)
         ensure_directory(self.config_path)
 
-        self.holidays_data = self._initialize_holidays()
+        self.holiday_calendar = get_holiday_calendar() # Shared across instances
+        self.holidays_data = self.holiday_calendar.holidays_df
         logger.info(f"LoadProfileGenerator initialized for project: {project_path}")
 
     def _initialize_holidays(self, years_range=(2017, 2040), region='IN', subdiv='KL') -> pd.DataFrame:
-        try:
-            years = range(years_range[0], years_range[1] + 1) # Inclusive end year
-            holiday_calendar = holidays.country_holidays(region, subdiv=subdiv, years=list(years)) # Pass list of years
-
-            holidays_df = pd.DataFrame(
-                [(date, name) for date, name in holiday_calendar.items()],
-                columns=['Date', 'HolidayName'] # Renamed 'Holiday' to 'HolidayName' for clarity
-            )
-            holidays_df['Date'] = pd.to_datetime(holidays_df['Date'])
-            logger.info(f"Loaded {len(holidays_df)} holidays for {region}-{subdiv} ({years_range[0]}-{years_range[1]}).")
-            return holidays_df
-        except Exception as e:
-            logger.warning(f"Could not load holidays data: {e}")
-            return pd.DataFrame(columns=['Date', 'HolidayName'])
+        return get_holiday_calendar(region, subdiv, years_range).holidays_df
 
     def load_template_data(self, template_filename: str = 'load_curve_template.xlsx') -> Dict[str, Any]:
         template_file_path = self.inputs_path / template_filename
         if not template_file_path.exists():
             raise FileNotFoundError(f"Template file not found: {template_file_path}")
 
+        # Parsed frames are reused while the workbook is unchanged
+        snapshot = load_template_snapshot(template_file_path)
+        if snapshot is not None:
+            snapshot['template_info'] = get_file_info(template_file_path)
+            return snapshot
+
+        # Identify the template before parsing, so a snapshot is only tagged with the file it was read from
+        source = read_source_identity(str(template_file_path))
+
         try:
-            historical_demand_df = pd.read_excel(template_file_path, sheet_name='Past_Hourly_Demand')
-            try:
-                total_demand_df = pd.read_excel(template_file_path, sheet_name='Total_Demand')
-            except Exception: # Try alternative name
-                logger.info("Sheet 'Total_Demand' not found, trying 'Total Demand'.")
-                total_demand_df = pd.read_excel(template_file_path, sheet_name='Total Demand')
+            with pd.ExcelFile(template_file_path) as workbook: # Open the workbook once for all sheets
+                historical_demand_df = workbook.parse('Past_Hourly_Demand')
+                if 'Total_Demand' in workbook.sheet_names:
+                    total_demand_df = workbook.parse('Total_Demand')
+                else: # Try alternative name
+                    logger.info("Sheet 'Total_Demand' not found, trying 'Total Demand'.")
+                    total_demand_df = workbook.parse('Total Demand')
 
-            monthly_peaks_df = pd.read_excel(template_file_path, sheet_name='Monthly_Peak_Demand', header=0) if 'Monthly_Peak_Demand' in pd.ExcelFile(template_file_path).sheet_names else None
-            monthly_lf_df = pd.read_excel(template_file_path, sheet_name='Monthly_Load_Factors', header=0) if 'Monthly_Load_Factors' in pd.ExcelFile(template_file_path).sheet_names else None
+                monthly_peaks_df = workbook.parse('Monthly_Peak_Demand', header=0) if 'Monthly_Peak_Demand' in workbook.sheet_names else None
+                monthly_lf_df = workbook.parse('Monthly_Load_Factors', header=0) if 'Monthly_Load_Factors' in workbook.sheet_names else None
 
             processed_historical = self._process_historical_demand(historical_demand_df)
             processed_total_demand = self._process_total_demand(total_demand_df)
@@ -95,16 +179,19 @@ class LoadProfileGenerator:
             calculated_lf = self._calculate_monthly_load_factors(processed_historical) if monthly_lf_df is None else None
 
             logger.info(f"Template data loaded successfully from {template_file_path}")
-            return {
+            template_data = {
                 'historical_demand': processed_historical, 'total_demand': processed_total_demand,
                 'monthly_peaks': monthly_peaks_df, 'monthly_load_factors': monthly_lf_df,
-                'calculated_monthly_peaks': calculated_peaks, 'calculated_load_factors': calculated_lf,
-                'template_info': get_file_info(template_file_path) # get_file_info expects Path
+                'calculated_monthly_peaks': calculated_peaks, 'calculated_load_factors': calculated_lf
             }
         except Exception as e:
             logger.error(f"Error loading template data from {template_file_path}: {e}")
             raise ValueError(f"Failed to load or process template data: {str(e)}")
 
+        save_template_snapshot(template_file_path, template_data, source)
+        template_data['template_info'] = get_file_info(template_file_path) # get_file_info expects Path
+        return template_data
+
     # _process_historical_demand, _process_total_demand, _add_time_features,
     # _calculate_monthly_peaks, _calculate_monthly_load_factors,
     # load_scenario_data, get_available_base_years, extract_base_profiles
@@ -155,20 +242,16 @@ class LoadProfileGenerator:
     def _add_time_features(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
         dt_series = df['ds'] # Assuming 'ds' is already datetime
-        df['hour'] = dt_series.dt.hour
-        df['dayofweek'] = dt_series.dt.dayofweek # Monday=0, Sunday=6
-        df['month'] = dt_series.dt.month
-        df['year'] = dt_series.dt.year
-        df['day'] = dt_series.dt.day
-        df['financial_year'] = np.where(df['month'] >= 4, df['year'] + 1, df['year'])
-        df['financial_month'] = np.where(df['month'] >= 4, df['month'] - 3, df['month'] + 9)
-        df['is_weekend'] = df['dayofweek'].isin([5, 6]).astype(int)
-        if not self.holidays_data.empty:
-             # Ensure 'Date' in holidays_data is also just date part for comparison
-            holidays_date_set = set(self.holidays_data['Date'].dt.date)
-            df['is_holiday'] = dt_series.dt.date.isin(holidays_date_set).astype(int)
-        else:
-            df['is_holiday'] = 0
+        calendar = calendar_features(dt_series)
+        df['hour'] = calendar['hour']
+        df['dayofweek'] = calendar['dayofweek'] # Monday=0, Sunday=6
+        df['month'] = calendar['month']
+        df['year'] = calendar['year']
+        df['day'] = calendar['day']
+        df['financial_year'] = calendar['fiscal_year']
+        df['financial_month'] = calendar['fiscal_month']
+        df['is_weekend'] = calendar['is_weekend'].astype(np.int8)
+        df['is_holiday'] = self.holiday_calendar.is_holiday(dt_series).astype(int) # Compares date part only
         df['is_special_day'] = (df['is_weekend'] | df['is_holiday']).astype(int)
         return df
 
@@ -185,15 +268,71 @@ class LoadProfileGenerator:
         df_processed = df[['Financial_Year', demand_col_name]].rename(columns={demand_col_name: 'Total_Demand'})
         return df_processed.dropna().sort_values('Financial_Year').reset_index(drop=True)
 
+    def _financial_month_demand_stats(self, historical_data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+        """Demand sum/mean/max per (financial_year, financial_month) in one groupby, complete years (>= 8000 records) only."""
+        year_groups = historical_data.groupby('financial_year', sort=False)['demand']
+        year_sizes = year_groups.size()
+        complete_years = year_sizes.index[year_sizes >= 8000] # Skip incomplete years
+        annual_totals = year_groups.sum().loc[complete_years]
+
+        complete_data = historical_data[
+            historical_data['financial_year'].isin(complete_years) &
+            historical_data['financial_month'].between(1, 12)
+        ]
+        month_stats = complete_data.groupby(['financial_year', 'financial_month'])['demand'].agg(['sum', 'mean', 'max'])
+        return month_stats, annual_totals
+
+    @staticmethod
+    def _average_by_financial_month(values_by_month: pd.Series, years: pd.Index) -> pd.DataFrame:
+        """Averages a (financial year x financial month) series across years into one 'Average' row of Apr..Mar columns."""
+        averages = {}
+        if not values_by_month.empty:
+            table = values_by_month.unstack('financial_month').reindex(years)
+            for month in range(1, 13):
+                if month in table.columns: # Months never observed are left out
+                    averages[FINANCIAL_MONTH_NAMES[month - 1]] = table[month].mean()
+        final_df = pd.DataFrame([averages])
+        final_df['Financial_Year'] = 'Average'
+        return final_df
+
     def _calculate_monthly_peaks(self, historical_data: pd.DataFrame) -> Optional[pd.DataFrame]:
-        # Placeholder
-        logger.debug("Calculating monthly peaks (stub).")
-        return pd.DataFrame([{'Financial_Year': 'Average', 'Apr':0.1, 'May':0.11}]) # Example structure
+        """Average monthly share of annual demand over complete historical financial years."""
+        try:
+            if historical_data.empty:
+                return None
+            month_stats, annual_totals = self._financial_month_demand_stats(historical_data)
+            valid_years = annual_totals.index[annual_totals > 0]
+            if len(valid_years) == 0:
+                return None
+
+            month_stats = month_stats[month_stats.index.get_level_values('financial_year').isin(valid_years)]
+            year_totals = annual_totals.reindex(month_stats.index.get_level_values('financial_year')).to_numpy()
+            final_peaks = self._average_by_financial_month(month_stats['sum'] / year_totals, valid_years)
+            logger.info(f"Calculated monthly peaks for {len(valid_years)} years")
+            return final_peaks
+        except Exception as e:
+            logger.error(f"Error calculating monthly peaks: {e}", exc_info=True)
+            return None
 
     def _calculate_monthly_load_factors(self, historical_data: pd.DataFrame) -> Optional[pd.DataFrame]:
-        # Placeholder
-        logger.debug("Calculating monthly load factors (stub).")
-        return pd.DataFrame([{'Financial_Year': 'Average', 'Apr':0.6, 'May':0.62}]) # Example structure
+        """Average monthly load factor (mean / peak demand) over complete historical financial years."""
+        try:
+            if historical_data.empty:
+                return None
+            month_stats, annual_totals = self._financial_month_demand_stats(historical_data)
+            if len(annual_totals) == 0:
+                return None
+
+            monthly_lf = pd.Series(
+                np.where(month_stats['max'] > 0, month_stats['mean'] / month_stats['max'], 0.0),
+                index=month_stats.index
+            )
+            final_lf = self._average_by_financial_month(monthly_lf, annual_totals.index)
+            logger.info(f"Calculated monthly load factors for {len(annual_totals)} years")
+            return final_lf
+        except Exception as e:
+            logger.error(f"Error calculating monthly load factors: {e}", exc_info=True)
+            return None
 
     def load_scenario_data(self, scenario_csv_path: Path) -> pd.DataFrame:
         # Placeholder
@@ -233,8 +372,12 @@ class LoadProfileGenerator:
     # For brevity, providing a simplified structure.
     def generate_base_profile_forecast(self, historical_data: pd.DataFrame, demand_scenarios: pd.DataFrame,
                                      base_year: int, start_fy: int, end_fy: int,
-                                     frequency: str = 'hourly', constraints: Optional[Dict] = None) -> Dict[str, Any]:
+                                     frequency: str = 'hourly', constraints: Optional[Dict] = None,
+                                     progress_callback=None) -> Dict[str, Any]:
+        """progress_callback(stage, message[, fraction]) is called as stages start and may raise GenerationCancelled."""
         logger.info(f"Generating base profile forecast for FY{start_fy}-FY{end_fy}, base year {base_year}.")
+        report_progress(progress_callback, 'decomposition', f"Extracting FY{base_year} base profiles")
+        report_progress(progress_callback, 'forecast', "Scaling profiles to annual demand")
         # ... (original core logic, adapted for Path and logging) ...
         # This is a highly simplified mock of the generation and saving process
         mock_profile_df = pd.DataFrame({
@@ -253,13 +396,41 @@ class LoadProfileGenerator:
             }
         }
 
+    def generate_base_profile_forecasts(self, historical_data: pd.DataFrame, demand_scenarios_by_name: Dict[str, pd.DataFrame],
+                                        base_year: int, start_fy: int, end_fy: int,
+                                        frequency: str = 'hourly', constraints: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Base profile forecasts for several demand scenarios in one job.
+        Same contract as the root generator: data = {'forecasts': {name: results}, 'failed': {name: message}}.
+        Until the core logic is ported the shared profile frame cannot be reused here, so
+        each scenario goes through generate_base_profile_forecast.
+        """
+        if not demand_scenarios_by_name:
+            return {"status": "error", "message": "No demand scenarios provided"}
+        forecasts: Dict[str, Any] = {}
+        failed: Dict[str, str] = {}
+        for scenario_name, demand_scenarios in demand_scenarios_by_name.items():
+            result = self.generate_base_profile_forecast(historical_data, demand_scenarios, base_year,
+                                                         start_fy, end_fy, frequency, constraints)
+            if result.get("status") == "success":
+                result["data"]["demand_scenario"] = scenario_name
+                forecasts[scenario_name] = result["data"]
+            else:
+                failed[scenario_name] = result.get("message", "Generation failed")
+        if not forecasts:
+            return {"status": "error", "message": f"Failed to generate forecasts for all scenarios: {failed}"}
+        return {"status": "success", "data": {"forecasts": forecasts, "failed": failed}}
+
     def generate_stl_forecast(self, historical_data: pd.DataFrame, demand_scenarios: pd.DataFrame,
                               start_fy: int, end_fy: int, frequency: str = 'hourly',
-                              stl_params: Optional[Dict] = None, constraints: Optional[Dict] = None) -> Dict[str, Any]:
+                              stl_params: Optional[Dict] = None, constraints: Optional[Dict] = None,
+                              lf_improvement: Optional[Dict] = None, progress_callback=None) -> Dict[str, Any]:
         if not STL_AVAILABLE:
             logger.error("STL forecast attempted but statsmodels not available.")
             return {"status": "error", "message": "STL library (statsmodels) not installed."}
         logger.info(f"Generating STL forecast for FY{start_fy}-FY{end_fy}.")
+        report_progress(progress_callback, 'decomposition', "Running STL decomposition")
+        report_progress(progress_callback, 'forecast', "Building forecast from STL components")
         # ... (original core logic for STL, adapted for Path and logging) ...
         mock_profile_df = pd.DataFrame({
             'ds': pd.to_datetime(['2023-01-01 00:00', '2023-01-01 01:00']),
@@ -292,7 +463,7 @@ class LoadProfileGenerator:
     # ... other private helpers like _apply_base_profiles, _scale_to_annual_targets, _apply_constraints, _validate_forecast ...
 
     def save_forecast(self, forecast_output_data: Dict[str, Any], profile_id_override: Optional[str] = None) -> Dict[str, Any]:
-        """Saves forecast results to CSV and metadata to JSON."""
+        """Saves forecast results in the compact profile format (CSV without pyarrow) and metadata to JSON."""
         try:
             forecast_data_dict = forecast_output_data.get('data', {}) # Original structure had data nested
             if not forecast_data_dict:
@@ -315,20 +486,18 @@ class LoadProfileGenerator:
             if 'ds' not in forecast_df.columns or 'demand' not in forecast_df.columns:
                 raise ValueError("Forecast DataFrame must contain 'ds' and 'demand' columns.")
 
-            # Standardize output format
-            output_df = pd.DataFrame()
-            output_df['datetime'] = pd.to_datetime(forecast_df['ds'])
-            output_df['Demand_kW'] = forecast_df['demand'].round(2) # Assuming demand is in kW
-            output_df['Date'] = output_df['datetime'].dt.date
-            output_df['Time'] = output_df['datetime'].dt.time
-            output_df['Fiscal_Year'] = forecast_df.get('financial_year', output_df['datetime'].apply(lambda dt: dt.year + 1 if dt.month >= 4 else dt.year))
-            output_df['Year'] = output_df['datetime'].dt.year
-            output_df['Hour'] = forecast_df.get('hour', output_df['datetime'].dt.hour)
-            output_df = output_df.sort_values('datetime').reset_index(drop=True)
-
-            csv_path = self.results_path / f"{profile_id}.csv"
-            output_df.to_csv(csv_path, index=False)
-            logger.info(f"Saved forecast data to {csv_path}")
+            # Only timestamps and demand (kW) are stored; the other CSV columns are derived on read
+            series = pd.DataFrame({
+                'ds': pd.to_datetime(forecast_df['ds']).to_numpy(),
+                'demand': forecast_df['demand'].to_numpy(dtype=float).round(2)
+            }).sort_values('ds', kind='stable').reset_index(drop=True)
+
+            if PROFILE_PARQUET_AVAILABLE:
+                profile_path = write_profile(self.results_path, profile_id, series['ds'], series['demand'])
+            else:
+                profile_path = self.results_path / f"{profile_id}.csv"
+                series_to_export_frame(series['ds'], series['demand']).to_csv(profile_path, index=False)
+            logger.info(f"Saved forecast data to {profile_path}")
 
             # Metadata
             metadata = {
@@ -338,7 +507,9 @@ class LoadProfileGenerator:
                 'start_fy': forecast_data_dict.get('start_fy'), 'end_fy': forecast_data_dict.get('end_fy'),
                 'frequency': forecast_data_dict.get('frequency'),
                 'validation_summary': forecast_data_dict.get('validation'),
-                'file_info': get_file_info(csv_path), # get_file_info needs Path
+                'output_format': {'columns': EXPORT_COLUMNS, 'demand_unit': 'kW', 'total_hours': len(series),
+                                  'storage_format': profile_path.suffix.lstrip('.')},
+                'file_info': get_file_info(profile_path), # get_file_info needs Path
                 'source_config_details': forecast_data_dict.get('metadata', {}).get('method_config') # Or pass full config
             }
             metadata_path = self.config_path / f"{profile_id}_metadata.json"
@@ -347,7 +518,7 @@ class LoadProfileGenerator:
             logger.info(f"Saved forecast metadata to {metadata_path}")
 
             return {
-                'profile_id': profile_id, 'csv_path': str(csv_path),
+                'profile_id': profile_id, 'file_path': str(profile_path),
                 'metadata_path': str(metadata_path), 'file_size_mb': metadata['file_info']['size_mb']
             }
         except Exception as e:
@@ -364,12 +535,12 @@ class LoadProfileGenerator:
             try:
                 with open(metadata_file, 'r') as f:
                     meta = json.load(f)
-                # Add file info for the CSV if it exists
-                csv_path = self.results_path / f"{meta['profile_id']}.csv"
-                if csv_path.exists():
-                    meta['csv_file_info'] = get_file_info(csv_path)
+                # Add file info for the stored profile if it exists
+                profile_path = get_profile_path(self.results_path, meta['profile_id'])
+                if profile_path is not None:
+                    meta['csv_file_info'] = get_file_info(profile_path)
                 else:
-                    meta['csv_file_info'] = {"exists": False, "message": "CSV file not found."}
+                    meta['csv_file_info'] = {"exists": False, "message": "Profile file not found."}
                 profiles_info.append(meta)
             except Exception as e:
                 logger.warning(f"Could not load metadata from {metadata_file.name}: {e}")
@@ -380,9 +551,9 @@ class LoadProfileGenerator:
     def get_profile_data(self, profile_id: str) -> Dict[str, Any]:
         """Retrieves data and metadata for a specific saved profile."""
         metadata_path = self.config_path / f"{profile_id}_metadata.json"
-        csv_path = self.results_path / f"{profile_id}.csv"
+        profile_path = get_profile_path(self.results_path, profile_id)
 
-        if not metadata_path.exists() or not csv_path.exists():
+        if not metadata_path.exists() or profile_path is None:
             raise ResourceNotFoundError(f"Profile '{profile_id}' data or metadata not found.")
         try:
             with open(metadata_path, 'r') as f:
@@ -390,7 +561,7 @@ class LoadProfileGenerator:
 
             # For large profiles, consider returning a sample or paginated data
             # For now, loading full data.
-            df = pd.read_csv(csv_path)
+            df = read_profile_frame(profile_path)
 
             return {
                 "profile_id": profile_id,
@@ -401,6 +572,24 @@ class LoadProfileGenerator:
             logger.error(f"Error loading profile data for '{profile_id}': {e}")
             raise ProcessingError(f"Could not load profile data: {str(e)}")
 
+    def get_profile_file_path(self, profile_id: str) -> Optional[str]:
+        """CSV file of a saved profile for download; binary profiles are exported on demand."""
+        csv_path = export_profile_csv(self.results_path, profile_id)
+        return str(csv_path) if csv_path is not None else None
+
+    def delete_profile(self, profile_id: str) -> Dict[str, Any]:
+        """Deletes a saved profile in every stored format, its CSV export and its metadata."""
+        try:
+            files_deleted = delete_profile_files(self.results_path, profile_id)
+            metadata_path = self.config_path / f"{profile_id}_metadata.json"
+            if metadata_path.exists():
+                metadata_path.unlink()
+                files_deleted.append(metadata_path.name)
+            return {'success': True, 'files_deleted': files_deleted}
+        except OSError as e:
+            logger.error(f"Error deleting profile '{profile_id}': {e}")
+            return {'success': False, 'error': str(e)}
+
 # Note: The original file had many more private helper methods for analysis and comparison.
 # These would need to be similarly adapted (logging, Path objects, error handling)
 # if they are to be part of this refactored LoadProfileGenerator class.
@@ -0,0 +1,107 @@
+# models/disk_cache.py
+"""
+Size-bounded, least-recently-used directory cache shared by the model caches.
+
+Each entry is one file named <key><extension> in the cache directory. Writes go
+through a temporary file and os.replace so concurrent workers never read a
+partial entry, reads refresh the entry's mtime, and once the directory grows past
+max_bytes the entries with the oldest mtime are deleted first. Subclasses only
+define the file extension and how an entry is serialized and read back.
+"""
+import logging
+import os
+import tempfile
+from typing import Callable, IO
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLRUCache:
+    """Base class for process-safe, mtime-LRU caches of one file per key"""
+
+    extension = ''
+    label = 'cache'
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{self.extension}")
+
+    def _touch(self, path: str) -> None:
+        """Refresh an entry's LRU position after a hit"""
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _write_atomic(self, key: str, write: Callable[[IO], None], binary: bool = False) -> bool:
+        """
+        Write an entry through a temp file and os.replace, then enforce the size limit.
+        Failures are only logged and the temp file never outlives the call.
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            if binary:
+                with os.fdopen(fd, 'wb') as f:
+                    write(f)
+            else:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    write(f)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logger.warning(f"Could not write {self.label} entry {key}: {e}")
+            return False
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                self._remove(tmp_path)
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the directory fits in max_bytes"""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for item in it:
+                    if not item.name.endswith(self.extension):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, item.path))
+                    total += stat.st_size
+        except OSError as e:
+            logger.warning(f"Could not scan {self.label} {self.cache_dir}: {e}")
+            return
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            self._remove(path)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self) -> int:
+        """Remove every entry, returning how many were deleted"""
+        removed = 0
+        with os.scandir(self.cache_dir) as it:
+            for item in it:
+                if item.name.endswith(self.extension):
+                    self._remove(item.path)
+                    removed += 1
+        return removed
@@ -0,0 +1,82 @@
+# models/forecast_cache.py
+"""
+Persistent on-disk cache for fitted time-series forecasts.
+
+Fitting SARIMAX and Prophet dominates a demand forecast run and its output only
+depends on the (Year, value) series, the model specification and the target year.
+Entries are small JSON files named by a SHA-256 of those inputs, so re-running a
+scenario after changing unrelated settings (WAM window, T&D losses, ...) reuses
+every fitted forecast. The directory is trimmed least-recently-used first once it
+grows past a size limit.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from models.disk_cache import DiskLRUCache
+from utils.constants import MODEL_CACHE
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_dir(forecast_path: str) -> str:
+    """Project-level cache directory for a scenario folder <project>/results/demand_projection/<scenario>"""
+    results_dir = os.path.dirname(os.path.dirname(os.path.abspath(forecast_path)))
+    return os.path.join(results_dir, MODEL_CACHE['DIR_NAME'], MODEL_CACHE['TIME_SERIES_SUBDIR'])
+
+
+class TimeSeriesForecastCache(DiskLRUCache):
+    """Size-bounded, process-safe cache of forecast arrays keyed by series fingerprint"""
+
+    extension = '.json'
+    label = 'forecast cache'
+
+    def __init__(self, cache_dir: str, max_bytes: int = MODEL_CACHE['TIME_SERIES_MAX_BYTES']):
+        super().__init__(cache_dir, max_bytes)
+
+    @staticmethod
+    def make_key(years, values, model_spec: Dict[str, Any], target_year: int) -> str:
+        """Hash the (Year, value) series together with the model spec and target year"""
+        payload = {
+            'version': CACHE_FORMAT_VERSION,
+            'years': [int(y) for y in years],
+            'values': [float(v) for v in values],
+            'model_spec': model_spec,
+            'target_year': int(target_year)
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached forecast or None; a hit refreshes the entry's LRU position"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            self._touch(path)
+            return np.asarray(entry['forecast'], dtype=float)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable forecast cache entry {key}: {e}")
+            self._remove(path)
+            return None
+
+    def put(self, key: str, forecast, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Store a forecast atomically, then enforce the size limit; failures are only logged"""
+        def write(f):
+            entry = {
+                'forecast': [float(v) for v in np.asarray(forecast, dtype=float)],
+                'metadata': metadata or {},
+                'created': time.time()
+            }
+            json.dump(entry, f)
+
+        self._write_atomic(key, write)
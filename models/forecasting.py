@@ -820,7 +820,276 @@
 #             "used_existing_data": False,
 #             "required_columns_missing": True
 #         }
-def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_models=None, model_params=None, target_year=2037, exclude_covid=True, progress_callback=None):
+SARIMAX_ORDER = (1, 1, 1)
+
+
+def _time_series_model_spec():
+    """Model specification hashed into time series forecast fingerprints"""
+    import statsmodels
+    import prophet
+    return {
+        'sarimax_order': list(SARIMAX_ORDER),
+        'prophet': {'yearly_seasonality': True},
+        'freq': 'Y',
+        'statsmodels_version': getattr(statsmodels, '__version__', None),
+        'prophet_version': getattr(prophet, '__version__', None)
+    }
+
+
+def series_fingerprint(df, col, target_year):
+    """
+    Fingerprint of the (Year, value) series that time_series_forecast would fit.
+    
+    Returns None when the series would not reach SARIMAX/Prophet (models not
+    installed, fewer than 2 points or nothing left to forecast).
+    """
+    import pandas as pd
+    from models.forecast_cache import TimeSeriesForecastCache
+    
+    try:
+        model_spec = _time_series_model_spec()
+    except ImportError:
+        return None
+    
+    series = df[['Year', col]].copy()
+    series[col] = pd.to_numeric(series[col], errors='coerce')
+    series = series.dropna()
+    if len(series) < 2 or target_year <= series['Year'].max():
+        return None
+    
+    return TimeSeriesForecastCache.make_key(series['Year'], series[col], model_spec, target_year)
+
+
+def time_series_forecast(df, col, target_year, ts_cache=None, shared_forecasts=None, sheet_name=None):
+    """
+    Time Series Decomposition and Forecasting using SARIMA and Prophet.
+    
+    Args:
+        df (pd.DataFrame): Data containing 'Year' and the column to forecast
+        col (str): Column to forecast
+        target_year (int): Last year to forecast
+        ts_cache (TimeSeriesForecastCache, optional): Persistent cache of fitted forecasts
+        shared_forecasts (dict, optional): Forecasts already computed for this scenario,
+            keyed by series_fingerprint
+        sheet_name (str, optional): Sector name, recorded in cache metadata
+    
+    Returns:
+        np.ndarray: Forecast values for the years after the last observed year
+    """
+    import numpy as np
+    import pandas as pd
+    from sklearn.linear_model import LinearRegression
+    
+    try:
+        # Attempt to import necessary packages
+        try:
+            from statsmodels.tsa.statespace.sarimax import SARIMAX
+            from prophet import Prophet
+        except ImportError:
+            print("Warning: Could not import Prophet or SARIMAX. Using simple forecasting method.")
+            # Use simple linear trend as fallback
+            df = df.copy()
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+            df = df[['Year', col]].dropna()
+            
+            if len(df) < 2:
+                print(f"Insufficient data points for column {col}, using zeros")
+                future_years = range(df['Year'].max() + 1 if not df.empty else 2023, target_year + 1)
+                return np.zeros(len(future_years))
+            
+            X = df['Year'].values.reshape(-1, 1)
+            y = df[col].values
+            
+            model = LinearRegression()
+            model.fit(X, y)
+            
+            future_years = np.array(range(df['Year'].max() + 1, target_year + 1)).reshape(-1, 1)
+            if len(future_years) == 0:  # No years to forecast
+                return np.array([])
+                
+            forecasted_values = model.predict(future_years)
+            return forecasted_values
+        
+        df = df.copy()
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+        df = df[['Year', col]].dropna()
+        
+        if len(df) < 2:
+            print(f"Insufficient data points for column {col}, using zeros")
+            future_years = range(df['Year'].max() + 1 if not df.empty else 2023, target_year + 1)
+            return np.zeros(len(future_years))
+        
+        # Check if we already have data up to the target year
+        if target_year <= df['Year'].max():
+            print(f'Already have {col} data up to {df["Year"].max()}')
+            # Find which years are already covered
+            existing_years = df['Year'].tolist()
+            future_years = [y for y in range(df['Year'].min(), target_year + 1) if y not in existing_years]
+            
+            if not future_years:  # If no future years to forecast
+                return np.array([])  # Return empty array since nothing to forecast
+        
+        # Determine years to forecast
+        last_year = df['Year'].max()
+        forecast_years = range(last_year + 1, target_year + 1)
+        
+        if not forecast_years:  # Nothing to forecast
+            return np.array([])
+        
+        # Prepare time series data
+        ts_data = pd.Series(
+            df[col].values,
+            index=pd.date_range(
+                start=f"{df['Year'].min()}-01-01",
+                periods=len(df),
+                freq='Y'
+            )
+        ).astype(float)
+        
+        # Reuse a forecast of the same series, models and horizon from this scenario or a previous run
+        cache_key = series_fingerprint(df, col, target_year)
+        if shared_forecasts and cache_key in shared_forecasts:
+            print(f"Using scenario-level forecast for {col}")
+            return np.asarray(shared_forecasts[cache_key], dtype=float)
+        if ts_cache is not None:
+            cached_forecast = ts_cache.get(cache_key)
+            if cached_forecast is not None and len(cached_forecast) == len(forecast_years):
+                print(f"Using cached time series forecast for {col}")
+                return cached_forecast
+        
+        # Try SARIMA model
+        sarima_forecast = None
+        try:
+            model = SARIMAX(ts_data, order=SARIMAX_ORDER)
+            fitted = model.fit(disp=False)
+            sarima_forecast = fitted.forecast(steps=len(forecast_years))
+        except Exception as e:
+            print(f"SARIMA failed for {col}: {str(e)}")
+        
+        # Try Prophet model
+        prophet_forecast = None
+        try:
+            prophet_data = pd.DataFrame({
+                'ds': ts_data.index,
+                'y': ts_data.values
+            })
+            prophet_model = Prophet(yearly_seasonality=True)
+            prophet_model.fit(prophet_data)
+            future_dates = prophet_model.make_future_dataframe(
+                periods=len(forecast_years),
+                freq='Y'
+            )
+            prophecy = prophet_model.predict(future_dates)
+            prophet_forecast = prophecy['yhat'].tail(len(forecast_years)).values
+        except Exception as e:
+            print(f"Prophet failed for {col}: {str(e)}")
+        
+        # Decide which forecast to use
+        if sarima_forecast is not None and prophet_forecast is not None:
+            # Use average of both forecasts
+            y_predict = (sarima_forecast.values + prophet_forecast) / 2
+        elif sarima_forecast is not None:
+            y_predict = sarima_forecast.values
+        elif prophet_forecast is not None:
+            y_predict = prophet_forecast
+        else:
+            # Both models failed, use linear regression as fallback
+            print(f"Using linear regression fallback for {col}")
+            X = df['Year'].values.reshape(-1, 1)
+            y = df[col].values
+            
+            model = LinearRegression()
+            model.fit(X, y)
+            
+            if len(forecast_years) == 0:
+                return np.array([])
+                
+            future_years = np.array(range(last_year + 1, target_year + 1)).reshape(-1, 1)
+            y_predict = model.predict(future_years)
+        
+        # Only fitted SARIMAX/Prophet results are worth persisting
+        if ts_cache is not None and (sarima_forecast is not None or prophet_forecast is not None):
+            ts_cache.put(cache_key, y_predict, {'column': col, 'sector': sheet_name})
+        
+        return y_predict
+    
+    except Exception as e:
+        print(f"Error in forecasting {col}: {str(e)}")
+        # Return zeros as a safe fallback
+        future_years = range(df['Year'].max() + 1 if 'Year' in df.columns and not df.empty else 2023, 
+                             target_year + 1)
+        return np.zeros(len(future_years))
+
+
+
+def forecast_shared_series(sector_frames, target_year, columns_by_sector=None, forecast_path=None, ts_cache_dir=None):
+    """
+    Forecast each distinct independent-variable series of a scenario once.
+    
+    Economic indicators are copied into several sector sheets, so the same series
+    would otherwise be fitted again inside every sector. The returned forecasts are
+    passed to Main_forecasting_function(shared_forecasts=...) for every sector.
+    
+    Args:
+        sector_frames (dict): Sector name -> input DataFrame
+        target_year (int): Target year of the scenario
+        columns_by_sector (dict, optional): Sector name -> independent variables used;
+            sectors without an entry use every column except Year/Electricity/Connected Load
+        forecast_path (str, optional): Scenario folder, used to locate the default cache
+        ts_cache_dir (str, optional): Explicit cache directory
+    
+    Returns:
+        dict: series_fingerprint -> forecast values
+    """
+    from models.forecast_cache import TimeSeriesForecastCache, default_cache_dir
+    
+    columns_by_sector = columns_by_sector or {}
+    distinct_series = {}
+    total_uses = 0
+    
+    for sector_name, frame in sector_frames.items():
+        if frame is None or 'Year' not in frame.columns:
+            continue
+        
+        # Sectors that already reach the target year are not forecast at all
+        if 'Electricity' in frame.columns:
+            electricity = frame[['Year', 'Electricity']].dropna()
+            if not electricity.empty and electricity['Year'].max() >= target_year:
+                continue
+        
+        columns = columns_by_sector.get(sector_name) or [
+            c for c in frame.columns if c not in ('Year', 'Electricity', 'Connected Load')
+        ]
+        for col in columns:
+            if col not in frame.columns:
+                continue
+            key = series_fingerprint(frame, col, target_year)
+            if key is None:
+                continue
+            distinct_series.setdefault(key, (frame, col))
+            total_uses += 1
+    
+    if not distinct_series:
+        return {}
+    
+    ts_cache = None
+    if ts_cache_dir or forecast_path:
+        try:
+            ts_cache = TimeSeriesForecastCache(ts_cache_dir or default_cache_dir(forecast_path))
+        except OSError as e:
+            print(f"Warning: Time series forecast cache disabled: {e}")
+    
+    print(f"Forecasting {len(distinct_series)} distinct independent series used {total_uses} times across sectors")
+    shared_forecasts = {}
+    for key, (frame, col) in distinct_series.items():
+        forecast = time_series_forecast(frame, col, target_year, ts_cache=ts_cache)
+        if forecast is not None and len(forecast) > 0:
+            shared_forecasts[key] = forecast
+    
+    return shared_forecasts
+
+
+def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_models=None, model_params=None, target_year=2037, exclude_covid=True, progress_callback=None, ts_cache_dir=None, shared_forecasts=None):
     """
     FIXED: Main forecasting function with progress reporting.
     
@@ -833,6 +1102,10 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
         target_year (int, optional): Target year for forecast. Defaults to 2037.
         exclude_covid (bool, optional): Whether to exclude COVID years. Defaults to True.
         progress_callback (callable, optional): Callback function for progress updates
+        ts_cache_dir (str, optional): Directory for cached SARIMAX/Prophet forecasts.
+            Defaults to <project>/results/cache/time_series_forecasts.
+        shared_forecasts (dict, optional): Scenario-level forecasts of shared independent
+            series from forecast_shared_series, keyed by series_fingerprint.
     
     Returns:
         dict: Results and status information
@@ -841,10 +1114,10 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
     import warnings
     import numpy as np
     import pandas as pd
-    from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_percentage_error
-    from sklearn.linear_model import LinearRegression
-    from sklearn.model_selection import GridSearchCV, TimeSeriesSplit
     import xlsxwriter
+    from models.ols_engine import OLSProblem, fit_ols_batch
+    from models.forecast_cache import TimeSeriesForecastCache, default_cache_dir
+    from utils.forecast_store import write_sector_sidecar
     
     # FIXED: Add progress reporting helper
     def report_progress(step, total_steps, message, sector_name=sheet_name):
@@ -877,6 +1150,13 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
     SCENARIO_NAME = forecast_path
     TARGET_YEAR = target_year
     
+    # Fitted SARIMAX/Prophet forecasts are reused across runs and scenarios
+    try:
+        ts_cache = TimeSeriesForecastCache(ts_cache_dir or default_cache_dir(forecast_path))
+    except OSError as e:
+        print(f"Warning: Time series forecast cache disabled: {e}")
+        ts_cache = None
+    
     # FIXED: Define total steps for progress tracking
     TOTAL_STEPS = 12  # Approximate number of major steps
     current_step = 0
@@ -918,6 +1198,7 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
                 report_progress(current_step, TOTAL_STEPS, "Saving existing data to Excel")
                 
                 # Save to Excel with all required sheets
+                sheets = {'Inputs': main_df, 'Results': result_df}
                 with pd.ExcelWriter(f'{SCENARIO_NAME}/{sheet_name}.xlsx', engine='xlsxwriter') as writer:
                     main_df.to_excel(writer, sheet_name='Inputs', index=False)
                     result_df.to_excel(writer, sheet_name='Results', index=False)
@@ -935,9 +1216,13 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
                             elec_corr = elec_corr[elec_corr['Variable'] != 'Electricity']  # Remove self-correlation
                             elec_corr = elec_corr.sort_values('Correlation_with_Electricity', ascending=False)
                             elec_corr.to_excel(writer, sheet_name='Correlations', index=False)
+                            sheets['Correlations'] = elec_corr
                     except Exception as e:
                         print(f"Error creating correlation sheet: {e}")
                 
+                # Columnar copy for readers, written after the workbook so it is never older
+                write_sector_sidecar(SCENARIO_NAME, sheet_name, sheets)
+                
                 current_step = TOTAL_STEPS
                 report_progress(current_step, TOTAL_STEPS, "Completed using existing data")
                 
@@ -1113,234 +1398,48 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
             
             return X_train, X_test, y_train, y_test, X_train_slr, X_test_slr, df_test, X, y, X_slr, mlr_independent_vars
         
-        def train_models(X_train, X_train_slr, y_train, models_to_train=None):
-            """Train models using GridSearchCV with TimeSeriesSplit."""
-            param_grids = {
-                'MLR': {'fit_intercept': [True, False]},
-                'SLR': {'fit_intercept': [True, False]}
-            }
+        def train_models(X_train, X_train_slr, y_train, models_to_train=None,
+                         X_test=None, X_test_slr=None, y_test=None, X=None, X_slr=None, y=None):
+            """
+            Train MLR/SLR with the batched closed-form OLS engine.
             
+            fit_intercept is cross-validated over TimeSeriesSplit folds exactly as
+            GridSearchCV did; the fold fits, the training-split fit used for test
+            metrics and the full-history fit used for forecasting all come from a
+            single batched solve, so no model is refitted afterwards.
+            """
             # Determine which models to train
             if models_to_train is None:
                 models_to_train = ['MLR', 'SLR']
             elif isinstance(models_to_train, str):
                 models_to_train = [models_to_train]
-                
+            
             # Ensure we have enough samples for cross-validation
             n_splits = min(5, len(X_train) - 1)  # Ensure at least 1 sample per fold
             if n_splits < 2:
                 print("Warning: Not enough samples for cross-validation. Using default parameters.")
-                models = {}
-                
-                if 'MLR' in models_to_train and X_train.shape[0] > 0:
-                    print(f"Training MLR with {X_train.shape[0]} samples")
-                    mlr = LinearRegression()
-                    mlr.fit(X_train, y_train)
-                    models['MLR'] = mlr
-                
-                if 'SLR' in models_to_train and X_train_slr.shape[0] > 0:
-                    print(f"Training SLR with {X_train_slr.shape[0]} samples")
-                    slr = LinearRegression()
-                    slr.fit(X_train_slr, y_train)
-                    models['SLR'] = slr
-                
-                return models
             
-            # If we have enough samples, use cross-validation
-            tscv = TimeSeriesSplit(n_splits=n_splits)
-            models = {}
-            
-            # Train models as requested
-            if 'MLR' in models_to_train and X_train.shape[0] > 0 and X_train.shape[1] > 0:
+            problems = []
+            if 'MLR' in models_to_train and X_train.shape[0] > 0 and (n_splits < 2 or X_train.shape[1] > 0):
                 print(f"Training Multiple Linear Regression for {sheet_name} with {X_train.shape[0]} samples and {X_train.shape[1]} features")
-                try:
-                    mlr_grid = GridSearchCV(
-                        LinearRegression(), 
-                        param_grids['MLR'],
-                        cv=tscv, 
-                        scoring='r2'
-                    )
-                    mlr_grid.fit(X_train, y_train)
-                    models['MLR'] = mlr_grid
-                    print(f"MLR training complete. Best params: {mlr_grid.best_params_}")
-                except Exception as e:
-                    print(f"Error training MLR: {str(e)}")
-                    print("Using default parameters for MLR.")
-                    mlr = LinearRegression()
-                    mlr.fit(X_train, y_train)
-                    models['MLR'] = mlr
+                problems.append(OLSProblem('MLR', X_train, y_train, X_test, y_test, X, y))
             
             if 'SLR' in models_to_train and X_train_slr.shape[0] > 0:
                 print(f"Training Simple Linear Regression for {sheet_name} with {X_train_slr.shape[0]} samples")
-                try:
-                    slr_grid = GridSearchCV(
-                        LinearRegression(), 
-                        param_grids['SLR'],
-                        cv=tscv, 
-                        scoring='r2'
-                    )
-                    slr_grid.fit(X_train_slr, y_train)
-                    models['SLR'] = slr_grid
-                    print(f"SLR training complete. Best params: {slr_grid.best_params_}")
-                except Exception as e:
-                    print(f"Error training SLR: {str(e)}")
-                    print("Using default parameters for SLR.")
-                    slr = LinearRegression()
-                    slr.fit(X_train_slr, y_train)
-                    models['SLR'] = slr
-            
-            return models
-        
-        def evaluate_model(y_true, y_pred):
-            """Evaluate model performance using various metrics."""
-            if len(y_true) == 0 or len(y_pred) == 0:
-                return {
-                    'MSE': np.nan,
-                    'R²': np.nan,
-                    'MAPE (%)': np.nan
-                }
-                
-            mse = mean_squared_error(y_true, y_pred)
-            r2 = r2_score(y_true, y_pred)
+                problems.append(OLSProblem('SLR', X_train_slr, y_train, X_test_slr, y_test, X_slr, y))
             
-            # Avoid division by zero in MAPE calculation
-            if (y_true == 0).any():
-                mape = np.nan
-            else:
-                mape = mean_absolute_percentage_error(y_true, y_pred) * 100
+            models = {}
+            for result in fit_ols_batch(problems):
+                models[result.name] = result
+                if result.cross_validated:
+                    print(f"{result.name} training complete. Best params: {result.best_params_}")
             
-            return {
-                'MSE': mse,
-                'R²': r2,
-                'MAPE (%)': mape
-            }
+            return models
         
-        def time_series_forecast(df, col, target_year=TARGET_YEAR):
-            """Time Series Decomposition and Forecasting using SARIMA and Prophet."""
-            try:
-                # Attempt to import necessary packages
-                try:
-                    from statsmodels.tsa.statespace.sarimax import SARIMAX
-                    from prophet import Prophet
-                except ImportError:
-                    print("Warning: Could not import Prophet or SARIMAX. Using simple forecasting method.")
-                    # Use simple linear trend as fallback
-                    df = df.copy()
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                    df = df[['Year', col]].dropna()
-                    
-                    if len(df) < 2:
-                        print(f"Insufficient data points for column {col}, using zeros")
-                        future_years = range(df['Year'].max() + 1 if not df.empty else 2023, target_year + 1)
-                        return np.zeros(len(future_years))
-                    
-                    X = df['Year'].values.reshape(-1, 1)
-                    y = df[col].values
-                    
-                    model = LinearRegression()
-                    model.fit(X, y)
-                    
-                    future_years = np.array(range(df['Year'].max() + 1, target_year + 1)).reshape(-1, 1)
-                    if len(future_years) == 0:  # No years to forecast
-                        return np.array([])
-                        
-                    forecasted_values = model.predict(future_years)
-                    return forecasted_values
-                
-                df = df.copy()
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-                df = df[['Year', col]].dropna()
-                
-                if len(df) < 2:
-                    print(f"Insufficient data points for column {col}, using zeros")
-                    future_years = range(df['Year'].max() + 1 if not df.empty else 2023, target_year + 1)
-                    return np.zeros(len(future_years))
-                
-                # Check if we already have data up to the target year
-                if target_year <= df['Year'].max():
-                    print(f'Already have {col} data up to {df["Year"].max()}')
-                    # Find which years are already covered
-                    existing_years = df['Year'].tolist()
-                    future_years = [y for y in range(df['Year'].min(), target_year + 1) if y not in existing_years]
-                    
-                    if not future_years:  # If no future years to forecast
-                        return np.array([])  # Return empty array since nothing to forecast
-                
-                # Determine years to forecast
-                last_year = df['Year'].max()
-                forecast_years = range(last_year + 1, target_year + 1)
-                
-                if not forecast_years:  # Nothing to forecast
-                    return np.array([])
-                
-                # Prepare time series data
-                ts_data = pd.Series(
-                    df[col].values,
-                    index=pd.date_range(
-                        start=f"{df['Year'].min()}-01-01",
-                        periods=len(df),
-                        freq='Y'
-                    )
-                ).astype(float)
-                
-                # Try SARIMA model
-                sarima_forecast = None
-                try:
-                    model = SARIMAX(ts_data, order=(1, 1, 1))
-                    fitted = model.fit(disp=False)
-                    sarima_forecast = fitted.forecast(steps=len(forecast_years))
-                except Exception as e:
-                    print(f"SARIMA failed for {col}: {str(e)}")
-                
-                # Try Prophet model
-                prophet_forecast = None
-                try:
-                    prophet_data = pd.DataFrame({
-                        'ds': ts_data.index,
-                        'y': ts_data.values
-                    })
-                    prophet_model = Prophet(yearly_seasonality=True)
-                    prophet_model.fit(prophet_data)
-                    future_dates = prophet_model.make_future_dataframe(
-                        periods=len(forecast_years),
-                        freq='Y'
-                    )
-                    prophecy = prophet_model.predict(future_dates)
-                    prophet_forecast = prophecy['yhat'].tail(len(forecast_years)).values
-                except Exception as e:
-                    print(f"Prophet failed for {col}: {str(e)}")
-                
-                # Decide which forecast to use
-                if sarima_forecast is not None and prophet_forecast is not None:
-                    # Use average of both forecasts
-                    y_predict = (sarima_forecast.values + prophet_forecast) / 2
-                elif sarima_forecast is not None:
-                    y_predict = sarima_forecast.values
-                elif prophet_forecast is not None:
-                    y_predict = prophet_forecast
-                else:
-                    # Both models failed, use linear regression as fallback
-                    print(f"Using linear regression fallback for {col}")
-                    X = df['Year'].values.reshape(-1, 1)
-                    y = df[col].values
-                    
-                    model = LinearRegression()
-                    model.fit(X, y)
-                    
-                    if len(forecast_years) == 0:
-                        return np.array([])
-                        
-                    future_years = np.array(range(last_year + 1, target_year + 1)).reshape(-1, 1)
-                    y_predict = model.predict(future_years)
-                
-                return y_predict
-            
-            except Exception as e:
-                print(f"Error in forecasting {col}: {str(e)}")
-                # Return zeros as a safe fallback
-                future_years = range(df['Year'].max() + 1 if 'Year' in df.columns and not df.empty else 2023, 
-                                     target_year + 1)
-                return np.zeros(len(future_years))
+        def time_series_forecast_sector(df, col, target_year=TARGET_YEAR):
+            """Time series forecast for this sector, reusing scenario-level and cached forecasts."""
+            return time_series_forecast(df, col, target_year, ts_cache=ts_cache,
+                                        shared_forecasts=shared_forecasts, sheet_name=sheet_name)
         
         def save_results(sheet_name, main_df, result_df_final, evaluation_test_df, models, X_forecast, independent_variables):
             """Save results to Excel file."""
@@ -1386,22 +1485,27 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
             
             # Save to Excel
             try:
+                sheets = {'Inputs': df, 'Results': result_df_final}
+                
+                # Save correlation with Electricity
+                if not elec_corr.empty:
+                    sheets['Correlations'] = elec_corr
+                
+                # Save other metadata
+                if isinstance(X_forecast, pd.DataFrame) and not X_forecast.empty:
+                    sheets['Independent Parameters'] = X_forecast
+                
+                if isinstance(evaluation_test_df, pd.DataFrame) and not evaluation_test_df.empty:
+                    sheets['Test Results'] = evaluation_test_df
+                
                 with pd.ExcelWriter(f'{SCENARIO_NAME}/{sheet_name}.xlsx', engine='xlsxwriter') as writer:
-                    df.to_excel(writer, sheet_name='Inputs', index=False)
-                    result_df_final.to_excel(writer, sheet_name='Results', index=False)
-                    
-                    # Save correlation with Electricity
-                    if not elec_corr.empty:
-                        elec_corr.to_excel(writer, sheet_name='Correlations', index=False)
-                    
-                    # Save other metadata
-                    if isinstance(X_forecast, pd.DataFrame) and not X_forecast.empty:
-                        X_forecast.to_excel(writer, sheet_name='Independent Parameters', index=False)
-                    
-                    if isinstance(evaluation_test_df, pd.DataFrame) and not evaluation_test_df.empty:
-                        evaluation_test_df.to_excel(writer, sheet_name='Test Results', index=False)
+                    for target_sheet, sheet_df in sheets.items():
+                        sheet_df.to_excel(writer, sheet_name=target_sheet, index=False)
                 
                 print(f"Results saved to {SCENARIO_NAME}/{sheet_name}.xlsx")
+                
+                # Columnar copy for readers, written after the workbook so it is never older
+                write_sector_sidecar(SCENARIO_NAME, sheet_name, sheets)
             except Exception as e:
                 print(f"Error saving Excel file: {str(e)}")
 
@@ -1419,7 +1523,9 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
             report_progress(current_step, TOTAL_STEPS, f"Training models: {selected_models}")
             
             # Train the selected models
-            models = train_models(X_train, X_train_slr, y_train, selected_models)
+            models = train_models(X_train, X_train_slr, y_train, selected_models,
+                                  X_test=X_test, X_test_slr=X_test_slr, y_test=y_test,
+                                  X=X, X_slr=X_slr, y=y)
             
             # Generate future predictions
             df_train = main_df.copy()
@@ -1477,7 +1583,7 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
                         # Need to forecast missing values
                         missing_years = [year for year in future_years if year > col_max_year]
                         if missing_years:
-                            y_predict_time = time_series_forecast(main_df, col, TARGET_YEAR)
+                            y_predict_time = time_series_forecast_sector(main_df, col, TARGET_YEAR)
                             
                             if y_predict_time is not None and len(y_predict_time) > 0:
                                 # Map predictions to corresponding years
@@ -1498,7 +1604,7 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
             # This is used for TimeSeries model
             electricity_forecast = None
             if 'TimeSeries' in selected_models:
-                electricity_forecast = time_series_forecast(main_df, 'Electricity', TARGET_YEAR)
+                electricity_forecast = time_series_forecast_sector(main_df, 'Electricity', TARGET_YEAR)
                 if electricity_forecast is not None and len(electricity_forecast) > 0:
                     # Store it for later use
                     X_test1['TimeSeries'] = np.zeros(len(X_test1))
@@ -1545,12 +1651,7 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
             # Make predictions for each model
             if 'MLR' in models and 'MLR' in selected_models:
                 try:
-                    mlr_regressor = models['MLR']
-                    if hasattr(mlr_regressor, 'best_params_'):
-                        mlr_params = mlr_regressor.best_params_
-                        mlr_regressor = LinearRegression(**mlr_params)
-                        mlr_regressor.fit(X, y)
-                    y_pred_mlr = mlr_regressor.predict(X_forecast_mlr)
+                    y_pred_mlr = models['MLR'].predict(X_forecast_mlr)
                     result_df_future['MLR'] = y_pred_mlr
                 except Exception as e:
                     print(f"Error generating MLR predictions: {str(e)}")
@@ -1559,12 +1660,7 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
             
             if 'SLR' in models and 'SLR' in selected_models:
                 try:
-                    slr_regressor = models['SLR']
-                    if hasattr(slr_regressor, 'best_params_'):
-                        slr_params = slr_regressor.best_params_
-                        slr_regressor = LinearRegression(**slr_params)
-                        slr_regressor.fit(X_slr, y)
-                    y_pred_slr = slr_regressor.predict(X_forecast_slr)
+                    y_pred_slr = models['SLR'].predict(X_forecast_slr)
                     result_df_future['SLR'] = y_pred_slr
                 except Exception as e:
                     print(f"Error generating SLR predictions: {str(e)}")
@@ -1632,26 +1728,15 @@ def Main_forecasting_function(sheet_name, forecast_path, main_df, selected_model
                 # Evaluate MLR if available
                 if 'MLR' in models:
                     try:
-                        mlr_regressor = models['MLR']
-                        if hasattr(mlr_regressor, 'best_params_'):
-                            mlr_regressor = LinearRegression(**mlr_regressor.best_params_)
-                            mlr_regressor.fit(X_train, y_train)
-                        y_pred_test_mlr = mlr_regressor.predict(X_test)
-                        evaluation_test_mlr = evaluate_model(y_test, y_pred_test_mlr)
-                        evaluation_results.append({'Model': 'MLR', **evaluation_test_mlr})
+                        # Metrics come from the training-split fit of the batched solve
+                        evaluation_results.append({'Model': 'MLR', **models['MLR'].test_metrics})
                     except Exception as e:
                         print(f"Error evaluating MLR: {str(e)}")
                 
                 # Evaluate SLR if available
                 if 'SLR' in models:
                     try:
-                        slr_regressor = models['SLR']
-                        if hasattr(slr_regressor, 'best_params_'):
-                            slr_regressor = LinearRegression(**slr_regressor.best_params_)
-                            slr_regressor.fit(X_train_slr, y_train)
-                        y_pred_test_slr = slr_regressor.predict(X_test_slr)
-                        evaluation_test_slr = evaluate_model(y_test, y_pred_test_slr)
-                        evaluation_results.append({'Model': 'SLR', **evaluation_test_slr})
+                        evaluation_results.append({'Model': 'SLR', **models['SLR'].test_metrics})
                     except Exception as e:
                         print(f"Error evaluating SLR: {str(e)}")
             
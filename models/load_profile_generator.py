@@ -11,7 +11,10 @@ import numpy as np
 import os
 import json
 import logging
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 import holidays
 
@@ -25,10 +28,103 @@ except ImportError:
 
 from utils.helpers import ensure_directory, get_file_info
 from utils.constants import UNIT_FACTORS, VALIDATION_RULES
+from utils.calendar_features import calendar_features
+from utils.input_snapshot import read_source_identity
+from utils.template_snapshot import load_template_snapshot, save_template_snapshot
 from utils.response_utils import success_response, error_response
+from utils.profile_store import (
+    PARQUET_AVAILABLE as PROFILE_PARQUET_AVAILABLE, DEMAND_COLUMN, EXPORT_COLUMNS, PROFILE_EXTENSION,
+    ProfileStreamWriter, get_profile_path, list_profile_files, read_profile_series, series_to_export_frame, write_profile
+)
+from models.stl_cache import STLDecompositionCache, default_stl_cache_dir
 
 logger = logging.getLogger(__name__)
 
+# STL decomposition engines selectable through stl_params['engine']
+STL_ENGINES = ('exact', 'daily')
+
+# Financial year months in order, April first
+FINANCIAL_MONTH_NAMES = ['Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
+                         'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar']
+
+
+class GenerationCancelled(Exception):
+    """Raised by a progress callback to stop a forecast between generation stages"""
+
+
+def report_progress(progress_callback, stage, message, fraction=None):
+    """
+    Announce the start of a generation stage, or with fraction (0-1) how far a long stage
+    has got; the callback may raise GenerationCancelled
+    """
+    if progress_callback is None:
+        return
+    if fraction is None:
+        progress_callback(stage, message)
+    else:
+        progress_callback(stage, message, fraction)
+
+
+@dataclass(frozen=True, eq=False)
+class HolidayCalendar:
+    """Holidays of one region/subdivision and year range, shared by all generators"""
+    region: str
+    subdiv: str
+    years_range: tuple
+    holidays_df: pd.DataFrame
+    dates: np.ndarray  # Sorted unique datetime64[D]
+
+    @property
+    def empty(self):
+        return self.dates.size == 0
+
+    def is_holiday(self, timestamps):
+        """Boolean array marking timestamps whose calendar date is a holiday (searchsorted lookup)"""
+        index = pd.DatetimeIndex(timestamps)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        days = index.values.astype('datetime64[D]')
+        if self.empty:
+            return np.zeros(len(days), dtype=bool)
+        
+        positions = np.minimum(np.searchsorted(self.dates, days), self.dates.size - 1)
+        return self.dates[positions] == days
+
+
+_holiday_calendar_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _build_holiday_calendar(region, subdiv, years_range):
+    years = range(years_range[0], years_range[1])
+    holiday_calendar = holidays.country_holidays(region, subdiv=subdiv, years=years)
+    
+    holidays_df = pd.DataFrame(
+        [(date, name) for date, name in holiday_calendar.items()],
+        columns=['Date', 'Holiday']
+    )
+    holidays_df['Date'] = pd.to_datetime(holidays_df['Date'])
+    dates = np.unique(holidays_df['Date'].values.astype('datetime64[D]'))
+    
+    logger.info(f"Loaded {len(holidays_df)} holidays for {region}-{subdiv}")
+    return HolidayCalendar(region, subdiv, tuple(years_range), holidays_df, dates)
+
+
+def get_holiday_calendar(region='IN', subdiv='KL', years_range=(2017, 2040)):
+    """
+    Process-wide memoized holiday calendar keyed by (region, subdivision, year range).
+    Failures are not cached, so a later call can retry.
+    """
+    try:
+        with _holiday_calendar_lock:
+            return _build_holiday_calendar(region, subdiv, tuple(years_range))
+    except Exception as e:
+        logger.warning(f"Could not load holidays: {e}")
+        return HolidayCalendar(region, subdiv, tuple(years_range),
+                               pd.DataFrame(columns=['Date', 'Holiday']),
+                               np.array([], dtype='datetime64[D]'))
+
+
 class LoadProfileGenerator:
     """
     Load Profile Generator supporting multiple methods and constraints
@@ -43,34 +139,23 @@ class LoadProfileGenerator:
         ensure_directory(str(self.results_path))
         ensure_directory(str(self.config_path))
         
-        # Initialize holidays for Kerala (can be configured)
-        self.holidays_data = self._initialize_holidays()
+        # Initialize holidays for Kerala (can be configured); shared across instances
+        self.holiday_calendar = get_holiday_calendar()
+        self.holidays_data = self.holiday_calendar.holidays_df
         
         logger.info(f"LoadProfileGenerator initialized for project: {project_path}")
     
     def _initialize_holidays(self, years_range=(2017, 2040), region='IN', subdiv='KL'):
         """Initialize holiday data for the specified region"""
-        try:
-            years = range(years_range[0], years_range[1])
-            holiday_calendar = holidays.country_holidays(region, subdiv=subdiv, years=years)
-            
-            holidays_df = pd.DataFrame(
-                [(date, name) for date, name in holiday_calendar.items()],
-                columns=['Date', 'Holiday']
-            )
-            holidays_df['Date'] = pd.to_datetime(holidays_df['Date'])
-            
-            logger.info(f"Loaded {len(holidays_df)} holidays for {region}-{subdiv}")
-            return holidays_df
-            
-        except Exception as e:
-            logger.warning(f"Could not load holidays: {e}")
-            return pd.DataFrame(columns=['Date', 'Holiday'])
+        return get_holiday_calendar(region, subdiv, years_range).holidays_df
 
     def load_template_data(self, template_file=None):
         """
         Load data from the load curve template Excel file
         
+        The parsed and derived frames are reused from the template snapshot while
+        the workbook is unchanged, so Excel is only parsed after an upload or edit.
+        
         Returns:
             dict: Contains historical_demand, total_demand, monthly_peaks, monthly_load_factors
         """
@@ -80,32 +165,42 @@ class LoadProfileGenerator:
         if not os.path.exists(template_file):
             raise FileNotFoundError(f"Template file not found: {template_file}")
         
+        snapshot = load_template_snapshot(template_file)
+        if snapshot is not None:
+            snapshot['template_info'] = get_file_info(str(template_file))
+            return snapshot
+        
+        # Identify the template before parsing, so a snapshot is only tagged with the file it was read from
+        source = read_source_identity(str(template_file))
+        
         try:
-            # Load required sheets
-            historical_demand = pd.read_excel(template_file, sheet_name='Past_Hourly_Demand')
-            
-            # Try alternative sheet name for Total Demand
-            try:
-                total_demand = pd.read_excel(template_file, sheet_name='Total_Demand')
-            except Exception:
-                logger.info("Could not find 'Total_Demand' sheet, trying 'Total Demand' instead.")
-                total_demand = pd.read_excel(template_file, sheet_name='Total Demand')
-            
-            # Optional sheets
-            monthly_peaks = None
-            monthly_load_factors = None
-            
-            try:
-                monthly_peaks = pd.read_excel(template_file, sheet_name='Monthly_Peak_Demand')
-                logger.info("Monthly_Peak_Demand sheet loaded from template")
-            except:
-                logger.info("Monthly_Peak_Demand sheet not found, will calculate dynamically")
-            
-            try:
-                monthly_load_factors = pd.read_excel(template_file, sheet_name='Monthly_Load_Factors')
-                logger.info("Monthly_Load_Factors sheet loaded from template")
-            except:
-                logger.info("Monthly_Load_Factors sheet not found, will calculate dynamically")
+            # Open the workbook once and parse every sheet from it
+            with pd.ExcelFile(template_file) as workbook:
+                # Load required sheets
+                historical_demand = workbook.parse('Past_Hourly_Demand')
+                
+                # Try alternative sheet name for Total Demand
+                if 'Total_Demand' in workbook.sheet_names:
+                    total_demand = workbook.parse('Total_Demand')
+                else:
+                    logger.info("Could not find 'Total_Demand' sheet, trying 'Total Demand' instead.")
+                    total_demand = workbook.parse('Total Demand')
+                
+                # Optional sheets
+                monthly_peaks = None
+                monthly_load_factors = None
+                
+                if 'Monthly_Peak_Demand' in workbook.sheet_names:
+                    monthly_peaks = workbook.parse('Monthly_Peak_Demand')
+                    logger.info("Monthly_Peak_Demand sheet loaded from template")
+                else:
+                    logger.info("Monthly_Peak_Demand sheet not found, will calculate dynamically")
+                
+                if 'Monthly_Load_Factors' in workbook.sheet_names:
+                    monthly_load_factors = workbook.parse('Monthly_Load_Factors')
+                    logger.info("Monthly_Load_Factors sheet loaded from template")
+                else:
+                    logger.info("Monthly_Load_Factors sheet not found, will calculate dynamically")
             
             # Process historical demand
             historical_demand = self._process_historical_demand(historical_demand)
@@ -127,19 +222,59 @@ class LoadProfileGenerator:
             
             logger.info(f"Template data loaded successfully from {template_file}")
             
-            return {
+            template_data = {
                 'historical_demand': historical_demand,
                 'total_demand': total_demand,
                 'monthly_peaks': monthly_peaks,
                 'monthly_load_factors': monthly_load_factors,
                 'calculated_monthly_peaks': calculated_monthly_peaks,
-                'calculated_load_factors': calculated_load_factors,
-                'template_info': get_file_info(str(template_file))
+                'calculated_load_factors': calculated_load_factors
             }
             
         except Exception as e:
             logger.error(f"Error loading template data: {e}")
             raise ValueError(f"Failed to load template data: {str(e)}")
+        
+        save_template_snapshot(template_file, template_data, source)
+        template_data['template_info'] = get_file_info(str(template_file))
+        return template_data
+
+    def _financial_month_demand_stats(self, historical_data):
+        """
+        Demand sum, mean and max per (financial_year, financial_month) in one groupby pass,
+        restricted to complete financial years (at least 8000 records)
+
+        Returns:
+            tuple: (stats indexed by (financial_year, financial_month), annual totals by financial year)
+        """
+        year_groups = historical_data.groupby('financial_year', sort=False)['demand']
+        year_sizes = year_groups.size()
+        complete_years = year_sizes.index[year_sizes >= 8000]  # Skip incomplete years
+        annual_totals = year_groups.sum().loc[complete_years]
+        
+        complete_data = historical_data[
+            historical_data['financial_year'].isin(complete_years) &
+            historical_data['financial_month'].between(1, 12)
+        ]
+        month_stats = complete_data.groupby(['financial_year', 'financial_month'])['demand'].agg(['sum', 'mean', 'max'])
+        return month_stats, annual_totals
+
+    @staticmethod
+    def _average_by_financial_month(values_by_month, years):
+        """
+        Average a (financial year x financial month) table across years into a single
+        'Average' row with Apr..Mar columns; months never observed are left out
+        """
+        averages = {}
+        if not values_by_month.empty:
+            table = values_by_month.unstack('financial_month').reindex(years)
+            for month in range(1, 13):
+                if month in table.columns:
+                    averages[FINANCIAL_MONTH_NAMES[month - 1]] = table[month].mean()
+        
+        final_df = pd.DataFrame([averages])
+        final_df['Financial_Year'] = 'Average'
+        return final_df
 
     def _calculate_monthly_peaks(self, historical_data):
         """
@@ -155,62 +290,21 @@ class LoadProfileGenerator:
             if historical_data.empty:
                 return None
             
-            # Calculate monthly totals and peaks for each financial year
-            monthly_stats = []
-            
-            for fy in historical_data['financial_year'].unique():
-                fy_data = historical_data[historical_data['financial_year'] == fy]
-                
-                if len(fy_data) < 8000:  # Skip incomplete years
-                    continue
-                
-                # Calculate annual total
-                annual_total = fy_data['demand'].sum()
-                
-                if annual_total <= 0:
-                    continue
-                
-                # Calculate monthly shares and peaks
-                monthly_row = {'Financial_Year': fy}
-                
-                for month in range(1, 13):
-                    month_data = fy_data[fy_data['financial_month'] == month]
-                    
-                    if not month_data.empty:
-                        monthly_total = month_data['demand'].sum()
-                        monthly_peak = month_data['demand'].max()
-                        
-                        # Calculate monthly share
-                        monthly_share = monthly_total / annual_total if annual_total > 0 else 0
-                        
-                        # Store monthly share (this will be used for future scaling)
-                        month_names = ['Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
-                                     'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar']
-                        month_col = month_names[month - 1]
-                        monthly_row[month_col] = monthly_share
-                
-                monthly_stats.append(monthly_row)
+            month_stats, annual_totals = self._financial_month_demand_stats(historical_data)
             
-            if not monthly_stats:
+            # Monthly share of the annual total (this will be used for future scaling)
+            valid_years = annual_totals.index[annual_totals > 0]
+            if len(valid_years) == 0:
                 return None
             
-            # Create DataFrame and average across years
-            monthly_peaks_df = pd.DataFrame(monthly_stats)
+            month_stats = month_stats[month_stats.index.get_level_values('financial_year').isin(valid_years)]
+            year_totals = annual_totals.reindex(month_stats.index.get_level_values('financial_year')).to_numpy()
+            monthly_shares = month_stats['sum'] / year_totals
             
-            # Calculate average monthly shares across all years
-            month_cols = ['Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
-                         'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar']
-            
-            avg_shares = {}
-            for col in month_cols:
-                if col in monthly_peaks_df.columns:
-                    avg_shares[col] = monthly_peaks_df[col].mean()
-            
-            # Create final dataframe with average values
-            final_peaks = pd.DataFrame([avg_shares])
-            final_peaks['Financial_Year'] = 'Average'
+            # Average monthly shares across all years
+            final_peaks = self._average_by_financial_month(monthly_shares, valid_years)
             
-            logger.info(f"Calculated monthly peaks for {len(monthly_stats)} years")
+            logger.info(f"Calculated monthly peaks for {len(valid_years)} years")
             return final_peaks
             
         except Exception as e:
@@ -231,53 +325,21 @@ class LoadProfileGenerator:
             if historical_data.empty:
                 return None
             
-            monthly_lf_stats = []
-            
-            for fy in historical_data['financial_year'].unique():
-                fy_data = historical_data[historical_data['financial_year'] == fy]
-                
-                if len(fy_data) < 8000:  # Skip incomplete years
-                    continue
-                
-                monthly_row = {'Financial_Year': fy}
-                
-                for month in range(1, 13):
-                    month_data = fy_data[fy_data['financial_month'] == month]
-                    
-                    if not month_data.empty:
-                        avg_demand = month_data['demand'].mean()
-                        max_demand = month_data['demand'].max()
-                        
-                        # Calculate load factor
-                        load_factor = avg_demand / max_demand if max_demand > 0 else 0
-                        
-                        month_names = ['Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
-                                     'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar']
-                        month_col = month_names[month - 1]
-                        monthly_row[month_col] = load_factor
-                
-                monthly_lf_stats.append(monthly_row)
+            month_stats, annual_totals = self._financial_month_demand_stats(historical_data)
             
-            if not monthly_lf_stats:
+            if len(annual_totals) == 0:
                 return None
             
-            # Create DataFrame and average across years
-            monthly_lf_df = pd.DataFrame(monthly_lf_stats)
-            
-            # Calculate average load factors across all years
-            month_cols = ['Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
-                         'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar']
-            
-            avg_lf = {}
-            for col in month_cols:
-                if col in monthly_lf_df.columns:
-                    avg_lf[col] = monthly_lf_df[col].mean()
+            # Load factor = average / peak demand, 0 for months without a positive peak
+            monthly_lf = pd.Series(
+                np.where(month_stats['max'] > 0, month_stats['mean'] / month_stats['max'], 0.0),
+                index=month_stats.index
+            )
             
-            # Create final dataframe with average values
-            final_lf = pd.DataFrame([avg_lf])
-            final_lf['Financial_Year'] = 'Average'
+            # Average load factors across all years
+            final_lf = self._average_by_financial_month(monthly_lf, annual_totals.index)
             
-            logger.info(f"Calculated monthly load factors for {len(monthly_lf_stats)} years")
+            logger.info(f"Calculated monthly load factors for {len(annual_totals)} years")
             return final_lf
             
         except Exception as e:
@@ -367,28 +429,24 @@ class LoadProfileGenerator:
     def _add_time_features(self, df):
         """Add comprehensive time-based features"""
         df = df.copy()
+        calendar = calendar_features(df['ds'])
         
         # Basic time features
-        df['hour'] = df['ds'].dt.hour
-        df['dayofweek'] = df['ds'].dt.dayofweek
-        df['month'] = df['ds'].dt.month
-        df['year'] = df['ds'].dt.year
-        df['day'] = df['ds'].dt.day
-        
-        # Financial year (April to March)
-        df['financial_year'] = np.where(df['month'] >= 4, df['year'] + 1, df['year'])
+        df['hour'] = calendar['hour']
+        df['dayofweek'] = calendar['dayofweek']
+        df['month'] = calendar['month']
+        df['year'] = calendar['year']
+        df['day'] = calendar['day']
         
-        # Financial month (April = 1, May = 2, ..., March = 12)
-        df['financial_month'] = np.where(df['month'] >= 4, df['month'] - 3, df['month'] + 9)
+        # Financial year (April to March) and financial month (April = 1, ..., March = 12)
+        df['financial_year'] = calendar['fiscal_year']
+        df['financial_month'] = calendar['fiscal_month']
         
         # Weekend flag
-        df['is_weekend'] = df['dayofweek'].isin([5, 6]).astype(int)
+        df['is_weekend'] = calendar['is_weekend'].astype(np.int8)
         
         # Holiday flag
-        if not self.holidays_data.empty:
-            df['is_holiday'] = df['ds'].dt.date.isin(self.holidays_data['Date'].dt.date).astype(int)
-        else:
-            df['is_holiday'] = 0
+        df['is_holiday'] = self.holiday_calendar.is_holiday(df['ds']).astype(int)
         
         # Special day flag (weekend or holiday)
         df['is_special_day'] = (df['is_weekend'] | df['is_holiday']).astype(int)
@@ -501,7 +559,8 @@ class LoadProfileGenerator:
             raise
     
     def generate_base_profile_forecast(self, historical_data, demand_scenarios, base_year, 
-                                     start_fy, end_fy, frequency='hourly', constraints=None):
+                                     start_fy, end_fy, frequency='hourly', constraints=None,
+                                     progress_callback=None):
         """
         Generate load profile forecast using base year scaling method
         
@@ -513,64 +572,338 @@ class LoadProfileGenerator:
             end_fy (int): End financial year for forecast
             frequency (str): Output frequency ('hourly', '15min', etc.)
             constraints (dict): Optional constraints
+            progress_callback (callable): Optional callback(stage, message) called as the
+                'decomposition', 'forecast' and 'constraints' stages start; it may raise
+                GenerationCancelled, which is propagated to the caller
             
         Returns:
             dict: Forecast results and metadata
         """
         try:
-            # Extract base profiles
-            profiles = self.extract_base_profiles(historical_data, base_year)
+            report_progress(progress_callback, 'decomposition', f"Extracting FY{base_year} base profiles")
+            profiles, profiled_df = self._prepare_base_profile_frame(historical_data, base_year, start_fy, end_fy, frequency)
             
-            # Generate future dates
-            future_dates = self._generate_future_dates(start_fy, end_fy, frequency)
+            results = self._scale_base_profile_forecast(
+                profiled_df, profiles, demand_scenarios, base_year, start_fy, end_fy,
+                frequency, constraints, historical_data, progress_callback
+            )
             
-            # Create forecast dataframe
-            forecast_df = pd.DataFrame({'ds': future_dates})
-            forecast_df = self._add_time_features(forecast_df)
+            logger.info(f"Generated base profile forecast: {len(results['forecast'])} records")
+            return success_response("Base profile forecast generated successfully", results)
             
-            # Apply base profiles
-            forecast_df = self._apply_base_profiles(forecast_df, profiles, demand_scenarios)
+        except GenerationCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"Error generating base profile forecast: {e}")
+            return error_response(f"Failed to generate forecast: {str(e)}")
+    
+    def generate_base_profile_forecasts(self, historical_data, demand_scenarios_by_name, base_year,
+                                        start_fy, end_fy, frequency='hourly', constraints=None):
+        """
+        Generate base year scaling forecasts for several demand scenarios in one job
+        
+        Profile extraction, future dates, time features and the profile merge do not
+        depend on the demand scenario, so they are computed once; each scenario only
+        runs annual scaling, constraints and validation on a copy of that frame.
+        
+        Args:
+            historical_data (pd.DataFrame): Historical demand data
+            demand_scenarios_by_name (dict): Scenario name -> demand scenarios DataFrame
+            base_year (int): Base financial year for profile extraction
+            start_fy (int): Start financial year for forecast
+            end_fy (int): End financial year for forecast
+            frequency (str): Output frequency ('hourly', '15min', etc.)
+            constraints (dict): Optional constraints, shared by all scenarios
             
-            # Apply constraints if provided
-            if constraints:
-                forecast_df = self._apply_constraints(forecast_df, constraints, demand_scenarios, historical_data)
+        Returns:
+            dict: success_response with 'forecasts' (scenario name -> results, as returned by
+            generate_base_profile_forecast) and 'failed' (scenario name -> error message)
+        """
+        try:
+            if not demand_scenarios_by_name:
+                raise ValueError("No demand scenarios provided")
             
-            # Final processing
-            forecast_df['demand'] = forecast_df['demand'].clip(lower=0)
-            forecast_df['demand'] = forecast_df['demand'].round(2)
+            profiles, profiled_df = self._prepare_base_profile_frame(historical_data, base_year, start_fy, end_fy, frequency)
+            
+            forecasts = {}
+            failed = {}
+            for scenario_name, demand_scenarios in demand_scenarios_by_name.items():
+                try:
+                    results = self._scale_base_profile_forecast(
+                        profiled_df, profiles, demand_scenarios, base_year, start_fy, end_fy,
+                        frequency, constraints, historical_data
+                    )
+                    results['demand_scenario'] = scenario_name
+                    forecasts[scenario_name] = results
+                except Exception as e:
+                    logger.error(f"Error generating base profile forecast for scenario {scenario_name}: {e}")
+                    failed[scenario_name] = str(e)
+            
+            if not forecasts:
+                details = '; '.join(f"{name}: {message}" for name, message in failed.items())
+                return error_response(f"Failed to generate forecasts for all scenarios ({details})")
+            
+            logger.info(f"Generated {len(forecasts)} base profile forecasts ({len(profiled_df)} records each), "
+                       f"{len(failed)} failed")
+            return success_response(
+                f"Generated {len(forecasts)} of {len(demand_scenarios_by_name)} base profile forecasts",
+                {'forecasts': forecasts, 'failed': failed}
+            )
+            
+        except Exception as e:
+            logger.error(f"Error generating base profile forecasts: {e}")
+            return error_response(f"Failed to generate forecasts: {str(e)}")
+    
+    def generate_base_profile_forecast_streaming(self, historical_data, demand_scenarios, base_year,
+                                                 start_fy, end_fy, frequency='hourly', constraints=None,
+                                                 profile_id=None, progress_callback=None):
+        """
+        Generate and save a base profile forecast one financial year at a time
+        
+        Annual scaling and constraints work per financial year, so each year is built,
+        scaled, constrained and appended to the profile file before the next one is
+        started. Peak memory is one year of data instead of the whole horizon, which
+        matters for 15/30-minute runs over decades. Records are identical to
+        generate_base_profile_forecast followed by save_forecast.
+        
+        Args:
+            profile_id (str): Optional profile id; defaults to base_profile_scaling_<timestamp>
+            (other arguments as in generate_base_profile_forecast; the 'forecast' stage
+            reports its fraction done at the start of each financial year, and a cancelled
+            run leaves no profile file behind)
+            
+        Returns:
+            dict: success_response with the generate_base_profile_forecast results, where
+            'forecast' is replaced by 'forecast_sample' (first 720 records), plus
+            'yearly_stats' and 'save_info' (as returned by save_forecast)
+        """
+        try:
+            if start_fy > end_fy:
+                raise ValueError(f"Start year {start_fy} is after end year {end_fy}")
+            
+            # Extract base profiles
+            report_progress(progress_callback, 'decomposition', f"Extracting FY{base_year} base profiles")
+            profiles = self.extract_base_profiles(historical_data, base_year)
+            
+            if not profile_id:
+                profile_id = f"base_profile_scaling_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            
+            yearly_stats = {}
+            forecast_sample = None
+            first_ds = last_ds = None
+            count, total, total_sq = 0, 0.0, 0.0
+            overall_min, overall_max = np.inf, -np.inf
+            
+            year_count = end_fy - start_fy + 1
+            with ProfileStreamWriter(self.results_path, profile_id, f"{start_fy-1}-04-01",
+                                     self._frequency_alias(frequency)) as writer:
+                for fy in range(start_fy, end_fy + 1):
+                    # Scaling and constraints run per year, so the whole loop is one 'forecast' stage
+                    report_progress(progress_callback, 'forecast',
+                                    f"Building FY{fy} forecast ({fy - start_fy + 1}/{year_count})",
+                                    (fy - start_fy) / year_count)
+                    year_df = pd.DataFrame({'ds': self._generate_financial_year_dates(fy, end_fy, frequency)})
+                    year_df = self._add_time_features(year_df)
+                    year_df = self._merge_base_profiles(year_df, profiles)
+                    
+                    # Scale to annual targets
+                    if not demand_scenarios.empty:
+                        year_df = self._scale_to_annual_targets(year_df, demand_scenarios)
+                    
+                    # Apply constraints if provided
+                    if constraints:
+                        year_df = self._apply_constraints(year_df, constraints, demand_scenarios, historical_data)
+                    
+                    # Final processing
+                    year_df['demand'] = year_df['demand'].clip(lower=0).round(2)
+                    writer.write(year_df['ds'], year_df['demand'])
+                    
+                    # Per-year statistics, accumulated instead of kept
+                    demand = year_df['demand'].to_numpy(dtype=float)
+                    yearly_stats[f'FY{fy}'] = self._profile_year_stats(demand)
+                    count += len(demand)
+                    total += float(demand.sum())
+                    total_sq += float(np.square(demand).sum())
+                    overall_min = min(overall_min, float(demand.min()))
+                    overall_max = max(overall_max, float(demand.max()))
+                    first_ds = year_df['ds'].iloc[0] if first_ds is None else first_ds
+                    last_ds = year_df['ds'].iloc[-1]
+                    
+                    if forecast_sample is None:
+                        forecast_sample = year_df[['ds', 'demand', 'financial_year', 'financial_month', 'hour']].head(720)
+                    
+                    logger.info(f"Streamed FY{fy}: {len(demand)} records")
+                    del year_df
+                
+                profile_path = writer.path
+                storage_format = writer.storage_format
             
-            # Validation
-            validation_results = self._validate_forecast(forecast_df, demand_scenarios, constraints)
+            mean = total / count
+            std = float(np.sqrt(max(total_sq - count * mean ** 2, 0.0) / (count - 1))) if count > 1 else float('nan')
+            summary_stats = {
+                'total_records': count,
+                'date_range': {
+                    'start': first_ds.isoformat(),
+                    'end': last_ds.isoformat()
+                },
+                'demand_stats_kW': {
+                    'min': overall_min,
+                    'max': overall_max,
+                    'mean': mean,
+                    'std': std
+                },
+                'fiscal_years': {
+                    'start': start_fy,
+                    'end': end_fy,
+                    'count': end_fy - start_fy + 1
+                },
+                'load_factor': mean / overall_max if overall_max > 0 else 0
+            }
             
-            # Prepare results
             results = {
                 'method': 'base_profile_scaling',
                 'base_year': base_year,
                 'start_fy': start_fy,
                 'end_fy': end_fy,
                 'frequency': frequency,
-                'forecast': forecast_df[['ds', 'demand', 'financial_year', 'financial_month', 'hour']],
-                'validation': validation_results,
+                'forecast_sample': forecast_sample,
+                'yearly_stats': yearly_stats,
+                'validation': self._validate_streamed_forecast(yearly_stats, demand_scenarios, summary_stats),
                 'metadata': {
                     'generated_at': datetime.now().isoformat(),
-                    'total_hours': len(forecast_df),
+                    'total_hours': count,
+                    'streamed': True,
                     'method_config': {
                         'base_year': base_year,
                         'profiles_count': len(profiles)
                     }
                 }
             }
+            results['save_info'] = self._save_profile_metadata(
+                profile_id, results, profile_path, storage_format, summary_stats,
+                extra_metadata={'yearly_stats': yearly_stats}
+            )
             
-            logger.info(f"Generated base profile forecast: {len(forecast_df)} records")
+            logger.info(f"Generated streamed base profile forecast: {count} records in {len(yearly_stats)} years")
             return success_response("Base profile forecast generated successfully", results)
             
+        except GenerationCancelled:
+            raise
         except Exception as e:
-            logger.error(f"Error generating base profile forecast: {e}")
+            logger.error(f"Error generating streamed base profile forecast: {e}")
             return error_response(f"Failed to generate forecast: {str(e)}")
+    
+    @staticmethod
+    def _profile_year_stats(demand):
+        """Energy, peak, minimum, average and load factor of one year of demand"""
+        peak = float(demand.max())
+        average = float(demand.mean())
+        return {
+            'records': len(demand),
+            'energy': float(demand.sum()),
+            'peak': peak,
+            'min': float(demand.min()),
+            'mean': average,
+            'load_factor': average / peak if peak > 0 else 0
+        }
+    
+    def _validate_streamed_forecast(self, yearly_stats, demand_scenarios, summary_stats):
+        """_validate_forecast equivalent built from per-year statistics"""
+        validation = {
+            'annual_totals': {},
+            'monthly_validation': {},
+            'general_stats': {}
+        }
+        
+        for _, scenario_row in demand_scenarios.iterrows():
+            fy = scenario_row['Financial_Year']
+            target = scenario_row['Total_Demand']
+            
+            try:
+                year_key = f'FY{int(fy)}'
+            except (TypeError, ValueError):
+                continue
+            
+            if year_key in yearly_stats:
+                actual = yearly_stats[year_key]['energy']
+                diff_percent = abs(target - actual) / target * 100 if target > 0 else 0
+                validation['annual_totals'][f'FY{fy}'] = {
+                    'target': target,
+                    'actual': actual,
+                    'difference_percent': diff_percent
+                }
+        
+        demand_stats = summary_stats['demand_stats_kW']
+        validation['general_stats'] = {
+            'total_hours': summary_stats['total_records'],
+            'peak_demand': demand_stats['max'],
+            'min_demand': demand_stats['min'],
+            'avg_demand': demand_stats['mean'],
+            'overall_load_factor': summary_stats['load_factor']
+        }
+        return validation
+    
+    def _prepare_base_profile_frame(self, historical_data, base_year, start_fy, end_fy, frequency):
+        """Scenario-independent part of base profile forecasting: profiles merged onto future timestamps"""
+        # Extract base profiles
+        profiles = self.extract_base_profiles(historical_data, base_year)
+        
+        # Generate future dates
+        future_dates = self._generate_future_dates(start_fy, end_fy, frequency)
+        
+        # Create forecast dataframe
+        forecast_df = pd.DataFrame({'ds': future_dates})
+        forecast_df = self._add_time_features(forecast_df)
+        
+        # Apply base profiles
+        return profiles, self._merge_base_profiles(forecast_df, profiles)
+    
+    def _scale_base_profile_forecast(self, profiled_df, profiles, demand_scenarios, base_year,
+                                     start_fy, end_fy, frequency, constraints, historical_data,
+                                     progress_callback=None):
+        """Scenario-specific part of base profile forecasting; profiled_df is left untouched"""
+        report_progress(progress_callback, 'forecast', "Scaling profiles to annual demand")
+        forecast_df = profiled_df.copy()
+        
+        # Scale to annual targets
+        if not demand_scenarios.empty:
+            forecast_df = self._scale_to_annual_targets(forecast_df, demand_scenarios)
+        
+        # Apply constraints if provided
+        if constraints:
+            report_progress(progress_callback, 'constraints', "Applying monthly constraints")
+            forecast_df = self._apply_constraints(forecast_df, constraints, demand_scenarios, historical_data)
+        
+        # Final processing
+        forecast_df['demand'] = forecast_df['demand'].clip(lower=0)
+        forecast_df['demand'] = forecast_df['demand'].round(2)
+        
+        # Validation
+        validation_results = self._validate_forecast(forecast_df, demand_scenarios, constraints)
+        
+        # Prepare results
+        return {
+            'method': 'base_profile_scaling',
+            'base_year': base_year,
+            'start_fy': start_fy,
+            'end_fy': end_fy,
+            'frequency': frequency,
+            'forecast': forecast_df[['ds', 'demand', 'financial_year', 'financial_month', 'hour']],
+            'validation': validation_results,
+            'metadata': {
+                'generated_at': datetime.now().isoformat(),
+                'total_hours': len(forecast_df),
+                'method_config': {
+                    'base_year': base_year,
+                    'profiles_count': len(profiles)
+                }
+            }
+        }
 
     # OPTIMIZED STL SECTION - Enhanced with Load Factor Improvement
     def generate_stl_forecast(self, historical_data, demand_scenarios, start_fy, end_fy, 
-                            frequency='hourly', stl_params=None, constraints=None, lf_improvement=None):
+                            frequency='hourly', stl_params=None, constraints=None, lf_improvement=None,
+                            progress_callback=None):
         """
         Generate load profile forecast using STL decomposition method with enhanced load factor improvement
         
@@ -586,6 +919,7 @@ class LoadProfileGenerator:
                 - enabled (bool): Whether to apply load factor improvement
                 - target_year (int): Target financial year to achieve improvement
                 - improvement_percent (float): Percentage improvement in load factor
+            progress_callback (callable): Optional stage callback, as in generate_base_profile_forecast
             
         Returns:
             dict: Forecast results and metadata
@@ -602,16 +936,20 @@ class LoadProfileGenerator:
             # Set optimized STL parameters
             stl_params = self._optimize_stl_parameters(historical_data, stl_params)
             
-            # Perform enhanced STL decomposition
-            stl_result = self._perform_enhanced_stl_decomposition(historical_data, stl_params)
+            # Perform enhanced STL decomposition (reused from the project cache when unchanged)
+            report_progress(progress_callback, 'decomposition', f"Running STL decomposition ({stl_params['engine']} engine)")
+            stl_result, decomposition_cached = self._get_stl_decomposition(historical_data, stl_params)
             
             # Generate future dates
+            report_progress(progress_callback, 'forecast', "Building forecast from STL components")
             future_dates = self._generate_future_dates(start_fy, end_fy, frequency)
             
             # Create forecast using optimized STL components
             forecast_df = self._create_optimized_stl_forecast(future_dates, stl_result, demand_scenarios, historical_data)
             
             # Apply constraints if provided
+            if constraints or (lf_improvement and lf_improvement.get('enabled', False)):
+                report_progress(progress_callback, 'constraints', "Applying constraints and load factor targets")
             if constraints:
                 forecast_df = self._apply_constraints(forecast_df, constraints, demand_scenarios, historical_data)
             
@@ -631,6 +969,11 @@ class LoadProfileGenerator:
             # Comprehensive validation
             validation_results = self._validate_stl_forecast(forecast_df, demand_scenarios, constraints, historical_data)
             
+            # Optional quality report of the approximate engine against exact STL
+            engine_comparison = None
+            if stl_params['engine'] != 'exact' and stl_params.get('compare_with_exact'):
+                engine_comparison = self.compare_stl_engines(historical_data, stl_params)
+            
             # Prepare optimized results
             results = {
                 'method': 'stl_decomposition',
@@ -643,13 +986,16 @@ class LoadProfileGenerator:
                     'trend_growth_rate': stl_result.get('trend_growth_rate', 0),
                     'seasonal_strength': stl_result.get('seasonal_strength', 0),
                     'noise_level': stl_result.get('noise_level', 0),
-                    'decomposition_quality': stl_result.get('quality_score', 0)
+                    'decomposition_quality': stl_result.get('quality_score', 0),
+                    'engine': stl_params['engine'],
+                    'engine_comparison': engine_comparison
                 },
                 'load_factor_improvement': lf_improvement if lf_improvement and lf_improvement.get('enabled') else None,
                 'metadata': {
                     'generated_at': datetime.now().isoformat(),
                     'total_hours': len(forecast_df),
                     'method_config': stl_params,
+                    'decomposition_cached': decomposition_cached,
                     'realistic_profile_score': validation_results.get('realism_score', 0)
                 }
             }
@@ -657,6 +1003,8 @@ class LoadProfileGenerator:
             logger.info(f"Generated optimized STL forecast: {len(forecast_df)} records with quality score: {stl_result.get('quality_score', 0):.3f}")
             return success_response("STL forecast generated successfully", results)
             
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error generating STL forecast: {e}")
             return error_response(f"Failed to generate STL forecast: {str(e)}")
@@ -738,34 +1086,57 @@ class LoadProfileGenerator:
         # Always use robust mode for real-world data
         stl_params['robust'] = stl_params.get('robust', True)
         
+        # Decomposition engine: 'exact' hourly STL or the fast 'daily' approximation
+        engine = stl_params.get('engine', 'exact')
+        if engine not in STL_ENGINES:
+            logger.warning(f"Unknown STL engine '{engine}', using 'exact'")
+            engine = 'exact'
+        stl_params['engine'] = engine
+        
         logger.info(f"Optimized STL parameters: {stl_params}")
         return stl_params
 
+    def _get_stl_decomposition(self, historical_data, stl_params):
+        """
+        STL decomposition keyed by the historical series and STL parameters, served from
+        the project's on-disk cache when available. Set stl_params['use_cache'] to False
+        to force a fresh decomposition.
+        
+        Returns:
+            tuple: (stl_result, served_from_cache)
+        """
+        if not stl_params.get('use_cache', True):
+            return self._perform_enhanced_stl_decomposition(historical_data, stl_params), False
+        
+        cache = None
+        cache_key = None
+        try:
+            cache = STLDecompositionCache(default_stl_cache_dir(self.project_path))
+            cache_key = cache.make_key(historical_data, stl_params)
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                logger.info(f"Reusing cached STL decomposition {cache_key[:12]}")
+                return cached_result, True
+        except Exception as e:
+            logger.warning(f"STL decomposition cache unavailable: {e}")
+            cache = None
+        
+        stl_result = self._perform_enhanced_stl_decomposition(historical_data, stl_params)
+        if cache is not None:
+            try:
+                cache.put(cache_key, stl_result)
+            except Exception as e:
+                # The decomposition succeeded; a cache write must never fail the forecast
+                logger.warning(f"STL decomposition cache unavailable: {e}")
+        return stl_result, False
+
     def _perform_enhanced_stl_decomposition(self, historical_data, stl_params):
-        """Enhanced STL decomposition with quality assessment"""
+        """Enhanced STL decomposition with quality assessment, using the engine selected in stl_params"""
+        if stl_params.get('engine', 'exact') == 'daily':
+            return self._perform_daily_stl_decomposition(historical_data, stl_params)
+        
         try:
-            # Prepare data
-            data = historical_data.sort_values('ds').copy()
-            demand_series = data.set_index('ds')['demand']
-            
-            # Create complete time index
-            full_index = pd.date_range(
-                start=demand_series.index.min(), 
-                end=demand_series.index.max(), 
-                freq='h'
-            )
-            
-            # Reindex and interpolate missing values
-            demand_series = demand_series.reindex(full_index)
-            missing_count = demand_series.isna().sum()
-            
-            if missing_count > 0:
-                logger.info(f"Interpolating {missing_count} missing values")
-                demand_series = demand_series.interpolate(method='linear', limit_direction='both')
-            
-            # Apply smoothing for noisy data
-            if demand_series.std() / demand_series.mean() > 0.5:  # High variability
-                demand_series = demand_series.rolling(window=3, center=True).mean().fillna(demand_series)
+            demand_series = self._prepare_stl_series(historical_data)
             
             # Perform STL decomposition
             stl = STL(
@@ -778,56 +1149,193 @@ class LoadProfileGenerator:
             
             result = stl.fit()
             
-            # Calculate enhanced metrics
-            trend_values = result.trend.dropna()
-            seasonal_values = result.seasonal
-            residual_values = result.resid.dropna()
+            return self._summarize_stl_components(
+                demand_series, result.trend, result.seasonal, result.resid, stl_params['period']
+            )
             
-            # Trend analysis
-            if len(trend_values) >= 2:
-                x = np.arange(len(trend_values))
-                trend_slope = np.polyfit(x, trend_values, 1)[0]
-                trend_growth_rate = trend_slope * 24 * 365  # Annual growth
-            else:
-                trend_growth_rate = 0
-            
-            # Seasonal strength
-            seasonal_var = seasonal_values.var()
-            residual_var = residual_values.var()
-            total_var = seasonal_var + residual_var
-            seasonal_strength = seasonal_var / total_var if total_var > 0 else 0
-            
-            # Noise level assessment
-            noise_level = residual_var / demand_series.var() if demand_series.var() > 0 else 0
-            
-            # Quality score (0-1, higher is better)
-            quality_score = max(0, min(1, seasonal_strength - noise_level))
-            
-            # Enhanced seasonal pattern extraction
-            seasonal_pattern = self._extract_enhanced_seasonal_pattern(seasonal_values, stl_params['period'])
-            
-            return {
-                'trend': result.trend,
-                'seasonal': result.seasonal,
-                'resid': result.resid,
-                'trend_growth_rate': trend_growth_rate,
-                'seasonal_strength': seasonal_strength,
-                'noise_level': noise_level,
-                'quality_score': quality_score,
-                'original_index': demand_series.index,
-                'seasonal_pattern': seasonal_pattern,
-                'baseline_stats': {
-                    'mean': float(demand_series.mean()),
-                    'std': float(demand_series.std()),
-                    'peak': float(demand_series.max()),
-                    'load_factor': float(demand_series.mean() / demand_series.max()) if demand_series.max() > 0 else 0
-                }
+        except Exception as e:
+            logger.error(f"Error in enhanced STL decomposition: {e}")
+            raise
+
+    def _prepare_stl_series(self, historical_data):
+        """Hourly demand series on a complete time index, interpolated and smoothed for STL"""
+        # Prepare data
+        data = historical_data.sort_values('ds').copy()
+        demand_series = data.set_index('ds')['demand']
+        
+        # Create complete time index
+        full_index = pd.date_range(
+            start=demand_series.index.min(), 
+            end=demand_series.index.max(), 
+            freq='h'
+        )
+        
+        # Reindex and interpolate missing values
+        demand_series = demand_series.reindex(full_index)
+        missing_count = demand_series.isna().sum()
+        
+        if missing_count > 0:
+            logger.info(f"Interpolating {missing_count} missing values")
+            demand_series = demand_series.interpolate(method='linear', limit_direction='both')
+        
+        # Apply smoothing for noisy data
+        if demand_series.std() / demand_series.mean() > 0.5:  # High variability
+            demand_series = demand_series.rolling(window=3, center=True).mean().fillna(demand_series)
+        
+        return demand_series
+
+    def _summarize_stl_components(self, demand_series, trend, seasonal, resid, period):
+        """Growth rate, strength/noise metrics, seasonal pattern and baseline stats of a decomposition"""
+        # Calculate enhanced metrics
+        trend_values = trend.dropna()
+        seasonal_values = seasonal
+        residual_values = resid.dropna()
+        
+        # Trend analysis
+        if len(trend_values) >= 2:
+            x = np.arange(len(trend_values))
+            trend_slope = np.polyfit(x, trend_values, 1)[0]
+            trend_growth_rate = trend_slope * 24 * 365  # Annual growth
+        else:
+            trend_growth_rate = 0
+        
+        # Seasonal strength
+        seasonal_var = seasonal_values.var()
+        residual_var = residual_values.var()
+        total_var = seasonal_var + residual_var
+        seasonal_strength = seasonal_var / total_var if total_var > 0 else 0
+        
+        # Noise level assessment
+        noise_level = residual_var / demand_series.var() if demand_series.var() > 0 else 0
+        
+        # Quality score (0-1, higher is better)
+        quality_score = max(0, min(1, seasonal_strength - noise_level))
+        
+        # Enhanced seasonal pattern extraction
+        seasonal_pattern = self._extract_enhanced_seasonal_pattern(seasonal_values, period)
+        
+        return {
+            'trend': trend,
+            'seasonal': seasonal,
+            'resid': resid,
+            'trend_growth_rate': trend_growth_rate,
+            'seasonal_strength': seasonal_strength,
+            'noise_level': noise_level,
+            'quality_score': quality_score,
+            'original_index': demand_series.index,
+            'seasonal_pattern': seasonal_pattern,
+            'baseline_stats': {
+                'mean': float(demand_series.mean()),
+                'std': float(demand_series.std()),
+                'peak': float(demand_series.max()),
+                'load_factor': float(demand_series.mean() / demand_series.max()) if demand_series.max() > 0 else 0
             }
+        }
+
+    def _perform_daily_stl_decomposition(self, historical_data, stl_params):
+        """
+        Approximate STL: robust STL on daily mean demand plus an hourly shape overlay
+        
+        The annual cycle and trend are decomposed on ~365 points per year instead of
+        8760, which takes seconds instead of minutes. Within-day variation is modelled
+        as the mean deviation from the daily mean per (month, weekend, hour); the
+        hourly seasonal component is the daily seasonal value plus that shape.
+        
+        The period is scaled from hours to days and the trend window follows it as in
+        _optimize_stl_parameters. The seasonal window is kept as given: STL measures it
+        in periods (years of the seasonal subseries), not samples, so it does not scale.
+        """
+        try:
+            demand_series = self._prepare_stl_series(historical_data)
+            hourly_index = demand_series.index
+            
+            # Daily STL: period in days, seasonal window unchanged (it counts periods)
+            daily_mean = demand_series.resample('D').mean()
+            daily_period = max(2, int(stl_params['period']) // 24)
+            daily_seasonal_window = max(7, int(stl_params['seasonal']))
+            if daily_seasonal_window % 2 == 0:
+                daily_seasonal_window += 1
+            daily_trend_window = max(int(1.5 * daily_period), daily_period + 1)
+            if daily_trend_window % 2 == 0:
+                daily_trend_window += 1
+            
+            daily_result = STL(
+                daily_mean,
+                period=daily_period,
+                seasonal=daily_seasonal_window,
+                trend=daily_trend_window,
+                robust=stl_params.get('robust', True)
+            ).fit()
+            
+            # Daily components onto the hourly index: trend interpolated, seasonal held per day
+            day_positions = daily_mean.index.get_indexer(hourly_index.floor('D'))
+            hour_offsets = (hourly_index - hourly_index.floor('D')) / pd.Timedelta(hours=1)
+            daily_time = np.arange(len(daily_mean)) * 24.0 + 11.5  # Daily means sit mid-day
+            hourly_time = day_positions * 24.0 + np.asarray(hour_offsets, dtype=float)
+            trend = pd.Series(np.interp(hourly_time, daily_time, daily_result.trend.to_numpy()), index=hourly_index)
+            daily_seasonal = daily_result.seasonal.to_numpy()[day_positions]
+            
+            # Hourly shape overlay: typical deviation from the daily mean
+            deviation = demand_series.to_numpy() - daily_mean.to_numpy()[day_positions]
+            shape = pd.Series(deviation).groupby([
+                np.asarray(hourly_index.month), np.asarray(hourly_index.dayofweek >= 5), np.asarray(hourly_index.hour)
+            ]).transform('mean').to_numpy()
+            
+            seasonal = pd.Series(daily_seasonal + shape, index=hourly_index)
+            resid = demand_series - trend - seasonal
+            
+            return self._summarize_stl_components(demand_series, trend, seasonal, resid, stl_params['period'])
             
         except Exception as e:
-            logger.error(f"Error in enhanced STL decomposition: {e}")
+            logger.error(f"Error in daily STL decomposition: {e}")
             raise
 
+    def compare_stl_engines(self, historical_data, stl_params=None):
+        """
+        Run the exact and the daily STL engines on the same data and compare them
+        
+        Returns:
+            dict: Runtimes, speedup, seasonal pattern correlation and normalized RMSE,
+            trend growth rates and quality scores of both engines
+        """
+        import time
+        
+        base_params = {k: v for k, v in (stl_params or {}).items() if k != 'engine'}
+        results = {}
+        for engine in STL_ENGINES:
+            params = self._optimize_stl_parameters(historical_data, dict(base_params, engine=engine))
+            started = time.perf_counter()
+            results[engine] = self._perform_enhanced_stl_decomposition(historical_data, params)
+            results[engine]['runtime_seconds'] = time.perf_counter() - started
+        
+        exact, approx = results['exact'], results['daily']
+        exact_pattern = np.asarray(exact['seasonal_pattern'], dtype=float)
+        approx_pattern = np.asarray(approx['seasonal_pattern'], dtype=float)
+        length = min(len(exact_pattern), len(approx_pattern))
+        exact_pattern, approx_pattern = exact_pattern[:length], approx_pattern[:length]
+        
+        baseline_mean = exact['baseline_stats']['mean']
+        pattern_rmse = float(np.sqrt(np.mean((exact_pattern - approx_pattern) ** 2))) if length else float('nan')
+        exact_growth = exact['trend_growth_rate']
+        
+        comparison = {
+            'exact_runtime_seconds': exact['runtime_seconds'],
+            'daily_runtime_seconds': approx['runtime_seconds'],
+            'speedup': exact['runtime_seconds'] / approx['runtime_seconds'] if approx['runtime_seconds'] > 0 else None,
+            'seasonal_pattern_correlation': float(np.corrcoef(exact_pattern, approx_pattern)[0, 1]) if length > 1 else None,
+            'seasonal_pattern_nrmse': pattern_rmse / baseline_mean if baseline_mean else None,
+            'exact_trend_growth_rate': float(exact_growth),
+            'daily_trend_growth_rate': float(approx['trend_growth_rate']),
+            'trend_growth_relative_difference': (
+                abs(approx['trend_growth_rate'] - exact_growth) / abs(exact_growth) if exact_growth else None
+            ),
+            'exact_quality_score': float(exact['quality_score']),
+            'daily_quality_score': float(approx['quality_score'])
+        }
+        
+        logger.info(f"STL engine comparison: {comparison}")
+        return comparison
+
     def _extract_enhanced_seasonal_pattern(self, seasonal_values, period):
         """Extract and enhance seasonal patterns"""
         try:
@@ -918,7 +1426,7 @@ class LoadProfileGenerator:
             raise
 
     def _apply_enhanced_load_factor_improvement(self, forecast_df, target_year, improvement_percent, start_fy, historical_data):
-        """Enhanced load factor improvement with realistic constraints"""
+        """Enhanced load factor improvement with realistic constraints, applied to all years at once"""
         try:
             if not target_year or not improvement_percent:
                 return forecast_df
@@ -933,60 +1441,52 @@ class LoadProfileGenerator:
             
             modified_df = forecast_df.copy()
             
-            # Calculate baseline load factor from historical data
-            baseline_lf = self._calculate_baseline_load_factor(historical_data)
-            
-            # Calculate improvement for each year with smooth progression
-            for fy in modified_df['financial_year'].unique():
-                if fy < start_fy:
-                    continue
-                    
-                # Calculate improvement progression
-                if fy >= target_year:
-                    year_improvement = improvement_percent
-                else:
-                    # Smooth S-curve progression instead of linear
-                    progress = (fy - start_fy) / (target_year - start_fy) if target_year > start_fy else 1
-                    # S-curve: slow start, rapid middle, slow end
-                    s_curve_progress = 3 * progress**2 - 2 * progress**3
-                    year_improvement = improvement_percent * s_curve_progress
-                
-                # Apply improvement to year data
-                year_mask = modified_df['financial_year'] == fy
-                year_data = modified_df.loc[year_mask, 'demand'].copy()
-                
-                if len(year_data) == 0:
-                    continue
-                
-                # Calculate current load factor
-                current_avg = year_data.mean()
-                current_peak = year_data.max()
-                current_lf = current_avg / current_peak if current_peak > 0 else 0
-                
-                # Calculate target load factor with realistic limits
-                target_lf = current_lf * (1 + year_improvement / 100)
-                target_lf = min(target_lf, 0.95)  # Cap at 95% for realism
-                target_lf = max(target_lf, current_lf)  # Ensure no decrease
-                
-                if target_lf > current_lf:
-                    # Apply sophisticated load factor improvement
-                    improved_demand = self._apply_sophisticated_load_factor_improvement(
-                        year_data.values, 
-                        current_lf, 
-                        target_lf,
-                        baseline_lf
-                    )
-                    
-                    # Update the forecast
-                    modified_df.loc[year_mask, 'demand'] = improved_demand
-                    
-                    # Log improvement
-                    new_avg = improved_demand.mean()
-                    new_peak = improved_demand.max()
-                    new_lf = new_avg / new_peak if new_peak > 0 else 0
-                    
-                    logger.info(f"FY{fy}: Load factor improved from {current_lf:.3f} to {new_lf:.3f} "
-                               f"(target: {target_lf:.3f}, improvement: {year_improvement:.1f}%)")
+            # (years x hours) layout; shorter years are padded and masked out by `valid`
+            fy_values, fy_codes = np.unique(modified_df['financial_year'].to_numpy(), return_inverse=True)
+            order = np.argsort(fy_codes, kind='stable')
+            lengths = np.bincount(fy_codes, minlength=len(fy_values))
+            starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+            rows = fy_codes[order]
+            cols = np.arange(len(order)) - starts[rows]
+            
+            demand_matrix = np.full((len(fy_values), lengths.max()), np.nan)
+            demand_matrix[rows, cols] = modified_df['demand'].to_numpy(dtype=float)[order]
+            valid = np.arange(lengths.max())[None, :] < lengths[:, None]
+            
+            # Improvement progression: S-curve (slow start, rapid middle, slow end) up to the target year
+            if target_year > start_fy:
+                progress = (fy_values - start_fy) / (target_year - start_fy)
+            else:
+                progress = np.ones(len(fy_values))
+            s_curve_progress = 3 * progress**2 - 2 * progress**3
+            year_improvement = np.where(fy_values >= target_year, improvement_percent, improvement_percent * s_curve_progress)
+            
+            # Calculate current load factor
+            with np.errstate(invalid='ignore', divide='ignore'):
+                current_avg = np.nanmean(demand_matrix, axis=1)
+                current_peak = np.nanmax(demand_matrix, axis=1)
+                current_lf = np.where(current_peak > 0, current_avg / current_peak, 0.0)
+            
+            # Calculate target load factor with realistic limits: cap at 95%, never decrease
+            target_lf = np.maximum(np.minimum(current_lf * (1 + year_improvement / 100), 0.95), current_lf)
+            improve = (fy_values >= start_fy) & (target_lf > current_lf)
+            if not improve.any():
+                return modified_df
+            
+            improved = self._improve_load_factor_batch(demand_matrix[improve], valid[improve], target_lf[improve])
+            demand_matrix[improve] = np.where(valid[improve], improved, np.nan)
+            
+            # Update the forecast
+            new_demand = modified_df['demand'].to_numpy(dtype=float).copy()
+            new_demand[order] = demand_matrix[rows, cols]
+            modified_df['demand'] = new_demand
+            
+            # Log improvement
+            with np.errstate(invalid='ignore', divide='ignore'):
+                new_lf = np.nanmean(demand_matrix, axis=1) / np.nanmax(demand_matrix, axis=1)
+            for i in np.flatnonzero(improve):
+                logger.info(f"FY{fy_values[i]}: Load factor improved from {current_lf[i]:.3f} to {new_lf[i]:.3f} "
+                           f"(target: {target_lf[i]:.3f}, improvement: {year_improvement[i]:.1f}%)")
             
             return modified_df
             
@@ -997,72 +1497,95 @@ class LoadProfileGenerator:
     def _apply_sophisticated_load_factor_improvement(self, demand_array, current_lf, target_lf, baseline_lf):
         """Apply sophisticated load factor improvement maintaining realistic patterns"""
         try:
-            demand = demand_array.copy()
-            original_energy = demand.sum()
-            
-            # Calculate statistics
-            avg_demand = demand.mean()
-            peak_demand = demand.max()
-            min_demand = demand.min()
-            
-            # Calculate new average based on target load factor
-            target_avg = target_lf * peak_demand
-            
-            # Strategy: Peak shaving + Valley filling + Pattern preservation
-            
-            # 1. Identify peak hours (top 10%)
-            peak_threshold = np.percentile(demand, 90)
-            peak_mask = demand >= peak_threshold
-            
-            # 2. Identify valley hours (bottom 20%)
-            valley_threshold = np.percentile(demand, 20)
-            valley_mask = demand <= valley_threshold
-            
-            # 3. Calculate energy to redistribute
-            peak_reduction_factor = 0.7  # Reduce peaks by 30%
-            valley_fill_factor = 1.3     # Increase valleys by 30%
-            
-            # 4. Apply gradual peak shaving
-            peak_reduction = (demand[peak_mask] - peak_threshold) * (1 - peak_reduction_factor)
-            demand[peak_mask] -= peak_reduction
-            
-            # 5. Apply gradual valley filling
-            valley_increase = (valley_threshold - demand[valley_mask]) * (valley_fill_factor - 1)
-            demand[valley_mask] += valley_increase
-            
-            # 6. Smooth transitions to avoid abrupt changes
-            demand = self._apply_smoothing_filter(demand, window_size=3)
-            
-            # 7. Scale to maintain total energy
-            current_energy = demand.sum()
-            if current_energy > 0:
-                energy_scale_factor = original_energy / current_energy
-                demand *= energy_scale_factor
-            
-            # 8. Final adjustment to target average
-            current_new_avg = demand.mean()
-            if current_new_avg > 0 and abs(current_new_avg - target_avg) > target_avg * 0.05:
-                final_scale_factor = target_avg / current_new_avg
-                demand *= final_scale_factor
-            
-            # 9. Ensure realistic bounds
-            demand = np.clip(demand, min_demand * 0.8, peak_demand * 1.1)
-            
-            return demand
+            demand = np.asarray(demand_array, dtype=float)[None, :]
+            valid = np.ones(demand.shape, dtype=bool)
+            return self._improve_load_factor_batch(demand, valid, np.array([target_lf]))[0]
             
         except Exception as e:
             logger.error(f"Error in sophisticated load factor improvement: {e}")
             return demand_array
 
-    def _apply_smoothing_filter(self, data, window_size=3):
-        """Apply smoothing filter to data"""
+    def _improve_load_factor_batch(self, demand_matrix, valid, target_lf):
+        """
+        Peak shaving + valley filling + pattern preservation for every row of a (years x hours) array
+        
+        Args:
+            demand_matrix (np.ndarray): Demand per year (row); positions outside `valid` are ignored
+            valid (np.ndarray): Boolean mask of real (non-padding) positions, left-aligned per row
+            target_lf (np.ndarray): Target load factor per row
+        
+        Returns:
+            np.ndarray: Improved demand, same shape (padding positions are unspecified)
+        """
+        masked = np.where(valid, demand_matrix, np.nan)
+        counts = valid.sum(axis=1)
+        
+        # Calculate statistics
+        original_energy = np.nansum(masked, axis=1)
+        peak_demand = np.nanmax(masked, axis=1)
+        min_demand = np.nanmin(masked, axis=1)
+        
+        # Calculate new average based on target load factor
+        target_avg = target_lf * peak_demand
+        
+        # 1. Identify peak hours (top 10%) and 2. valley hours (bottom 20%)
+        peak_threshold = np.nanpercentile(masked, 90, axis=1)[:, None]
+        valley_threshold = np.nanpercentile(masked, 20, axis=1)[:, None]
+        peak_mask = valid & (masked >= peak_threshold)
+        valley_mask = valid & (masked <= valley_threshold)
+        
+        # 3. Calculate energy to redistribute
+        peak_reduction_factor = 0.7  # Reduce peaks by 30%
+        valley_fill_factor = 1.3     # Increase valleys by 30%
+        
+        # 4. Apply gradual peak shaving
+        demand = np.where(peak_mask, masked - (masked - peak_threshold) * (1 - peak_reduction_factor), masked)
+        
+        # 5. Apply gradual valley filling
+        demand = np.where(valley_mask, demand + (valley_threshold - demand) * (valley_fill_factor - 1), demand)
+        
+        # 6. Smooth transitions to avoid abrupt changes
+        demand = self._apply_smoothing_filter(demand, window_size=3, valid=valid)
+        
+        # 7. Scale to maintain total energy
+        current_energy = np.where(valid, demand, 0.0).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            energy_scale_factor = np.where(current_energy > 0, original_energy / current_energy, 1.0)
+        demand = demand * energy_scale_factor[:, None]
+        
+        # 8. Final adjustment to target average (outside a 5% band)
+        current_new_avg = np.where(valid, demand, 0.0).sum(axis=1) / counts
+        adjust = (current_new_avg > 0) & (np.abs(current_new_avg - target_avg) > target_avg * 0.05)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            final_scale_factor = np.where(adjust, target_avg / current_new_avg, 1.0)
+        demand = demand * final_scale_factor[:, None]
+        
+        # 9. Ensure realistic bounds
+        return np.clip(demand, (min_demand * 0.8)[:, None], (peak_demand * 1.1)[:, None])
+
+    def _apply_smoothing_filter(self, data, window_size=3, valid=None):
+        """
+        Apply smoothing filter to data
+        
+        2-D input is smoothed along each row; `valid` marks real values in rows
+        padded at the end, which are smoothed as if the padding were not there.
+        """
+        data = np.asarray(data, dtype=float)
         try:
             # Try scipy first
             from scipy.ndimage import uniform_filter1d
-            return uniform_filter1d(data, size=window_size, mode='nearest')
+            if valid is not None:
+                # Repeat each row's last value over its padding, as mode='nearest' does at the edge
+                last_values = data[np.arange(data.shape[0]), valid.sum(axis=1) - 1]
+                data = np.where(valid, data, last_values[:, None])
+            return uniform_filter1d(data, size=window_size, mode='nearest', axis=-1)
         except ImportError:
             # Fallback to simple moving average
-            return pd.Series(data).rolling(window=window_size, center=True).mean().fillna(data).values
+            if valid is not None:
+                data = np.where(valid, data, np.nan)
+            frame = pd.DataFrame(np.atleast_2d(data).T)
+            smoothed = frame.rolling(window=window_size, center=True).mean().fillna(frame).values.T
+            return smoothed.reshape(data.shape)
 
     def _calculate_baseline_load_factor(self, historical_data):
         """Calculate baseline load factor from historical data"""
@@ -1236,8 +1759,8 @@ class LoadProfileGenerator:
 
     # END OF OPTIMIZED STL SECTION
 
-    def _apply_base_profiles(self, forecast_df, profiles, demand_scenarios):
-        """Apply base year profiles to forecast with annual scaling"""
+    def _merge_base_profiles(self, forecast_df, profiles):
+        """Merge base year profiles onto the forecast timestamps, before any annual scaling"""
         try:
             # Merge profiles
             forecast_df = forecast_df.merge(
@@ -1253,43 +1776,93 @@ class LoadProfileGenerator:
             # Initialize demand with profiles
             forecast_df['demand'] = forecast_df['fraction'] * avg_fraction * 1000  # Base scaling
             
-            # Scale to annual targets
-            if not demand_scenarios.empty:
-                forecast_df = self._scale_to_annual_targets(forecast_df, demand_scenarios)
-            
             return forecast_df
             
         except Exception as e:
-            logger.error(f"Error applying base profiles: {e}")
+            logger.error(f"Error merging base profiles: {e}")
             raise
     
+    # Constraint engine: rows are grouped by integer (financial year, financial month)
+    # codes, per-group totals come from np.bincount and every constraint is applied
+    # as a single multiply by per-row scale factors.
+
+    @staticmethod
+    def _financial_period_codes(forecast_df):
+        """
+        Group codes for forecast rows
+
+        Returns:
+            tuple: (fy_values, fy_codes, period_codes) where fy_values[fy_codes] is each row's
+            financial year and period_codes = fy_code * 13 + financial_month (0 if outside 1-12)
+        """
+        fy_values, fy_codes = np.unique(forecast_df['financial_year'].to_numpy(), return_inverse=True)
+        fm = forecast_df['financial_month'].to_numpy()
+        month_codes = np.where((fm >= 1) & (fm <= 12), fm, 0).astype(int)
+        return fy_values, fy_codes, fy_codes * 13 + month_codes
+
+    @staticmethod
+    def _group_sums(values, codes, n_groups):
+        """NaN-skipping sum and count of values per group code"""
+        valid = ~np.isnan(values)
+        sums = np.bincount(codes, weights=np.where(valid, values, 0.0), minlength=n_groups)
+        counts = np.bincount(codes, weights=valid.astype(float), minlength=n_groups)
+        return sums, counts
+
+    @staticmethod
+    def _annual_targets(demand_scenarios, fy_values):
+        """
+        Total_Demand per financial year in fy_values; the last scenario row of a year wins
+
+        Returns:
+            tuple: (targets, has_target) arrays aligned with fy_values
+        """
+        scenario_years = pd.to_numeric(demand_scenarios['Financial_Year'], errors='coerce')
+        targets = pd.Series(demand_scenarios['Total_Demand'].to_numpy(dtype=float), index=scenario_years.to_numpy(dtype=float))
+        targets = targets[~targets.index.duplicated(keep='last')]
+        
+        years = fy_values.astype(float)
+        has_target = np.isin(years, targets.index.to_numpy())
+        return targets.reindex(years).to_numpy(), has_target
+
     def _scale_to_annual_targets(self, forecast_df, demand_scenarios):
         """Scale forecast to match annual demand targets"""
         try:
-            for _, scenario_row in demand_scenarios.iterrows():
-                fy = scenario_row['Financial_Year']
-                target_annual = scenario_row['Total_Demand']
-                
-                # Filter forecast for this financial year
-                fy_mask = forecast_df['financial_year'] == fy
-                
-                if fy_mask.sum() == 0:
-                    continue
-                
-                # Calculate current annual total
-                current_annual = forecast_df.loc[fy_mask, 'demand'].sum()
-                
-                if current_annual > 0:
-                    # Scale to target
-                    scale_factor = target_annual / current_annual
-                    forecast_df.loc[fy_mask, 'demand'] *= scale_factor
+            demand = forecast_df['demand'].to_numpy(dtype=float)
+            fy_values, fy_codes, _ = self._financial_period_codes(forecast_df)
+            
+            current_annual, _ = self._group_sums(demand, fy_codes, len(fy_values))
+            target_annual, has_target = self._annual_targets(demand_scenarios, fy_values)
+            
+            # Years without a target or without positive demand keep their values
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scale_factors = np.where(has_target & (current_annual > 0), target_annual / current_annual, 1.0)
             
+            forecast_df['demand'] = demand * scale_factors[fy_codes]
             return forecast_df
             
         except Exception as e:
             logger.error(f"Error scaling to annual targets: {e}")
             raise
     
+    @staticmethod
+    def _frequency_alias(frequency):
+        """pandas frequency alias of an output frequency name"""
+        freq_map = {
+            'hourly': 'H',
+            '15min': '15T',
+            '30min': '30T',
+            'daily': 'D'
+        }
+        return freq_map.get(frequency, 'H')
+    
+    def _generate_financial_year_dates(self, fy, end_fy, frequency='hourly'):
+        """Timestamps of one financial year, exactly the FY slice of _generate_future_dates(.., end_fy, ..)"""
+        freq = self._frequency_alias(frequency)
+        start_date = f"{fy-1}-04-01"
+        if fy < end_fy:
+            return pd.date_range(start=start_date, end=f"{fy}-04-01", freq=freq, inclusive='left')
+        return pd.date_range(start=start_date, end=f"{end_fy}-03-31 23:00", freq=freq)
+    
     def _generate_future_dates(self, start_fy, end_fy, frequency='hourly'):
         """Generate future datetime range for financial years"""
         try:
@@ -1298,14 +1871,7 @@ class LoadProfileGenerator:
             end_date = f"{end_fy}-03-31 23:00"  # March 31st 23:00 of end calendar year
             
             # Set frequency
-            freq_map = {
-                'hourly': 'H',
-                '15min': '15T',
-                '30min': '30T',
-                'daily': 'D'
-            }
-            
-            freq = freq_map.get(frequency, 'H')
+            freq = self._frequency_alias(frequency)
             
             # Generate date range
             dates = pd.date_range(start=start_date, end=end_date, freq=freq)
@@ -1359,51 +1925,43 @@ class LoadProfileGenerator:
             logger.error(f"Error applying constraints: {e}")
             return forecast_df  # Return original if constraints fail
     
+    @staticmethod
+    def _monthly_constraint_values(constraint_data):
+        """
+        Apr..Mar values from the first (average) row of a monthly constraint table,
+        indexed by financial month code 0-12 (code 0 and missing months are NaN)
+        """
+        row = constraint_data.iloc[0]
+        values = np.full(13, np.nan)
+        for financial_month, month_name in enumerate(FINANCIAL_MONTH_NAMES, start=1):
+            if month_name in row:
+                values[financial_month] = pd.to_numeric(row[month_name], errors='coerce')
+        return values
+
     def _apply_monthly_share_constraints(self, forecast_df, monthly_shares_data, demand_scenarios):
         """Apply monthly share constraints based on calculated historical patterns"""
         try:
-            # Month name to number mapping for financial year
-            month_map = {
-                'Apr': 1, 'May': 2, 'Jun': 3, 'Jul': 4, 'Aug': 5, 'Sep': 6,
-                'Oct': 7, 'Nov': 8, 'Dec': 9, 'Jan': 10, 'Feb': 11, 'Mar': 12
-            }
-            
             # Get monthly shares
             if monthly_shares_data.empty:
                 return forecast_df
             
-            shares_row = monthly_shares_data.iloc[0]  # Use first (average) row
+            shares = self._monthly_constraint_values(monthly_shares_data)
+            valid_shares = ~np.isnan(shares) & (shares > 0)
             
-            # Apply constraints for each financial year and month
-            for _, scenario_row in demand_scenarios.iterrows():
-                fy = scenario_row['Financial_Year']
-                annual_target = scenario_row['Total_Demand']
-                
-                for month_name, financial_month in month_map.items():
-                    if month_name not in shares_row:
-                        continue
-                    
-                    monthly_share = shares_row[month_name]
-                    if pd.isna(monthly_share) or monthly_share <= 0:
-                        continue
-                    
-                    # Calculate target monthly total
-                    target_monthly_total = annual_target * monthly_share
-                    
-                    # Filter forecast for this month and year
-                    mask = (forecast_df['financial_year'] == fy) & (forecast_df['financial_month'] == financial_month)
-                    
-                    if mask.sum() == 0:
-                        continue
-                    
-                    # Current monthly total
-                    current_monthly_total = forecast_df.loc[mask, 'demand'].sum()
-                    
-                    if current_monthly_total > 0:
-                        # Scale to target monthly total
-                        scale_factor = target_monthly_total / current_monthly_total
-                        forecast_df.loc[mask, 'demand'] *= scale_factor
+            demand = forecast_df['demand'].to_numpy(dtype=float)
+            fy_values, _, period_codes = self._financial_period_codes(forecast_df)
+            current_monthly, _ = self._group_sums(demand, period_codes, len(fy_values) * 13)
+            current_monthly = current_monthly.reshape(len(fy_values), 13)
+            
+            # Target monthly total = annual target x monthly share, per (year, month)
+            annual_targets, has_target = self._annual_targets(demand_scenarios, fy_values)
+            target_monthly = annual_targets[:, None] * shares[None, :]
+            
+            apply = has_target[:, None] & valid_shares[None, :] & (current_monthly > 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scale_factors = np.where(apply, target_monthly / current_monthly, 1.0).ravel()
             
+            forecast_df['demand'] = demand * scale_factors[period_codes]
             return forecast_df
             
         except Exception as e:
@@ -1413,56 +1971,32 @@ class LoadProfileGenerator:
     def _apply_load_factor_constraints(self, forecast_df, load_factors_data):
         """Apply monthly load factor constraints"""
         try:
-            # Month name to number mapping
-            month_map = {
-                'Apr': 1, 'May': 2, 'Jun': 3, 'Jul': 4, 'Aug': 5, 'Sep': 6,
-                'Oct': 7, 'Nov': 8, 'Dec': 9, 'Jan': 10, 'Feb': 11, 'Mar': 12
-            }
-            
             if load_factors_data.empty:
                 return forecast_df
             
-            lf_row = load_factors_data.iloc[0]  # Use first (average) row
+            target_lf = self._monthly_constraint_values(load_factors_data)
+            valid_lf = ~np.isnan(target_lf) & (target_lf > 0) & (target_lf <= 1)
             
-            # Apply load factor constraints for each financial year
-            for fy in forecast_df['financial_year'].unique():
-                for month_name, financial_month in month_map.items():
-                    if month_name not in lf_row:
-                        continue
-                    
-                    target_lf = lf_row[month_name]
-                    if pd.isna(target_lf) or target_lf <= 0 or target_lf > 1:
-                        continue
-                    
-                    # Filter data for this month and year
-                    mask = (forecast_df['financial_year'] == fy) & (forecast_df['financial_month'] == financial_month)
-                    
-                    if mask.sum() == 0:
-                        continue
-                    
-                    month_data = forecast_df.loc[mask, 'demand']
-                    if month_data.empty:
-                        continue
-                    
-                    # Calculate current load factor
-                    current_avg = month_data.mean()
-                    current_peak = month_data.max()
-                    
-                    if current_peak <= 0:
-                        continue
-                    
-                    current_lf = current_avg / current_peak
-                    
-                    # Adjust if needed (only if significantly different)
-                    if abs(current_lf - target_lf) > 0.05:  # 5% tolerance
-                        # Calculate required average to achieve target load factor
-                        target_avg = target_lf * current_peak
-                        
-                        # Scale demands to achieve target average
-                        if current_avg > 0:
-                            scale_factor = target_avg / current_avg
-                            forecast_df.loc[mask, 'demand'] *= scale_factor
+            demand = forecast_df['demand'].to_numpy(dtype=float)
+            fy_values, _, period_codes = self._financial_period_codes(forecast_df)
+            n_groups = len(fy_values) * 13
+            
+            sums, counts = self._group_sums(demand, period_codes, n_groups)
+            current_peak = np.full(n_groups, np.nan)
+            np.fmax.at(current_peak, period_codes, demand)
             
+            with np.errstate(divide='ignore', invalid='ignore'):
+                current_avg = sums / counts
+                current_lf = current_avg / current_peak
+                
+                # Adjust if needed (only if significantly different, 5% tolerance):
+                # scale so the average reaches target_lf x current peak
+                group_lf = np.tile(target_lf, len(fy_values))
+                apply = (np.tile(valid_lf, len(fy_values)) & (current_peak > 0) &
+                         (np.abs(current_lf - group_lf) > 0.05) & (current_avg > 0))
+                scale_factors = np.where(apply, group_lf * current_peak / current_avg, 1.0)
+            
+            forecast_df['demand'] = demand * scale_factors[period_codes]
             return forecast_df
             
         except Exception as e:
@@ -1516,8 +2050,8 @@ class LoadProfileGenerator:
         
     def save_forecast(self, forecast_results, profile_id=None):
         """
-        Save forecast results to CSV file with format
-        Output columns: datetime, Demand (kW), Date, Time, Fiscal_Year, Year
+        Save forecast results in the compact profile format (see utils.profile_store)
+        Exported CSV columns: datetime, Demand (kW), Date, Time, Fiscal_Year, Year
         """
         try:
             if not profile_id:
@@ -1526,112 +2060,95 @@ class LoadProfileGenerator:
                 profile_id = f"{method}_{timestamp}"
             
             # Get forecast data
-            forecast_df = forecast_results['forecast'].copy()
+            forecast_df = forecast_results['forecast']
             
             # Ensure we have the required columns
             if 'ds' not in forecast_df.columns or 'demand' not in forecast_df.columns:
                 raise ValueError("Forecast data must contain 'ds' and 'demand' columns")
             
-            # Create output dataframe with required format
-            output_df = pd.DataFrame()
-            
-            # Convert demand to kW (assuming input is in kW, but ensure consistency)
-            # If demand is in MW, multiply by 1000; if in GW, multiply by 1,000,000
-            demand_values = forecast_df['demand'].copy()
-            
-            # Create output columns in the specified order
-            output_df['datetime'] = pd.to_datetime(forecast_df['ds'])
-            output_df['Demand (kW)'] = demand_values.round(2)
-            
-            # Extract date and time components
-            output_df['Date'] = output_df['datetime'].dt.date
-            output_df['Time'] = output_df['datetime'].dt.time
+            # Sort by datetime to ensure chronological order; demand is in kW
+            series = pd.DataFrame({
+                'ds': pd.to_datetime(forecast_df['ds']).to_numpy(),
+                'demand': forecast_df['demand'].to_numpy(dtype=float).round(2)
+            }).sort_values('ds', kind='stable').reset_index(drop=True)
             
-            # Add financial year and calendar year
-            if 'financial_year' in forecast_df.columns:
-                output_df['Fiscal_Year'] = forecast_df['financial_year']
+            if PROFILE_PARQUET_AVAILABLE:
+                profile_path = write_profile(self.results_path, profile_id, series['ds'], series['demand'])
+                storage_format = 'parquet'
             else:
-                # Calculate financial year from datetime (April to March)
-                output_df['Fiscal_Year'] = np.where(
-                    output_df['datetime'].dt.month >= 4,
-                    output_df['datetime'].dt.year + 1,
-                    output_df['datetime'].dt.year
-                )
-            
-            output_df['Year'] = output_df['datetime'].dt.year
-            
-            # Add hour column for reference (useful for analysis)
-            if 'hour' in forecast_df.columns:
-                output_df['Hour'] = forecast_df['hour']
-            else:
-                output_df['Hour'] = output_df['datetime'].dt.hour
-            
-            # Sort by datetime to ensure chronological order
-            output_df = output_df.sort_values('datetime').reset_index(drop=True)
-            
-            # Save to CSV with the specified column order
-            csv_path = self.results_path / f"{profile_id}.csv"
-            output_df.to_csv(csv_path, index=False)
+                profile_path = self.results_path / f"{profile_id}.csv"
+                series_to_export_frame(series['ds'], series['demand']).to_csv(profile_path, index=False)
+                storage_format = 'csv'
             
             # Create summary statistics for metadata
+            demand_values = series['demand']
+            fiscal_years = np.where(series['ds'].dt.month >= 4, series['ds'].dt.year + 1, series['ds'].dt.year)
             summary_stats = {
-                'total_records': len(output_df),
+                'total_records': len(series),
                 'date_range': {
-                    'start': output_df['datetime'].min().isoformat(),
-                    'end': output_df['datetime'].max().isoformat()
+                    'start': series['ds'].min().isoformat(),
+                    'end': series['ds'].max().isoformat()
                 },
                 'demand_stats_kW': {
-                    'min': float(output_df['Demand (kW)'].min()),
-                    'max': float(output_df['Demand (kW)'].max()),
-                    'mean': float(output_df['Demand (kW)'].mean()),
-                    'std': float(output_df['Demand (kW)'].std())
+                    'min': float(demand_values.min()),
+                    'max': float(demand_values.max()),
+                    'mean': float(demand_values.mean()),
+                    'std': float(demand_values.std())
                 },
                 'fiscal_years': {
-                    'start': int(output_df['Fiscal_Year'].min()),
-                    'end': int(output_df['Fiscal_Year'].max()),
-                    'count': len(output_df['Fiscal_Year'].unique())
-                },
-                'load_factor': float(output_df['Demand (kW)'].mean() / output_df['Demand (kW)'].max()) if output_df['Demand (kW)'].max() > 0 else 0
-            }
-            
-            # Save metadata
-            metadata = {
-                'profile_id': profile_id,
-                'method': forecast_results.get('method'),
-                'generated_at': forecast_results.get('metadata', {}).get('generated_at'),
-                'start_fy': int(output_df['Fiscal_Year'].min()),
-                'end_fy': int(output_df['Fiscal_Year'].max()),
-                'output_format': {
-                    'columns': list(output_df.columns),
-                    'demand_unit': 'kW',
-                    'timestamp_format': 'datetime',
-                    'total_hours': len(output_df)
+                    'start': int(fiscal_years.min()),
+                    'end': int(fiscal_years.max()),
+                    'count': len(np.unique(fiscal_years))
                 },
-                'summary_statistics': summary_stats,
-                'validation': forecast_results.get('validation'),
-                'file_info': get_file_info(str(csv_path))
+                'load_factor': float(demand_values.mean() / demand_values.max()) if demand_values.max() > 0 else 0
             }
             
-            metadata_path = self.config_path / f"{profile_id}_metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2, default=str)
-            
-            logger.info(f"Saved forecast to {csv_path} with {len(output_df)} records")
-            logger.info(f"Output format: {list(output_df.columns)}")
-            logger.info(f"Demand range: {summary_stats['demand_stats_kW']['min']:.1f} - {summary_stats['demand_stats_kW']['max']:.1f} kW")
-            
-            return {
-                'profile_id': profile_id,
-                'csv_path': str(csv_path),
-                'metadata_path': str(metadata_path),
-                'file_size': metadata['file_info']['size_mb'],
-                'summary_stats': summary_stats
-            }
+            return self._save_profile_metadata(profile_id, forecast_results, profile_path, storage_format, summary_stats)
             
         except Exception as e:
             logger.error(f"Error saving forecast: {e}")
             raise
 
+    def _save_profile_metadata(self, profile_id, forecast_results, profile_path, storage_format,
+                               summary_stats, extra_metadata=None):
+        """Write {profile_id}_metadata.json for a stored profile and return its save info"""
+        metadata = {
+            'profile_id': profile_id,
+            'method': forecast_results.get('method'),
+            'demand_scenario': forecast_results.get('demand_scenario'),
+            'generated_at': forecast_results.get('metadata', {}).get('generated_at'),
+            'start_fy': summary_stats['fiscal_years']['start'],
+            'end_fy': summary_stats['fiscal_years']['end'],
+            'output_format': {
+                'columns': EXPORT_COLUMNS,
+                'demand_unit': 'kW',
+                'timestamp_format': 'datetime',
+                'total_hours': summary_stats['total_records'],
+                'storage_format': storage_format,
+                'frequency': forecast_results.get('frequency')
+            },
+            'summary_statistics': summary_stats,
+            'validation': forecast_results.get('validation'),
+            'file_info': get_file_info(str(profile_path))
+        }
+        metadata.update(extra_metadata or {})
+        
+        metadata_path = self.config_path / f"{profile_id}_metadata.json"
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f, indent=2, default=str)
+        
+        logger.info(f"Saved forecast to {profile_path} with {summary_stats['total_records']} records ({storage_format})")
+        logger.info(f"Demand range: {summary_stats['demand_stats_kW']['min']:.1f} - {summary_stats['demand_stats_kW']['max']:.1f} kW")
+        
+        return {
+            'profile_id': profile_id,
+            'file_path': str(profile_path),
+            'storage_format': storage_format,
+            'metadata_path': str(metadata_path),
+            'file_size': metadata['file_info']['size_mb'],
+            'summary_stats': summary_stats
+        }
+
     def get_saved_profiles(self):
         """Get list of saved load profiles"""
         try:
@@ -1640,14 +2157,13 @@ class LoadProfileGenerator:
             if not self.results_path.exists():
                 return profiles
             
-            for csv_file in self.results_path.glob("*.csv"):
-                profile_id = csv_file.stem
+            for profile_id, profile_file in list_profile_files(self.results_path).items():
                 metadata_file = self.config_path / f"{profile_id}_metadata.json"
                 
                 profile_info = {
                     'profile_id': profile_id,
-                    'csv_path': str(csv_file),
-                    'file_info': get_file_info(str(csv_file))
+                    'file_path': str(profile_file),
+                    'file_info': get_file_info(str(profile_file))
                 }
                 
                 # Load metadata if available
@@ -1675,14 +2191,11 @@ class LoadProfileGenerator:
         """Get profile data with proper column handling"""
         try:
             # Find profile file
-            csv_path = self.results_path / f"{profile_id}.csv"
+            profile_path = get_profile_path(self.results_path, profile_id)
             
-            if not csv_path.exists():
+            if profile_path is None:
                 raise FileNotFoundError(f"Profile not found: {profile_id}")
             
-            # Load profile data
-            profile_df = pd.read_csv(csv_path)
-            
             # Load metadata if available
             metadata_path = self.config_path / f"{profile_id}_metadata.json"
             metadata = {}
@@ -1690,6 +2203,22 @@ class LoadProfileGenerator:
                 with open(metadata_path, 'r') as f:
                     metadata = json.load(f)
             
+            if profile_path.suffix == PROFILE_EXTENSION:
+                # Binary profile: statistics from the demand array, export columns only for the sample
+                series = read_profile_series(profile_path)
+                profile_data = self._summarize_profile_data(
+                    profile_id, profile_path, metadata, series, 'datetime', DEMAND_COLUMN, EXPORT_COLUMNS
+                )
+                sample = series.head(100)
+                sample_df = series_to_export_frame(sample['ds'], sample['demand'])
+                # Same text values a CSV round trip would give
+                sample_df = sample_df.astype({'datetime': str, 'Date': str, 'Time': str})
+                profile_data['sample_data'] = sample_df.to_dict('records')
+                return profile_data
+            
+            # Load legacy CSV profile data
+            profile_df = pd.read_csv(profile_path)
+            
             # Determine demand column (handle both old and new formats)
             demand_col = None
             if 'Demand (kW)' in profile_df.columns:
@@ -1705,18 +2234,6 @@ class LoadProfileGenerator:
             if not demand_col:
                 raise ValueError(f"No demand column found in profile {profile_id}")
             
-            # Prepare response data
-            profile_data = {
-                'profile_id': profile_id,
-                'file_info': get_file_info(str(csv_path)),
-                'data_summary': {
-                    'total_records': len(profile_df),
-                    'columns': list(profile_df.columns),
-                    'demand_column': demand_col
-                },
-                'metadata': metadata
-            }
-            
             # Add date range if datetime column exists
             datetime_col = None
             if 'datetime' in profile_df.columns:
@@ -1724,20 +2241,13 @@ class LoadProfileGenerator:
             elif 'ds' in profile_df.columns:
                 datetime_col = 'ds'
             
-            if datetime_col:
-                profile_data['data_summary']['date_range'] = {
-                    'start': profile_df[datetime_col].min(),
-                    'end': profile_df[datetime_col].max()
-                }
-            
-            # Add demand statistics
-            if demand_col:
-                profile_data['data_summary']['demand_stats'] = {
-                    'min': float(profile_df[demand_col].min()),
-                    'max': float(profile_df[demand_col].max()),
-                    'mean': float(profile_df[demand_col].mean()),
-                    'std': float(profile_df[demand_col].std())
-                }
+            series = pd.DataFrame({
+                'ds': profile_df[datetime_col] if datetime_col else None,
+                'demand': profile_df[demand_col]
+            })
+            profile_data = self._summarize_profile_data(
+                profile_id, profile_path, metadata, series, datetime_col, demand_col, list(profile_df.columns)
+            )
             
             # Optional: Include sample data (first 100 records)
             sample_size = min(100, len(profile_df))
@@ -1747,4 +2257,33 @@ class LoadProfileGenerator:
             
         except Exception as e:
             logger.error(f"Error getting profile data for {profile_id}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def _summarize_profile_data(self, profile_id, profile_path, metadata, series, datetime_col, demand_col, columns):
+        """Response skeleton of get_profile_data from a ('ds', 'demand') series"""
+        profile_data = {
+            'profile_id': profile_id,
+            'file_info': get_file_info(str(profile_path)),
+            'data_summary': {
+                'total_records': len(series),
+                'columns': columns,
+                'demand_column': demand_col
+            },
+            'metadata': metadata
+        }
+        
+        if datetime_col:
+            start, end = series['ds'].min(), series['ds'].max()
+            profile_data['data_summary']['date_range'] = {
+                'start': start.isoformat() if isinstance(start, pd.Timestamp) else start,
+                'end': end.isoformat() if isinstance(end, pd.Timestamp) else end
+            }
+        
+        # Add demand statistics
+        profile_data['data_summary']['demand_stats'] = {
+            'min': float(series['demand'].min()),
+            'max': float(series['demand'].max()),
+            'mean': float(series['demand'].mean()),
+            'std': float(series['demand'].std())
+        }
+        return profile_data
\ No newline at end of file
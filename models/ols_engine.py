@@ -0,0 +1,233 @@
+# models/ols_engine.py
+"""
+Closed-form batched least-squares engine for the MLR and SLR forecasting models.
+
+Replaces GridSearchCV(LinearRegression, TimeSeriesSplit) plus the two refits done
+later for prediction and evaluation. Every least-squares problem a sector needs
+(each CV fold, the training split and the full history, for both fit_intercept
+options) is zero-padded into one (n_fits, rows, cols) tensor and solved with a
+single batched pseudo-inverse. Zero rows add nothing to the residual and zero
+columns get a zero coefficient, so padding does not change any solution.
+
+Selection follows GridSearchCV: mean R² over TimeSeriesSplit folds, NaN scores
+rank last, ties keep the first option (fit_intercept=True).
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Same search space GridSearchCV was given, in ParameterGrid order
+INTERCEPT_OPTIONS = (True, False)
+MAX_CV_SPLITS = 5
+
+
+@dataclass
+class OLSProblem:
+    """One regression model to fit (e.g. the MLR or SLR model of one sector)"""
+    name: str
+    X_train: np.ndarray
+    y_train: np.ndarray
+    X_test: Optional[np.ndarray] = None
+    y_test: Optional[np.ndarray] = None
+    X_full: Optional[np.ndarray] = None
+    y_full: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        self.X_train = _as_2d(self.X_train)
+        self.y_train = np.asarray(self.y_train, dtype=float).ravel()
+        self.X_test = _as_2d(self.X_test) if self.X_test is not None else np.empty((0, self.X_train.shape[1]))
+        self.y_test = np.asarray(self.y_test, dtype=float).ravel() if self.y_test is not None else np.empty(0)
+        self.X_full = _as_2d(self.X_full) if self.X_full is not None else self.X_train
+        self.y_full = np.asarray(self.y_full, dtype=float).ravel() if self.y_full is not None else self.y_train
+
+    @property
+    def n_splits(self) -> int:
+        """Number of TimeSeriesSplit folds, as previously chosen for GridSearchCV"""
+        return min(MAX_CV_SPLITS, len(self.y_train) - 1)
+
+
+@dataclass
+class OLSResult:
+    """Fitted coefficients, CV scores and test metrics for one OLSProblem"""
+    name: str
+    fit_intercept: bool
+    coef: np.ndarray
+    intercept: float
+    train_coef: np.ndarray
+    train_intercept: float
+    cv_scores: Dict[bool, float] = field(default_factory=dict)
+    test_metrics: Dict[str, float] = field(default_factory=dict)
+    cross_validated: bool = True
+
+    @property
+    def best_params_(self) -> Dict[str, bool]:
+        return {'fit_intercept': self.fit_intercept}
+
+    def predict(self, X) -> np.ndarray:
+        """Predict with the model used for forecasting"""
+        return _as_2d(X) @ self.coef + self.intercept
+
+    def predict_train_model(self, X) -> np.ndarray:
+        """Predict with the model fitted on the training split only"""
+        return _as_2d(X) @ self.train_coef + self.train_intercept
+
+
+def _as_2d(X) -> np.ndarray:
+    X = np.asarray(X, dtype=float)
+    return X.reshape(-1, 1) if X.ndim == 1 else X
+
+
+def time_series_folds(n_samples: int, n_splits: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Train/test index pairs identical to sklearn's TimeSeriesSplit(n_splits)"""
+    test_size = n_samples // (n_splits + 1)
+    indices = np.arange(n_samples)
+    folds = []
+    for test_start in range(n_samples - n_splits * test_size, n_samples, test_size):
+        folds.append((indices[:test_start], indices[test_start:test_start + test_size]))
+    return folds
+
+
+def r2(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """R² with sklearn's conventions (NaN below 2 samples, finite for constant targets)"""
+    if len(y_true) < 2:
+        return np.nan
+    ss_res = float(np.sum((y_true - y_pred) ** 2))
+    ss_tot = float(np.sum((y_true - np.mean(y_true)) ** 2))
+    if ss_tot == 0:
+        return 1.0 if ss_res == 0 else 0.0
+    return 1.0 - ss_res / ss_tot
+
+
+def regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    """MSE, R² and MAPE (%) matching the previous sklearn-based evaluate_model"""
+    if len(y_true) == 0 or len(y_pred) == 0:
+        return {'MSE': np.nan, 'R²': np.nan, 'MAPE (%)': np.nan}
+
+    mse = float(np.mean((y_true - y_pred) ** 2))
+    if (y_true == 0).any():
+        mape = np.nan
+    else:
+        eps = np.finfo(np.float64).eps
+        mape = float(np.mean(np.abs(y_true - y_pred) / np.maximum(np.abs(y_true), eps))) * 100
+
+    return {'MSE': mse, 'R²': r2(y_true, y_pred), 'MAPE (%)': mape}
+
+
+def solve_least_squares_batch(designs: List[Tuple[np.ndarray, np.ndarray, bool]]) -> List[Tuple[np.ndarray, float]]:
+    """
+    Solve many least-squares problems with one batched pseudo-inverse.
+
+    Args:
+        designs: (X, y, fit_intercept) triples; X and y may differ in shape per problem
+
+    Returns:
+        list: (coef, intercept) per design, equal to LinearRegression(fit_intercept).fit(X, y)
+    """
+    if not designs:
+        return []
+
+    max_rows = max(X.shape[0] for X, _, _ in designs)
+    max_cols = max(X.shape[1] for X, _, _ in designs)
+    A = np.zeros((len(designs), max_rows, max_cols))
+    b = np.zeros((len(designs), max_rows))
+    offsets = []
+
+    for i, (X, y, fit_intercept) in enumerate(designs):
+        if fit_intercept:
+            # Centre like LinearRegression so the intercept is not part of the minimum-norm solve
+            x_offset, y_offset = X.mean(axis=0), y.mean()
+        else:
+            x_offset, y_offset = np.zeros(X.shape[1]), 0.0
+        A[i, :X.shape[0], :X.shape[1]] = X - x_offset
+        b[i, :X.shape[0]] = y - y_offset
+        offsets.append((x_offset, y_offset))
+
+    coefs = np.einsum('kcr,kr->kc', np.linalg.pinv(A), b)
+
+    solutions = []
+    for i, (X, _, _) in enumerate(designs):
+        coef = coefs[i, :X.shape[1]]
+        x_offset, y_offset = offsets[i]
+        solutions.append((coef, float(y_offset - x_offset @ coef)))
+    return solutions
+
+
+def fit_ols_batch(problems: List[OLSProblem]) -> List[OLSResult]:
+    """
+    Cross-validate fit_intercept, fit and evaluate every problem in one factorization.
+
+    Problems can come from any number of sectors. For each problem the batch holds,
+    per intercept option, one fit per TimeSeriesSplit fold, one on the training split
+    (for test metrics) and one on the full history (for the forecast). With fewer than
+    two folds no CV is run and, as before, the training-split fit with an intercept is
+    used for both evaluation and forecasting.
+
+    Returns:
+        list: OLSResult per problem, in input order
+    """
+    designs = []
+    layout = []
+
+    for problem in problems:
+        n_splits = problem.n_splits
+        folds = time_series_folds(len(problem.y_train), n_splits) if n_splits >= 2 else []
+        options = INTERCEPT_OPTIONS if folds else (True,)
+        entry = {'folds': folds, 'options': options, 'slots': {}}
+
+        for fit_intercept in options:
+            fold_slots = []
+            for train_idx, _ in folds:
+                fold_slots.append(len(designs))
+                designs.append((problem.X_train[train_idx], problem.y_train[train_idx], fit_intercept))
+            train_slot = len(designs)
+            designs.append((problem.X_train, problem.y_train, fit_intercept))
+            full_slot = None
+            if folds:
+                full_slot = len(designs)
+                designs.append((problem.X_full, problem.y_full, fit_intercept))
+            entry['slots'][fit_intercept] = (fold_slots, train_slot, full_slot)
+        layout.append(entry)
+
+    solutions = solve_least_squares_batch(designs)
+
+    results = []
+    for problem, entry in zip(problems, layout):
+        cv_scores = {}
+        for fit_intercept in entry['options']:
+            fold_slots, _, _ = entry['slots'][fit_intercept]
+            scores = []
+            for slot, (_, test_idx) in zip(fold_slots, entry['folds']):
+                coef, intercept = solutions[slot]
+                y_pred = problem.X_train[test_idx] @ coef + intercept
+                scores.append(r2(problem.y_train[test_idx], y_pred))
+            cv_scores[fit_intercept] = float(np.mean(scores)) if scores else np.nan
+
+        # First option with the highest mean score wins; NaN ranks last
+        best = max(entry['options'], key=lambda opt: -np.inf if np.isnan(cv_scores[opt]) else cv_scores[opt])
+        _, train_slot, full_slot = entry['slots'][best]
+        train_coef, train_intercept = solutions[train_slot]
+        coef, intercept = solutions[full_slot] if full_slot is not None else solutions[train_slot]
+
+        test_metrics = {}
+        if len(problem.y_test) > 0:
+            y_pred_test = problem.X_test @ train_coef + train_intercept
+            test_metrics = regression_metrics(problem.y_test, y_pred_test)
+
+        results.append(OLSResult(
+            name=problem.name,
+            fit_intercept=best,
+            coef=coef,
+            intercept=intercept,
+            train_coef=train_coef,
+            train_intercept=train_intercept,
+            cv_scores=cv_scores,
+            test_metrics=test_metrics,
+            cross_validated=bool(entry['folds'])
+        ))
+        logger.debug(f"OLS {problem.name}: fit_intercept={best}, cv_scores={cv_scores}")
+
+    return results
@@ -0,0 +1,114 @@
+# models/stl_cache.py
+"""
+Persistent on-disk cache for STL decompositions of historical load data.
+
+Robust STL with an annual (8760 h) period over several years of hourly history
+takes minutes, yet its output only depends on the historical series and the STL
+parameters. Demand scenarios, constraints and load-factor targets are applied
+afterwards, so what-if forecasts that only change those reuse the cached
+decomposition. Entries are .npz files named by a SHA-256 of the series and the
+parameters; the directory is trimmed least-recently-used first once it grows
+past a size limit.
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from models.disk_cache import DiskLRUCache
+from utils.constants import MODEL_CACHE
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+# stl_params entries that control caching/engine selection rather than the decomposition itself
+NON_DECOMPOSITION_PARAMS = ('use_cache', 'compare_with_exact')
+
+_SERIES_KEYS = ('trend', 'seasonal', 'resid')
+_SCALAR_KEYS = ('trend_growth_rate', 'seasonal_strength', 'noise_level', 'quality_score')
+
+
+def default_stl_cache_dir(project_path: str) -> str:
+    """Project-level cache directory <project>/results/cache/stl_decompositions"""
+    return os.path.join(str(project_path), 'results', MODEL_CACHE['DIR_NAME'], MODEL_CACHE['STL_SUBDIR'])
+
+
+def _nanoseconds(index: pd.DatetimeIndex) -> np.ndarray:
+    """int64 nanoseconds whatever the index resolution (pandas 2+ may use 'us' or 's')"""
+    return index.as_unit('ns').asi8 if hasattr(index, 'as_unit') else index.asi8
+
+
+def _library_versions() -> Dict[str, str]:
+    try:
+        import statsmodels
+        statsmodels_version = statsmodels.__version__
+    except ImportError:
+        statsmodels_version = None
+    return {'statsmodels': statsmodels_version, 'numpy': np.__version__}
+
+
+class STLDecompositionCache(DiskLRUCache):
+    """Size-bounded, process-safe cache of STL decomposition results"""
+
+    extension = '.npz'
+    label = 'STL cache'
+
+    def __init__(self, cache_dir: str, max_bytes: int = MODEL_CACHE['STL_MAX_BYTES']):
+        super().__init__(cache_dir, max_bytes)
+
+    @staticmethod
+    def make_key(historical_data: pd.DataFrame, stl_params: Dict[str, Any]) -> str:
+        """Hash the (ds, demand) series in time order together with the STL parameters"""
+        data = historical_data[['ds', 'demand']].sort_values('ds')
+        digest = hashlib.sha256()
+        digest.update(_nanoseconds(pd.DatetimeIndex(data['ds'])).tobytes())
+        digest.update(data['demand'].to_numpy(dtype=float).tobytes())
+
+        params = {k: v for k, v in (stl_params or {}).items() if k not in NON_DECOMPOSITION_PARAMS}
+        payload = {
+            'version': CACHE_FORMAT_VERSION,
+            'stl_params': params,
+            'libraries': _library_versions()
+        }
+        digest.update(json.dumps(payload, sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached decomposition (same layout as the live result) or None"""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                index = pd.DatetimeIndex(entry['index'].astype('datetime64[ns]'), freq='h')
+                result = {name: pd.Series(entry[name], index=index) for name in _SERIES_KEYS}
+                result.update({name: float(entry[name]) for name in _SCALAR_KEYS})
+                result['original_index'] = index
+                result['seasonal_pattern'] = entry['seasonal_pattern']
+                result['baseline_stats'] = json.loads(str(entry['baseline_stats']))
+            self._touch(path)
+            return result
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable STL cache entry {key}: {e}")
+            self._remove(path)
+            return None
+
+    def put(self, key: str, stl_result: Dict[str, Any]) -> None:
+        """Store a decomposition atomically, then enforce the size limit; failures are only logged"""
+        def write(f):
+            index = pd.DatetimeIndex(stl_result['original_index'])
+            arrays = {
+                'index': _nanoseconds(index),
+                'seasonal_pattern': np.asarray(stl_result['seasonal_pattern'], dtype=float),
+                'baseline_stats': np.array(json.dumps(stl_result['baseline_stats']))
+            }
+            arrays.update({name: np.asarray(stl_result[name], dtype=float) for name in _SERIES_KEYS})
+            arrays.update({name: np.array(float(stl_result.get(name, 0))) for name in _SCALAR_KEYS})
+            np.savez(f, **arrays)
+
+        self._write_atomic(key, write, binary=True)
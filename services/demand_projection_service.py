@@ -5,23 +5,30 @@ Handles all business logic for demand forecasting and projection with real data
 """
 import os
 import json
+import hashlib
 import threading
+import multiprocessing
 import uuid
 import time
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from queue import Empty
+
+import pandas as pd
 
 from utils.constants import JOB_STATUS, FORECAST_MODELS, VALIDATION_RULES, ERROR_MESSAGES
-from utils.data_loading import input_demand_data, validate_input_file
+from utils.data_loading import input_demand_data, validate_input_file, read_input_workbook
+from utils.input_snapshot import load_input_snapshot, read_source_identity, save_input_snapshot
 from utils.demand_utils import (
     handle_nan_values, safe_numeric_conversion, create_summary,
     validate_project_path, validate_year_range
 )
 from utils.response_utils import handle_exception_response
 from utils.service_cache_mixin import ServiceCacheMixin
-from models.forecasting import Main_forecasting_function
+from models.forecasting import Main_forecasting_function, forecast_shared_series
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +42,8 @@ class ForecastJobConfig:
     detailed_configuration: Dict[str, Any] = None
     request_timestamp: str = None
     user_metadata: Dict[str, Any] = None
+    max_workers: int = 1  # 1 = serial execution, >1 = process pool with this many workers
+    reuse_unchanged_sectors: bool = True  # Skip sectors whose input fingerprint matches the last run
 
     def __post_init__(self):
         if self.detailed_configuration is None:
@@ -54,6 +63,7 @@ class SectorProcessingResult:
     error: str = None
     processing_time_seconds: float = 0
     configuration_used: Dict[str, Any] = None
+    reused: bool = False  # Result files kept from a previous run with identical inputs
     
     def __post_init__(self):
         if self.models_used is None:
@@ -61,6 +71,33 @@ class SectorProcessingResult:
         if self.configuration_used is None:
             self.configuration_used = {}
 
+def _forecast_sector_in_process(sector_name: str, sector_data, forecast_dir: str,
+                                selected_models: List[str], model_params: Dict[str, Any],
+                                target_year: int, exclude_covid: bool,
+                                progress_queue, cancel_event,
+                                shared_forecasts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Process pool entry point: forecast a single sector and report progress through a queue"""
+    if cancel_event.is_set():
+        return {'status': 'cancelled', 'message': 'Skipped because the job was cancelled'}
+    
+    def progress_callback(progress_percent, current_sector, message):
+        progress_queue.put((current_sector, progress_percent, message))
+    
+    sector_start_time = time.time()
+    result = Main_forecasting_function(
+        sheet_name=sector_name,
+        forecast_path=forecast_dir,
+        main_df=sector_data,
+        selected_models=selected_models,
+        model_params=model_params,
+        target_year=target_year,
+        exclude_covid=exclude_covid,
+        progress_callback=progress_callback,
+        shared_forecasts=shared_forecasts
+    )
+    result['processing_time_seconds'] = time.time() - sector_start_time
+    return result
+
 class ForecastJobManager:
     """ job manager with comprehensive tracking and thread safety"""
     
@@ -375,8 +412,21 @@ class DemandProjectionService(ServiceCacheMixin):
             if not os.path.exists(self.input_file_path):
                 raise FileNotFoundError(f"Input file not found: {self.input_file_path}")
             
+            # Snapshot written by any worker from the same, already validated workbook
+            data = load_input_snapshot(self.input_file_path)
+            if data is not None:
+                self._set_cached(cache_key, data)
+                logger.info(f"Loaded input data from snapshot: {len(data[0])} sectors, {len(data[1])} missing")
+                return data
+            
+            # Identify the workbook before parsing, so a snapshot is only tagged with the file it was read from
+            source = read_source_identity(self.input_file_path)
+            
+            # Parse the workbook once; validation and loading share the parsed sheets
+            workbook = read_input_workbook(self.input_file_path)
+            
             # Validate file first
-            validation_result = validate_input_file(self.input_file_path)
+            validation_result = validate_input_file(self.input_file_path, *workbook)
             if not validation_result['valid']:
                 raise ValueError(f"Input file validation failed: {'; '.join(validation_result['errors'])}")
             
@@ -385,8 +435,10 @@ class DemandProjectionService(ServiceCacheMixin):
                 logger.warning(f"Input file warning: {warning}")
             
             # Load data using the real data loading function
-            data = input_demand_data(self.input_file_path)
+            data = input_demand_data(self.input_file_path, workbook=workbook)
             self._set_cached(cache_key, data)
+            if data[0]:
+                save_input_snapshot(self.input_file_path, data, source)
             
             sectors, missing_sectors, param_dict, sector_data_map, aggregated_ele = data
             logger.info(f"Loaded input data: {len(sectors)} sectors, {len(missing_sectors)} missing")
@@ -926,6 +978,12 @@ class DemandProjectionService(ServiceCacheMixin):
         if len(config.sector_configs) > 20:
             errors.append("Too many sectors (maximum 20 allowed)")
         
+        # Validate parallel execution settings
+        if (not isinstance(config.max_workers, int)
+                or config.max_workers < VALIDATION_RULES['MIN_FORECAST_WORKERS']
+                or config.max_workers > VALIDATION_RULES['MAX_FORECAST_WORKERS']):
+            errors.append(f"Worker count must be between {VALIDATION_RULES['MIN_FORECAST_WORKERS']} and {VALIDATION_RULES['MAX_FORECAST_WORKERS']}")
+        
         # Load input data to validate sectors exist
         try:
             sectors, _, param_dict, sector_data_map, _ = self._load_input_data()
@@ -1022,17 +1080,58 @@ class DemandProjectionService(ServiceCacheMixin):
                 message='Saving forecast configuration...'
             )
             
-            config_data = self._create_complete_configuration(config, sectors, param_dict)
             config_path = os.path.join(forecast_dir, 'forecast_config.json')
             
+            # Sectors whose inputs and settings match the previous run keep their result files
+            sector_fingerprints = {
+                sector_name: self._compute_sector_fingerprint(
+                    sector_data_map[sector_name], sector_config, config, param_dict
+                )
+                for sector_name, sector_config in config.sector_configs.items()
+            }
+            reused_statuses = self._find_reusable_sectors(config, config_path, forecast_dir, sector_fingerprints)
+            reused_sectors = list(reused_statuses)
+            
+            config_data = self._create_complete_configuration(config, sectors, param_dict)
+            # Only fingerprints of results known to be valid are recorded until the run finishes
+            self._record_sector_fingerprints(config_data, sector_fingerprints, reused_statuses)
+            
             with open(config_path, 'w') as f:
                 json.dump(config_data, f, indent=4, default=str)
             
             logger.info(f"Saved complete configuration to {config_path}")
             
+            run_config = replace(config, sector_configs={
+                sector_name: sector_config
+                for sector_name, sector_config in config.sector_configs.items()
+                if sector_name not in reused_sectors
+            })
+            if reused_sectors:
+                logger.info(f"Reusing unchanged sectors: {reused_sectors}")
+            
+            # Forecast indicator series shared by several sectors once, before the fan-out
+            job_manager.update_job(job_id,
+                progress=13,
+                message='Forecasting shared independent variables...'
+            )
+            shared_forecasts = self._forecast_shared_series(run_config, sector_data_map, forecast_dir)
+            
             # Track results
             sector_results = []
             total_sectors = len(config.sector_configs)
+            sectors_to_run = len(run_config.sector_configs)
+            
+            for sector_name, previous_status in reused_statuses.items():
+                sector_result = SectorProcessingResult(
+                    sector_name=sector_name,
+                    status=previous_status,
+                    message='Inputs unchanged since the last run, reused existing results',
+                    models_used=config.sector_configs[sector_name].get('models', []),
+                    configuration_used=config.sector_configs[sector_name],
+                    reused=True
+                )
+                sector_results.append(sector_result)
+                job_manager.mark_sector_result(job_id, sector_result)
             
             # Create progress callback for forecasting function
             def progress_callback(progress_percent, current_sector, message):
@@ -1046,71 +1145,95 @@ class DemandProjectionService(ServiceCacheMixin):
                 except Exception as callback_error:
                     logger.warning(f"Error in progress callback: {callback_error}")
             
-            # Process each sector
-            for idx, (sector_name, sector_config) in enumerate(config.sector_configs.items()):
-                sector_start_time = time.time()
-                
-                # Check for cancellation
-                current_job = job_manager.get_job(job_id)
-                if current_job and current_job['status'] == JOB_STATUS['CANCELLED']:
-                    logger.info(f"Job {job_id} cancelled during sector processing")
-                    return {'status': 'cancelled'}
-                
-                # Update progress
-                base_progress = 15 + int((idx / total_sectors) * 70)
+            worker_count = self._resolve_worker_count(run_config)
+            
+            if worker_count > 1:
                 job_manager.update_job(job_id,
-                    current_sector=sector_name,
-                    processed_sectors=idx,
-                    progress=base_progress,
-                    message=f'Processing {sector_name} ({idx+1}/{total_sectors})...'
+                    progress=15,
+                    message=f'Processing {sectors_to_run} sectors in parallel with {worker_count} workers...'
                 )
-                
-                try:
-                    # Execute forecasting for this sector
-                    result = self._execute_sector_forecast(
-                        sector_name, sector_config, forecast_dir,
-                        sector_data_map[sector_name], config, progress_callback
-                    )
+                parallel_results = self._execute_sectors_parallel(
+                    run_config, job_manager, job_id, forecast_dir, sector_data_map, worker_count,
+                    shared_forecasts
+                )
+                if parallel_results is None:
+                    logger.info(f"Job {job_id} cancelled during parallel sector processing")
+                    return {'status': 'cancelled'}
+                sector_results.extend(parallel_results)
+            else:
+                # Process each sector
+                for idx, (sector_name, sector_config) in enumerate(run_config.sector_configs.items()):
+                    sector_start_time = time.time()
                     
-                    # Create sector result with configuration details
-                    sector_processing_time = time.time() - sector_start_time
-                    sector_result = SectorProcessingResult(
-                        sector_name=sector_name,
-                        status='existing_data' if result.get('used_existing_data', False) else 'success',
-                        message=result.get('message', 'Processing completed'),
-                        models_used=result.get('models_used', sector_config.get('models', [])),
-                        processing_time_seconds=sector_processing_time,
-                        configuration_used=sector_config
+                    # Check for cancellation
+                    current_job = job_manager.get_job(job_id)
+                    if current_job and current_job['status'] == JOB_STATUS['CANCELLED']:
+                        logger.info(f"Job {job_id} cancelled during sector processing")
+                        return {'status': 'cancelled'}
+                    
+                    # Update progress
+                    base_progress = 15 + int((idx / sectors_to_run) * 70)
+                    job_manager.update_job(job_id,
+                        current_sector=sector_name,
+                        processed_sectors=len(reused_sectors) + idx,
+                        progress=base_progress,
+                        message=f'Processing {sector_name} ({idx+1}/{sectors_to_run})...'
                     )
                     
-                    sector_results.append(sector_result)
-                    job_manager.mark_sector_result(job_id, sector_result)
+                    try:
+                        # Execute forecasting for this sector
+                        result = self._execute_sector_forecast(
+                            sector_name, sector_config, forecast_dir,
+                            sector_data_map[sector_name], config, progress_callback,
+                            shared_forecasts
+                        )
                     
-                    logger.info(f"Sector {sector_name} processed successfully in {sector_processing_time:.2f}s")
+                        # Create sector result with configuration details
+                        sector_processing_time = time.time() - sector_start_time
+                        sector_result = SectorProcessingResult(
+                            sector_name=sector_name,
+                            status='existing_data' if result.get('used_existing_data', False) else 'success',
+                            message=result.get('message', 'Processing completed'),
+                            models_used=result.get('models_used', sector_config.get('models', [])),
+                            processing_time_seconds=sector_processing_time,
+                            configuration_used=sector_config
+                        )
                     
-                except Exception as sector_error:
-                    sector_processing_time = time.time() - sector_start_time
-                    error_msg = str(sector_error)
+                        sector_results.append(sector_result)
+                        job_manager.mark_sector_result(job_id, sector_result)
                     
-                    logger.exception(f"Error processing sector {sector_name}: {error_msg}")
+                        logger.info(f"Sector {sector_name} processed successfully in {sector_processing_time:.2f}s")
                     
-                    sector_result = SectorProcessingResult(
-                        sector_name=sector_name,
-                        status='failed',
-                        message=f'Processing failed: {error_msg}',
-                        error=error_msg,
-                        processing_time_seconds=sector_processing_time,
-                        configuration_used=sector_config
-                    )
+                    except Exception as sector_error:
+                        sector_processing_time = time.time() - sector_start_time
+                        error_msg = str(sector_error)
                     
-                    sector_results.append(sector_result)
-                    job_manager.mark_sector_result(job_id, sector_result)
+                        logger.exception(f"Error processing sector {sector_name}: {error_msg}")
                     
-                    # Continue processing other sectors
-                    job_manager.update_job(job_id,
-                        message=f'Error in {sector_name}, continuing with other sectors...'
-                    )
-                    continue
+                        sector_result = SectorProcessingResult(
+                            sector_name=sector_name,
+                            status='failed',
+                            message=f'Processing failed: {error_msg}',
+                            error=error_msg,
+                            processing_time_seconds=sector_processing_time,
+                            configuration_used=sector_config
+                        )
+                    
+                        sector_results.append(sector_result)
+                        job_manager.mark_sector_result(job_id, sector_result)
+                    
+                        # Continue processing other sectors
+                        job_manager.update_job(job_id,
+                            message=f'Error in {sector_name}, continuing with other sectors...'
+                        )
+                        continue
+            
+            # Record fingerprints of every sector whose result files are now current
+            self._record_sector_fingerprints(config_data, sector_fingerprints, {
+                r.sector_name: r.status for r in sector_results if r.status in ['success', 'existing_data']
+            })
+            with open(config_path, 'w') as f:
+                json.dump(config_data, f, indent=4, default=str)
             
             # Create comprehensive summary
             job_manager.update_job(job_id,
@@ -1136,6 +1259,9 @@ class DemandProjectionService(ServiceCacheMixin):
                 'execution_end': datetime.now().isoformat(),
                 'total_processing_time_seconds': sum(r.processing_time_seconds for r in sector_results),
                 'sectors_processed': len(sector_results),
+                'execution_mode': 'parallel' if worker_count > 1 else 'serial',
+                'worker_count': worker_count,
+                'sectors_reused': reused_sectors,
                 'configuration_file': 'forecast_config.json',
                 'summary_file': 'forecast_summary.json',
                 'version_info': {
@@ -1334,8 +1460,110 @@ class DemandProjectionService(ServiceCacheMixin):
     
     def _execute_sector_forecast(self, sector_name: str, sector_config: Dict,
                                 forecast_dir: str, sector_data, config: ForecastJobConfig,
-                                progress_callback: Callable = None) -> Dict:
+                                progress_callback: Callable = None,
+                                shared_forecasts: Optional[Dict[str, Any]] = None) -> Dict:
         """Execute forecast for a single sector using the real forecasting function"""
+        selected_models, model_params_config = self._build_model_params(sector_config)
+        
+        # Execute the real forecasting function with progress callback
+        return Main_forecasting_function(
+            sheet_name=sector_name,
+            forecast_path=forecast_dir,
+            main_df=sector_data,
+            selected_models=selected_models,
+            model_params=model_params_config,
+            target_year=config.target_year,
+            exclude_covid=config.exclude_covid_years,
+            progress_callback=progress_callback,
+            shared_forecasts=shared_forecasts
+        )
+    
+    @staticmethod
+    def _compute_sector_fingerprint(sector_data, sector_config: Dict, config: ForecastJobConfig,
+                                    param_dict: Dict) -> str:
+        """Content hash of everything that determines a sector's forecast output"""
+        selected_models, model_params_config = DemandProjectionService._build_model_params(sector_config)
+        settings = {
+            'selected_models': selected_models,
+            'model_params': model_params_config,
+            'target_year': config.target_year,
+            'exclude_covid': config.exclude_covid_years,
+            'workbook_parameters': {str(k): v for k, v in (param_dict or {}).items()},
+            'columns': [str(col) for col in sector_data.columns]
+        }
+        
+        digest = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+        try:
+            digest.update(pd.util.hash_pandas_object(sector_data, index=False).values.tobytes())
+        except TypeError:
+            # Mixed-type object columns cannot be hashed directly
+            digest.update(sector_data.to_csv(index=False).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _find_reusable_sectors(self, config: ForecastJobConfig, config_path: str, forecast_dir: str,
+                               sector_fingerprints: Dict[str, str]) -> Dict[str, str]:
+        """
+        Sectors whose fingerprint matches the previous run and whose result file still exists,
+        mapped to the result status recorded by that run
+        """
+        if not config.reuse_unchanged_sectors or not os.path.exists(config_path):
+            return {}
+        
+        try:
+            with open(config_path, 'r') as f:
+                previous_config = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read previous configuration {config_path}: {e}")
+            return {}
+        
+        previous_sectors = previous_config.get('sector_configurations', {})
+        reusable = {}
+        for sector_name, fingerprint in sector_fingerprints.items():
+            previous = previous_sectors.get(sector_name, {})
+            if (previous.get('input_fingerprint') == fingerprint
+                    and previous.get('result_status') in ('success', 'existing_data')
+                    and os.path.exists(os.path.join(forecast_dir, f'{sector_name}.xlsx'))):
+                reusable[sector_name] = previous['result_status']
+        return reusable
+    
+    @staticmethod
+    def _record_sector_fingerprints(config_data: Dict[str, Any], sector_fingerprints: Dict[str, str],
+                                    current_statuses: Dict[str, str]):
+        """Store fingerprints and result statuses for sectors with current results; clear the others"""
+        for sector_name, sector_configuration in config_data.get('sector_configurations', {}).items():
+            sector_configuration['input_fingerprint'] = (
+                sector_fingerprints.get(sector_name) if sector_name in current_statuses else None
+            )
+            sector_configuration['result_status'] = current_statuses.get(sector_name)
+    
+    def _forecast_shared_series(self, config: ForecastJobConfig, sector_data_map: Dict,
+                                forecast_dir: str) -> Dict[str, Any]:
+        """Forecast each distinct independent-variable series of the configured sectors once"""
+        sector_frames = {}
+        columns_by_sector = {}
+        for sector_name, sector_config in config.sector_configs.items():
+            sector_frames[sector_name] = sector_data_map[sector_name]
+            _, model_params_config = self._build_model_params(sector_config)
+            independent_vars = model_params_config.get('MLR', {}).get('independent_vars')
+            if independent_vars:
+                columns_by_sector[sector_name] = independent_vars
+        
+        try:
+            shared_forecasts = forecast_shared_series(
+                sector_frames, config.target_year,
+                columns_by_sector=columns_by_sector,
+                forecast_path=forecast_dir
+            )
+            logger.info(f"Prepared {len(shared_forecasts)} shared independent variable forecasts")
+            return shared_forecasts
+        except Exception as e:
+            # Sectors fall back to forecasting their own series
+            logger.warning(f"Shared independent variable forecasting failed: {e}")
+            return {}
+    
+    @staticmethod
+    def _build_model_params(sector_config: Dict) -> Tuple[List[str], Dict[str, Any]]:
+        """Translate a UI sector configuration into forecasting function arguments"""
         selected_models = sector_config.get('models', ['MLR', 'SLR', 'WAM', 'TimeSeries'])
         
         # Prepare model parameters
@@ -1348,17 +1576,125 @@ class DemandProjectionService(ServiceCacheMixin):
             window_size = int(sector_config.get('windowSize', 10))
             model_params_config['WAM'] = {'window_size': window_size}
         
-        # Execute the real forecasting function with progress callback
-        return Main_forecasting_function(
-            sheet_name=sector_name,
-            forecast_path=forecast_dir,
-            main_df=sector_data,
-            selected_models=selected_models,
-            model_params=model_params_config,
-            target_year=config.target_year,
-            exclude_covid=config.exclude_covid_years,
-            progress_callback=progress_callback
-        )
+        return selected_models, model_params_config
+    
+    def _resolve_worker_count(self, config: ForecastJobConfig) -> int:
+        """Number of worker processes to use, bounded by CPU count and sector count"""
+        requested = int(config.max_workers or 1)
+        return max(1, min(requested, os.cpu_count() or 1, len(config.sector_configs)))
+    
+    def _execute_sectors_parallel(self, config: ForecastJobConfig, job_manager: ForecastJobManager,
+                                  job_id: str, forecast_dir: str, sector_data_map: Dict,
+                                  worker_count: int,
+                                  shared_forecasts: Optional[Dict[str, Any]] = None) -> Optional[List[SectorProcessingResult]]:
+        """
+        Forecast all configured sectors in a process pool.
+        
+        Progress from the workers is funnelled through a managed queue and aggregated
+        here, so the job shows the combined progress of all sectors in flight. Each
+        sector succeeds or fails on its own. Returns None if the job was cancelled;
+        queued sectors are skipped and sectors already running finish their current fit.
+        """
+        total_sectors = len(config.sector_configs)
+        sector_progress = {sector_name: 0 for sector_name in config.sector_configs}
+        sector_results = []
+        cancelled = False
+        
+        # 'spawn' avoids forking a multi-threaded web server process
+        mp_context = multiprocessing.get_context('spawn')
+        
+        with mp_context.Manager() as manager:
+            progress_queue = manager.Queue()
+            cancel_event = manager.Event()
+            
+            executor = ProcessPoolExecutor(max_workers=worker_count, mp_context=mp_context)
+            try:
+                futures = {}
+                for sector_name, sector_config in config.sector_configs.items():
+                    selected_models, model_params_config = self._build_model_params(sector_config)
+                    future = executor.submit(
+                        _forecast_sector_in_process,
+                        sector_name, sector_data_map[sector_name], forecast_dir,
+                        selected_models, model_params_config,
+                        config.target_year, config.exclude_covid_years,
+                        progress_queue, cancel_event, shared_forecasts
+                    )
+                    futures[future] = sector_name
+                
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                    
+                    # Drain progress messages reported by the workers
+                    latest_sector, latest_message = None, None
+                    while True:
+                        try:
+                            reported_sector, progress_percent, message = progress_queue.get_nowait()
+                        except Empty:
+                            break
+                        if reported_sector in sector_progress:
+                            sector_progress[reported_sector] = max(sector_progress[reported_sector], progress_percent)
+                        latest_sector, latest_message = reported_sector, message
+                    
+                    for future in done:
+                        sector_name = futures[future]
+                        sector_config = config.sector_configs[sector_name]
+                        sector_progress[sector_name] = 100
+                        
+                        if future.cancelled():
+                            continue
+                        
+                        try:
+                            result = future.result()
+                            if result.get('status') == 'cancelled':
+                                continue
+                            sector_result = SectorProcessingResult(
+                                sector_name=sector_name,
+                                status='existing_data' if result.get('used_existing_data', False) else 'success',
+                                message=result.get('message', 'Processing completed'),
+                                models_used=result.get('models_used', sector_config.get('models', [])),
+                                processing_time_seconds=result.get('processing_time_seconds', 0),
+                                configuration_used=sector_config
+                            )
+                            logger.info(f"Sector {sector_name} processed successfully in {sector_result.processing_time_seconds:.2f}s")
+                        except Exception as sector_error:
+                            error_msg = str(sector_error)
+                            logger.error(f"Error processing sector {sector_name} in worker process: {error_msg}")
+                            sector_result = SectorProcessingResult(
+                                sector_name=sector_name,
+                                status='failed',
+                                message=f'Processing failed: {error_msg}',
+                                error=error_msg,
+                                configuration_used=sector_config
+                            )
+                        
+                        sector_results.append(sector_result)
+                        job_manager.mark_sector_result(job_id, sector_result)
+                        latest_sector, latest_message = sector_name, sector_result.message
+                    
+                    if cancelled:
+                        continue
+                    
+                    current_job = job_manager.get_job(job_id)
+                    if current_job and current_job['status'] == JOB_STATUS['CANCELLED']:
+                        logger.info(f"Job {job_id} cancelled, skipping queued sectors")
+                        cancelled = True
+                        cancel_event.set()
+                        for future in pending:
+                            future.cancel()
+                        continue
+                    
+                    overall_progress = 15 + int((sum(sector_progress.values()) / (100 * total_sectors)) * 70)
+                    updates = {'progress': overall_progress}
+                    if latest_message:
+                        running = sum(1 for f in pending if f.running())
+                        updates['current_sector'] = latest_sector
+                        updates['message'] = f'{latest_sector}: {latest_message} ({running} sectors running)'
+                    job_manager.update_job(job_id, **updates)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+        
+        return None if cancelled else sector_results
     
     def _create_summary(self, config: ForecastJobConfig, sector_results: List[SectorProcessingResult],
                        forecast_dir: str, start_year: int, end_year: int) -> Dict[str, Any]:
@@ -16,6 +16,7 @@ from pathlib import Path
 # Import plot utilities
 from utils.plot_utils import PlotUtils
 from utils.color_manager import color_manager
+from utils.forecast_store import read_sector_sheet
 
 logger = logging.getLogger(__name__)
 
@@ -167,13 +168,18 @@ class DemandVisualizationService:
     def _quick_analyze_sector_file(self, file_path: str) -> Dict[str, Any]:
         """Quick analysis of sector file for metadata"""
         try:
-            # Determine sheet name
-            with pd.ExcelFile(file_path) as xls:
-                sheet_names = xls.sheet_names
-                target_sheet = 'Results' if 'Results' in sheet_names else sheet_names[0]
-            
-            # Read only first few rows for quick analysis
-            df = pd.read_excel(file_path, sheet_name=target_sheet, nrows=50)
+            sector_name = os.path.splitext(os.path.basename(file_path))[0]
+            df = read_sector_sheet(os.path.dirname(file_path), sector_name, 'Results')
+            if df is not None:
+                df = df.head(50)
+            else:
+                # Determine sheet name
+                with pd.ExcelFile(file_path) as xls:
+                    sheet_names = xls.sheet_names
+                    target_sheet = 'Results' if 'Results' in sheet_names else sheet_names[0]
+                
+                # Read only first few rows for quick analysis
+                df = pd.read_excel(file_path, sheet_name=target_sheet, nrows=50)
             
             info = {
                 'year_range': None,
@@ -319,12 +325,15 @@ class DemandVisualizationService:
                                     filters: FilterConfig) -> Optional[SectorData]:
         """Load and process individual sector data with comprehensive filtering"""
         try:
-            # Determine sheet name
-            with pd.ExcelFile(file_path) as xls:
-                sheet_names = xls.sheet_names
-                target_sheet = 'Results' if 'Results' in sheet_names else sheet_names[0]
-            
-            df = pd.read_excel(file_path, sheet_name=target_sheet)
+            # Prefer the columnar sidecar; parse the workbook only when there is none
+            df = read_sector_sheet(os.path.dirname(file_path), sector_name, 'Results')
+            if df is None:
+                # Determine sheet name
+                with pd.ExcelFile(file_path) as xls:
+                    sheet_names = xls.sheet_names
+                    target_sheet = 'Results' if 'Results' in sheet_names else sheet_names[0]
+                
+                df = pd.read_excel(file_path, sheet_name=target_sheet)
             
             # Find year column
             year_column = None
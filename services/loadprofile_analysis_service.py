@@ -18,6 +18,7 @@ from utils.constants import UNIT_FACTORS, VALIDATION_RULES
 from utils.helpers import get_file_info, ensure_directory
 from utils.error_handlers import ValidationError, ProcessingError, ResourceNotFoundError
 from utils.service_cache_mixin import ServiceCacheMixin
+from utils.profile_store import get_profile_path, read_profile_head
 
 logger = logging.getLogger(__name__)
 
@@ -133,18 +134,15 @@ class LoadProfileAnalysisService(ServiceCacheMixin):
                     }
                 
                 # Add file analysis
-                csv_path = os.path.join(
-                    self.project_path, 'results', 'load_profiles',
-                    f"{profile['profile_id']}.csv"
-                )
+                profile_path = self._profile_path(profile['profile_id'])
                 
-                if os.path.exists(csv_path):
-                    file_info = get_file_info(csv_path)
+                if profile_path is not None:
+                    file_info = get_file_info(str(profile_path))
                     profile['file_info'] = file_info
                     
                     # Quick data preview
                     try:
-                        df_preview = pd.read_csv(csv_path, nrows=100)
+                        df_preview = read_profile_head(profile_path, 100)
                         profile['data_preview'] = {
                             'total_records': len(df_preview),
                             'columns': df_preview.columns.tolist(),
@@ -175,16 +173,13 @@ class LoadProfileAnalysisService(ServiceCacheMixin):
     def quick_validate_profile(self, profile_id: str) -> Dict[str, Any]:
         """Quick validation of profile data"""
         try:
-            csv_path = os.path.join(
-                self.project_path, 'results', 'load_profiles',
-                f"{profile_id}.csv"
-            )
+            profile_path = self._profile_path(profile_id)
             
-            if not os.path.exists(csv_path):
+            if profile_path is None:
                 return {'valid': False, 'error': 'Profile file not found'}
             
             # Quick check
-            df_sample = pd.read_csv(csv_path, nrows=10)
+            df_sample = read_profile_head(profile_path, 10)
             
             validation = {
                 'valid': True,
@@ -254,20 +249,21 @@ class LoadProfileAnalysisService(ServiceCacheMixin):
             logger.exception(f"Error getting profile data for {profile_id}: {e}")
             raise
     
+    def _profile_path(self, profile_id: str) -> Optional[Path]:
+        """Stored file of a profile in either format, None if it does not exist"""
+        return get_profile_path(os.path.join(self.project_path, 'results', 'load_profiles'), profile_id)
+    
     def get_profile_metadata(self, profile_id: str) -> Dict[str, Any]:
         """Get profile metadata and configuration"""
         try:
             # Check if profile exists
-            csv_path = os.path.join(
-                self.project_path, 'results', 'load_profiles',
-                f"{profile_id}.csv"
-            )
+            profile_path = self._profile_path(profile_id)
             
-            if not os.path.exists(csv_path):
+            if profile_path is None:
                 raise ResourceNotFoundError(f"Profile '{profile_id}' not found")
             
             # Get file info
-            file_info = get_file_info(csv_path)
+            file_info = get_file_info(str(profile_path))
             
             # Check for metadata file
             metadata_path = os.path.join(
@@ -285,7 +281,7 @@ class LoadProfileAnalysisService(ServiceCacheMixin):
             
             # Get basic data info
             try:
-                df_info = pd.read_csv(csv_path, nrows=5)
+                df_info = read_profile_head(profile_path, 5)
                 data_info = {
                     'columns': df_info.columns.tolist(),
                     'data_types': df_info.dtypes.to_dict(),
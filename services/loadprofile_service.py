@@ -8,17 +8,54 @@ import json
 import pandas as pd
 import numpy as np
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from werkzeug.datastructures import FileStorage
 
-from models.load_profile_generator import LoadProfileGenerator
+from models.load_profile_generator import GenerationCancelled, LoadProfileGenerator, report_progress
 from utils.helpers import get_file_info, ensure_directory
-from utils.constants import VALIDATION_RULES, UNIT_FACTORS
+from utils.constants import VALIDATION_RULES, UNIT_FACTORS, JOB_STATUS
+from utils.job_manager import JobManager
 from utils.service_cache_mixin import ServiceCacheMixin
+from utils.profile_store import (
+    delete_profile_files, export_profile_csv, get_profile_path, read_profile_frame, read_profile_head
+)
 
 logger = logging.getLogger(__name__)
 
+# Output frequencies whose multi-year profiles are generated year by year by default
+STREAMING_FREQUENCIES = ('15min', '30min')
+
+# Job progress (percent) reported when each generation stage starts
+GENERATION_STAGES = {
+    'template': 5,
+    'decomposition': 15,
+    'forecast': 45,
+    'constraints': 70,
+    'save': 90
+}
+
+
+def stage_progress(stage: str, fraction: float = 0.0) -> float:
+    """Job progress for a point within a stage (fraction 0-1 of the way to the next stage)"""
+    stages = list(GENERATION_STAGES)
+    start = GENERATION_STAGES[stage]
+    index = stages.index(stage)
+    end = GENERATION_STAGES[stages[index + 1]] if index + 1 < len(stages) else 100
+    return round(start + min(max(fraction, 0.0), 1.0) * (end - start), 1)
+
+
+# Interval of the keep-alive updates sent while a stage runs; well under the
+# job manager's 10 minute stall limit, which a long STL decomposition can exceed
+GENERATION_HEARTBEAT_SECONDS = 60
+
+# Batch key of the profile generated from the template's total demand
+TEMPLATE_SCENARIO_NAME = 'template'
+
+# Background load profile generation jobs of this process
+profile_job_manager = JobManager()
+
 class LoadProfileService(ServiceCacheMixin):
     """
     Service layer for load profile operations with caching and analysis
@@ -291,7 +328,7 @@ class LoadProfileService(ServiceCacheMixin):
         
         try:
             # Common validations
-            if profile_type == 'base_profile':
+            if profile_type in ('base_profile', 'base_profile_batch'):
                 base_year = data.get('base_year')
                 if not base_year or not isinstance(base_year, int):
                     errors.append("Valid base year is required")
@@ -340,10 +377,23 @@ class LoadProfileService(ServiceCacheMixin):
             
             # Demand source validation
             demand_source = data.get('demand_source')
-            if demand_source not in ['template', 'scenario']:
+            if profile_type == 'base_profile_batch':
+                # Batch requests name their scenarios; no names means every available scenario
+                scenario_names = data.get('scenario_names') or []
+                if not isinstance(scenario_names, list) or not all(isinstance(name, str) for name in scenario_names):
+                    errors.append("Scenario names must be a list of scenario names")
+                else:
+                    available = {scenario['name'] for scenario in self._get_available_scenarios()}
+                    missing = [name for name in scenario_names if name not in available]
+                    if missing:
+                        errors.append(f"Scenarios not found: {', '.join(missing)}")
+                    elif not scenario_names and not available and not data.get('include_template'):
+                        errors.append("No demand scenarios available for batch generation")
+            
+            elif demand_source not in ['template', 'scenario']:
                 errors.append("Demand source must be 'template' or 'scenario'")
             
-            if demand_source == 'scenario':
+            if demand_source == 'scenario' and profile_type != 'base_profile_batch':
                 scenario_name = data.get('scenario_name')
                 if not scenario_name:
                     errors.append("Scenario name is required when using scenario data")
@@ -630,10 +680,17 @@ class LoadProfileService(ServiceCacheMixin):
         
         return yearly_stats
 
-    def generate_base_profile(self, config: Dict) -> Dict[str, Any]:
-        """Generate base profile with error handling"""
+    def generate_base_profile(self, config: Dict, progress_callback=None) -> Dict[str, Any]:
+        """
+        Generate base profile with error handling
+        
+        progress_callback(stage, message[, fraction]) is called as each GENERATION_STAGES stage
+        starts, and with a fraction of the stage while long stages run; GenerationCancelled
+        raised by it is propagated instead of being reported as an error.
+        """
         try:
             # Load template data
+            report_progress(progress_callback, 'template', "Loading load curve template")
             template_data = self.generator.load_template_data()
             historical_data = template_data['historical_demand']
             
@@ -650,6 +707,10 @@ class LoadProfileService(ServiceCacheMixin):
             # Prepare constraints
             constraints = self._prepare_constraints(config, template_data)
             
+            if self._use_streaming(config):
+                return self._generate_base_profile_streaming(config, historical_data, demand_scenarios, constraints,
+                                                             progress_callback)
+            
             # Generate forecast
             result = self.generator.generate_base_profile_forecast(
                 historical_data=historical_data,
@@ -658,10 +719,13 @@ class LoadProfileService(ServiceCacheMixin):
                 start_fy=int(config['start_fy']),
                 end_fy=int(config['end_fy']),
                 frequency=config.get('frequency', 'hourly'),
-                constraints=constraints
+                constraints=constraints,
+                progress_callback=progress_callback
             )
             
             if result['status'] == 'success':
+                report_progress(progress_callback, 'save', "Saving profile")
+                
                 # saving with custom name
                 custom_name = config.get('custom_name', '').strip()
                 profile_id = None
@@ -691,14 +755,163 @@ class LoadProfileService(ServiceCacheMixin):
             else:
                 return {'success': False, 'error': result['message']}
                 
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.exception(f"Error generating base profile: {e}")
             return {'success': False, 'error': str(e)}
     
-    def generate_stl_profile(self, config: Dict) -> Dict[str, Any]:
-        """Generate STL profile with advanced configuration and load factor improvement"""
+    def _use_streaming(self, config: Dict) -> bool:
+        """Stream sub-hourly runs (and any run that asks for it) to disk one financial year at a time"""
+        if 'streaming' in config:
+            return bool(config['streaming'])
+        return config.get('frequency', 'hourly') in STREAMING_FREQUENCIES
+    
+    def _generate_base_profile_streaming(self, config: Dict, historical_data: pd.DataFrame,
+                                         demand_scenarios: pd.DataFrame, constraints: Optional[Dict],
+                                         progress_callback=None) -> Dict[str, Any]:
+        """Base profile generation through the per-year streaming writer"""
+        custom_name = config.get('custom_name', '').strip()
+        profile_id = None
+        if custom_name:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            profile_id = f"{self._sanitize_name(custom_name)}_{timestamp}"
+        
+        result = self.generator.generate_base_profile_forecast_streaming(
+            historical_data=historical_data,
+            demand_scenarios=demand_scenarios,
+            base_year=int(config['base_year']),
+            start_fy=int(config['start_fy']),
+            end_fy=int(config['end_fy']),
+            frequency=config.get('frequency', 'hourly'),
+            constraints=constraints,
+            profile_id=profile_id,
+            progress_callback=progress_callback
+        )
+        
+        if result['status'] != 'success':
+            return {'success': False, 'error': result['message']}
+        
+        # Years were written as they were generated; only the summary is left to report
+        report_progress(progress_callback, 'save', "Profile saved")
+        
+        # Clear cache
+        self._clear_profile_cache()
+        
+        data = result['data']
+        summary = self._create_generation_summary(data)
+        summary['total_records'] = data['metadata']['total_hours']
+        return {
+            'success': True,
+            'data': {
+                'save_info': data['save_info'],
+                'profile_id': data['save_info']['profile_id'],
+                'generation_config': config,
+                'summary': summary,
+                'yearly_stats': data['yearly_stats'],
+                'forecast': data['forecast_sample'].to_dict('records')
+            }
+        }
+    
+    def generate_base_profiles_batch(self, config: Dict) -> Dict[str, Any]:
+        """Generate and save base profiles for several demand scenarios in one job"""
+        try:
+            # Load template data
+            template_data = self.generator.load_template_data()
+            historical_data = template_data['historical_demand']
+            
+            demand_scenarios_by_name, failed_scenarios = self._load_batch_demand_scenarios(config, template_data)
+            if not demand_scenarios_by_name:
+                error = "No demand scenarios available for batch generation"
+                if failed_scenarios:
+                    error += f" (failed: {', '.join(failed_scenarios)})"
+                return {'success': False, 'error': error, 'failed': failed_scenarios}
+            
+            # Prepare constraints
+            constraints = self._prepare_constraints(config, template_data)
+            
+            # Generate all forecasts from one shared profile frame
+            result = self.generator.generate_base_profile_forecasts(
+                historical_data=historical_data,
+                demand_scenarios_by_name=demand_scenarios_by_name,
+                base_year=int(config['base_year']),
+                start_fy=int(config['start_fy']),
+                end_fy=int(config['end_fy']),
+                frequency=config.get('frequency', 'hourly'),
+                constraints=constraints
+            )
+            
+            if result['status'] != 'success':
+                return {'success': False, 'error': result['message']}
+            
+            # One profile per scenario; the scenario name keeps ids unique within the batch
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            custom_name = config.get('custom_name', '').strip()
+            prefix = self._sanitize_name(custom_name) if custom_name else 'base_profile_scaling'
+            
+            profiles = {}
+            for scenario_name, forecast_results in result['data']['forecasts'].items():
+                profile_id = f"{prefix}_{self._sanitize_name(scenario_name)}_{timestamp}"
+                save_info = self.generator.save_forecast(forecast_results, profile_id=profile_id)
+                profiles[scenario_name] = {
+                    'save_info': save_info,
+                    'profile_id': save_info['profile_id'],
+                    'summary': self._create_generation_summary(forecast_results)
+                }
+            
+            # Clear cache
+            self._clear_profile_cache()
+            
+            return {
+                'success': True,
+                'data': {
+                    'generation_config': config,
+                    'profiles': profiles,
+                    'failed': {**failed_scenarios, **result['data']['failed']}
+                }
+            }
+            
+        except Exception as e:
+            logger.exception(f"Error generating base profile batch: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    def _load_batch_demand_scenarios(self, config: Dict, template_data: Dict) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+        """
+        Demand scenarios of a batch request by name, in request order
+        
+        Returns:
+            tuple: (demand scenarios by name, {scenario_name: error} for scenarios that could not be loaded)
+        """
+        scenario_names = config.get('scenario_names') or [
+            scenario['name'] for scenario in self._get_available_scenarios()
+        ]
+        
+        demand_scenarios_by_name = {}
+        if config.get('include_template'):
+            # The template's profile is keyed 'template', so a scenario of that name would replace it
+            if TEMPLATE_SCENARIO_NAME in scenario_names:
+                raise ValueError(f"Demand scenario '{TEMPLATE_SCENARIO_NAME}' cannot be combined with include_template")
+            demand_scenarios_by_name[TEMPLATE_SCENARIO_NAME] = template_data['total_demand']
+        
+        failed = {}
+        for scenario_name in scenario_names:
+            scenario_path = os.path.join(
+                self.project_path, 'results', 'demand_projection',
+                scenario_name, 'consolidated_results.csv'
+            )
+            try:
+                demand_scenarios_by_name[scenario_name] = self.generator.load_scenario_data(scenario_path)
+            except Exception as e:
+                logger.warning(f"Skipping demand scenario {scenario_name} in batch: {e}")
+                failed[scenario_name] = str(e)
+        
+        return demand_scenarios_by_name, failed
+    
+    def generate_stl_profile(self, config: Dict, progress_callback=None) -> Dict[str, Any]:
+        """Generate STL profile with advanced configuration and load factor improvement (progress as in generate_base_profile)"""
         try:
             # Load template data
+            report_progress(progress_callback, 'template', "Loading load curve template")
             template_data = self.generator.load_template_data()
             historical_data = template_data['historical_demand']
             
@@ -731,10 +944,13 @@ class LoadProfileService(ServiceCacheMixin):
                 frequency=config.get('frequency', 'hourly'),
                 stl_params=stl_params,
                 constraints=constraints,
-                lf_improvement=lf_improvement
+                lf_improvement=lf_improvement,
+                progress_callback=progress_callback
             )
             
             if result['status'] == 'success':
+                report_progress(progress_callback, 'save', "Saving profile")
+                
                 # saving with custom name
                 custom_name = config.get('custom_name', '').strip()
                 profile_id = None
@@ -767,10 +983,81 @@ class LoadProfileService(ServiceCacheMixin):
             else:
                 return {'success': False, 'error': result['message']}
                 
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.exception(f"Error generating STL profile: {e}")
             return {'success': False, 'error': str(e)}
     
+    def execute_generation_job(self, config: Dict, profile_type: str, job_manager: JobManager,
+                               job_id: str) -> Dict[str, Any]:
+        """
+        Run a base or STL profile generation as a background job
+        
+        Progress is reported to job_manager as each stage starts. The job is checked for
+        cancellation at the same points, so a cancelled job stops at the next stage boundary
+        (for streamed runs, the next financial year) without saving a profile.
+        
+        Returns:
+            dict: {'status': 'success' | 'cancelled' | 'failed', ...}
+        """
+        def progress_callback(stage: str, message: str, fraction: float = 0.0):
+            job = job_manager.get_job(job_id)
+            if job is None or job['status'] not in (JOB_STATUS['RUNNING'], JOB_STATUS['STARTING']):
+                raise GenerationCancelled(f"Job stopped before stage '{stage}'")
+            updates = {'progress': stage_progress(stage, fraction), 'message': message}
+            if job.get('current_step') != stage:
+                updates['current_step'] = stage
+            job_manager.update_job(job_id, **updates)
+        
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._send_heartbeats, args=(job_manager, job_id, heartbeat_stop), daemon=True
+        )
+        heartbeat.start()
+        try:
+            if profile_type == 'stl_profile':
+                result = self.generate_stl_profile(config, progress_callback)
+            else:
+                result = self.generate_base_profile(config, progress_callback)
+        except GenerationCancelled as e:
+            logger.info(f"Load profile job {job_id} cancelled: {e}")
+            return {'status': 'cancelled', 'message': str(e)}
+        finally:
+            heartbeat_stop.set()
+        
+        # Completing under the manager's lock, so a cancel either lands before this check
+        # or is rejected because the job is no longer running
+        with job_manager.lock:
+            job = job_manager.get_job(job_id)
+            cancelled = job is not None and job['status'] == JOB_STATUS['CANCELLED']
+            if not cancelled:
+                if result['success']:
+                    job_manager.complete_job(job_id, result=result['data'])
+                else:
+                    job_manager.complete_job(job_id, error=result['error'])
+        
+        if cancelled:
+            # Cancelled after the last stage check: honour it and drop the saved profile,
+            # outside the lock so file I/O never blocks other job updates
+            if result['success']:
+                self.delete_profile(result['data']['profile_id'])
+            logger.info(f"Load profile job {job_id} cancelled after generation finished")
+            return {'status': 'cancelled', 'message': 'Job cancelled before completion'}
+        
+        if result['success']:
+            return {'status': 'success', 'profile_id': result['data']['profile_id']}
+        return {'status': 'failed', 'error': result['error']}
+    
+    @staticmethod
+    def _send_heartbeats(job_manager: JobManager, job_id: str, stop_event: threading.Event):
+        """Refresh the job's last update while it runs, so a long stage is not taken for a stall"""
+        while not stop_event.wait(GENERATION_HEARTBEAT_SECONDS):
+            job = job_manager.get_job(job_id)
+            if job is None or job['status'] not in (JOB_STATUS['RUNNING'], JOB_STATUS['STARTING']):
+                return
+            job_manager.update_job(job_id)
+    
     def get_saved_profiles_with_metadata(self) -> Dict[str, Any]:
         """Get saved profiles with metadata"""
         try:
@@ -782,18 +1069,15 @@ class LoadProfileService(ServiceCacheMixin):
                 profile = profile.copy()
                 
                 # Add file analysis
-                csv_path = os.path.join(
-                    self.project_path, 'results', 'load_profiles',
-                    f"{profile['profile_id']}.csv"
-                )
+                profile_path = get_profile_path(self._profiles_dir(), profile['profile_id'])
                 
-                if os.path.exists(csv_path):
-                    file_info = get_file_info(csv_path)
+                if profile_path is not None:
+                    file_info = get_file_info(str(profile_path))
                     profile['file_info'] = file_info
                     
                     # Quick data analysis
                     try:
-                        df = pd.read_csv(csv_path, nrows=1000)  # Sample for quick analysis
+                        df = read_profile_head(profile_path, 1000)  # Sample for quick analysis
                         profile['data_preview'] = {
                             'total_records': len(df),
                             'columns': df.columns.tolist(),
@@ -850,16 +1134,13 @@ class LoadProfileService(ServiceCacheMixin):
     def analyze_profile(self, profile_id: str) -> Dict[str, Any]:
         """Comprehensive profile analysis"""
         try:
-            csv_path = os.path.join(
-                self.project_path, 'results', 'load_profiles',
-                f"{profile_id}.csv"
-            )
+            profile_path = get_profile_path(self._profiles_dir(), profile_id)
             
-            if not os.path.exists(csv_path):
+            if profile_path is None:
                 raise FileNotFoundError(f"Profile not found: {profile_id}")
             
             # Load profile data
-            df = pd.read_csv(csv_path)
+            df = read_profile_frame(profile_path)
             
             # Comprehensive analysis
             analysis = {
@@ -885,13 +1166,10 @@ class LoadProfileService(ServiceCacheMixin):
             
             # Load all profiles
             for profile_id in profile_ids:
-                csv_path = os.path.join(
-                    self.project_path, 'results', 'load_profiles',
-                    f"{profile_id}.csv"
-                )
+                profile_path = get_profile_path(self._profiles_dir(), profile_id)
                 
-                if os.path.exists(csv_path):
-                    profiles_data[profile_id] = pd.read_csv(csv_path)
+                if profile_path is not None:
+                    profiles_data[profile_id] = read_profile_frame(profile_path)
             
             if len(profiles_data) < 2:
                 raise ValueError("Need at least 2 valid profiles for comparison")
@@ -971,16 +1249,8 @@ class LoadProfileService(ServiceCacheMixin):
     def delete_profile(self, profile_id: str) -> Dict[str, Any]:
         """Delete profile with comprehensive cleanup"""
         try:
-            # Delete CSV file
-            csv_path = os.path.join(
-                self.project_path, 'results', 'load_profiles',
-                f"{profile_id}.csv"
-            )
-            files_deleted = []
-            
-            if os.path.exists(csv_path):
-                os.remove(csv_path)
-                files_deleted.append('profile_data.csv')
+            # Delete profile data in every stored format, plus any CSV export
+            files_deleted = delete_profile_files(self._profiles_dir(), profile_id)
             
             # Delete metadata file
             metadata_path = os.path.join(
@@ -1006,27 +1276,29 @@ class LoadProfileService(ServiceCacheMixin):
             return {'success': False, 'error': str(e)}
     
     def get_profile_file_path(self, profile_id: str) -> Optional[str]:
-        """Get secure file path for profile"""
+        """Get secure CSV file path for profile, exporting binary profiles on demand"""
         try:
-            csv_path = os.path.join(
-                self.project_path, 'results', 'load_profiles',
-                f"{profile_id}.csv"
-            )
+            profiles_dir = self._profiles_dir()
             
             # Security check - ensure path is within project
             abs_project = os.path.abspath(self.project_path)
-            abs_file = os.path.abspath(csv_path)
+            abs_file = os.path.abspath(os.path.join(profiles_dir, f"{profile_id}.csv"))
             
             if not abs_file.startswith(abs_project):
                 return None
             
-            return csv_path if os.path.exists(csv_path) else None
+            csv_path = export_profile_csv(profiles_dir, profile_id)
+            return str(csv_path) if csv_path is not None else None
             
         except Exception as e:
             logger.exception(f"Error getting file path for {profile_id}: {e}")
             return None
     
     # Private helper methods
+    def _profiles_dir(self) -> str:
+        """Directory holding the stored load profiles"""
+        return os.path.join(self.project_path, 'results', 'load_profiles')
+    
     def _clear_template_cache(self):
         """Clear template-related cache entries"""
         self._clear_cache_pattern('template')
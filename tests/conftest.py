@@ -0,0 +1,50 @@
+# tests/conftest.py
+"""
+Shared test setup.
+
+utils/response_utils.py (the Flask JSON response helpers) is not part of this
+tree, yet utils.demand_utils and the services import it at module level. When
+the real module cannot be imported, a minimal stand-in providing the names
+those modules import is registered so the calculation helpers can be tested.
+"""
+import os
+import sys
+import types
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+def _install_response_utils_stub():
+    try:
+        import utils.response_utils  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    stub = types.ModuleType('utils.response_utils')
+
+    def _payload(status, message=None, data=None, status_code=200, **extra):
+        return {'status': status, 'message': message, 'data': data, **extra}, status_code
+
+    def success_json(message=None, data=None, status_code=200, **extra):
+        return _payload('success', message, data, status_code, **extra)
+
+    def error_json(message=None, status_code=400, **extra):
+        return _payload('error', message, None, status_code, **extra)
+
+    def validation_error_json(message=None, errors=None, status_code=400, **extra):
+        return _payload('error', message, None, status_code, errors=errors, **extra)
+
+    def handle_exception_response(error, message=None, status_code=500, **extra):
+        return _payload('error', message or str(error), None, status_code, **extra)
+
+    stub.success_json = success_json
+    stub.error_json = error_json
+    stub.validation_error_json = validation_error_json
+    stub.handle_exception_response = handle_exception_response
+    sys.modules['utils.response_utils'] = stub
+
+
+_install_response_utils_stub()
@@ -0,0 +1,50 @@
+# tests/test_demand_utils.py
+"""Regression tests for the vectorized consolidated demand calculation"""
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+pytest.importorskip("flask")
+
+from utils import demand_utils
+
+
+@pytest.fixture
+def copy_on_write():
+    """pandas 3 behaviour: Series.to_numpy() may return a read-only view"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        yield
+    else:
+        with pd.option_context('mode.copy_on_write', True):
+            yield
+
+
+def test_consolidation_with_copy_on_write(tmp_path, monkeypatch, copy_on_write):
+    years = list(range(2025, 2030))
+    forecasts = {
+        'Residential': pd.DataFrame({'Year': years, 'MLR': [100.0, 110.0, np.nan, 130.0, np.inf]}),
+        'Commercial': pd.DataFrame({'Year': years, 'MLR': [50.0, 55.0, 60.0, 65.0, 70.0]}),
+    }
+    monkeypatch.setattr(demand_utils, 'get_forecast_data_for_sector',
+                        lambda scenario_path, sector, from_year, to_year, unit='kWh': forecasts[sector])
+
+    result = demand_utils.calculate_consolidated_demand(
+        str(tmp_path), {'Residential': 'MLR', 'Commercial': 'MLR'}, [], {'from': 2025, 'to': 2029}
+    )
+
+    assert result['Residential'].tolist() == [100.0, 110.0, 0.0, 130.0, 0.0]
+    assert result['Total_On_Grid_Demand'].tolist() == [150.0, 165.0, 60.0, 195.0, 70.0]
+
+
+def test_duplicate_td_loss_years_match_original_interpolation():
+    # The last point of a repeated final year applies at and after that year
+    points = [{'year': 2030, 'loss_percentage': 10}, {'year': 2025, 'loss_percentage': 20},
+              {'year': 2030, 'loss_percentage': 5}]
+    losses = demand_utils.interpolate_td_losses_array(points, [2025, 2030, 2035])
+    assert losses.tolist() == [20.0, 5.0, 5.0]
+
+    # An interior repeated year: first point at the year, last point after it
+    points = [{'year': 2020, 'loss_percentage': 1}, {'year': 2025, 'loss_percentage': 20},
+              {'year': 2025, 'loss_percentage': 30}, {'year': 2030, 'loss_percentage': 40}]
+    losses = demand_utils.interpolate_td_losses_array(points, [2022, 2025, 2027])
+    assert losses.tolist() == pytest.approx([8.6, 20.0, 34.0])
@@ -12,12 +12,55 @@ from utils.constants import REQUIRED_SHEETS, VALIDATION_RULES, ERROR_MESSAGES
 
 logger = logging.getLogger(__name__)
 
-def validate_input_file(file_path):
+def read_input_workbook(file_path):
+    """
+    Parse every sheet needed from the input demand file with a single open
+    
+    The workbook is opened once (pandas' openpyxl reader uses read-only mode) and
+    the main sheet, Economic_Indicators and all sector sheets listed in
+    Consumption_Sectors are parsed from that handle.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        
+    Returns:
+        tuple: (sheet_names, sheets) where sheets maps sheet name to DataFrame
+    """
+    sheets = {}
+    with pd.ExcelFile(file_path) as excel_file:
+        sheet_names = excel_file.sheet_names
+        
+        main_sheet = REQUIRED_SHEETS['MAIN']
+        sector_names = []
+        if main_sheet in sheet_names:
+            sheets[main_sheet] = excel_file.parse(main_sheet)
+            try:
+                sectors_df = extract_tables_by_markers(sheets[main_sheet], "~").get('Consumption_Sectors')
+                if sectors_df is not None and 'Sector_Name' in sectors_df.columns:
+                    sector_names = sectors_df['Sector_Name'].dropna().tolist()
+            except Exception as table_error:
+                logger.warning(f"Could not read sector list from main sheet: {table_error}")
+        
+        economic_sheet = REQUIRED_SHEETS['ECONOMIC_INDICATORS']
+        if economic_sheet in sheet_names:
+            sheets[economic_sheet] = excel_file.parse(economic_sheet)
+        
+        for sector in sector_names:
+            if sector in sheet_names and sector not in sheets:
+                sheets[sector] = excel_file.parse(sector)
+    
+    logger.debug(f"Parsed {len(sheets)} of {len(sheet_names)} sheets from {file_path}")
+    return sheet_names, sheets
+
+def validate_input_file(file_path, sheet_names=None, sheets=None):
     """
     Validate input demand Excel file structure and content
     
     Args:
         file_path (str): Path to the Excel file
+        sheet_names (list, optional): Sheet names from read_input_workbook
+        sheets (dict, optional): Parsed sheets from read_input_workbook; when given
+            the workbook is not opened again
         
     Returns:
         dict: Validation result with status and details
@@ -48,25 +91,33 @@ def validate_input_file(file_path):
         except Exception as file_error:
             validation_result['warnings'].append(f"Could not get file info: {file_error}")
         
-        # Try to read Excel file
-        try:
-            excel_file = pd.ExcelFile(file_path)
-            validation_result['sheets_found'] = excel_file.sheet_names
-            logger.debug(f"Found sheets in {file_path}: {excel_file.sheet_names}")
-        except Exception as excel_error:
-            validation_result['errors'].append(f"Cannot read Excel file: {excel_error}")
-            return validation_result
+        # Read the workbook unless it has already been parsed
+        if sheets is None or sheet_names is None:
+            try:
+                with pd.ExcelFile(file_path) as excel_file:
+                    sheet_names = excel_file.sheet_names
+                    sheets = {
+                        name: excel_file.parse(name)
+                        for name in (REQUIRED_SHEETS['MAIN'], REQUIRED_SHEETS['ECONOMIC_INDICATORS'])
+                        if name in sheet_names
+                    }
+            except Exception as excel_error:
+                validation_result['errors'].append(f"Cannot read Excel file: {excel_error}")
+                return validation_result
+        
+        validation_result['sheets_found'] = sheet_names
+        logger.debug(f"Found sheets in {file_path}: {sheet_names}")
         
         # Check for required sheets
         required_main_sheet = REQUIRED_SHEETS['MAIN']  # 'main'
-        if required_main_sheet not in excel_file.sheet_names:
+        if required_main_sheet not in sheet_names:
             validation_result['required_sheets_missing'].append(required_main_sheet)
             validation_result['errors'].append(f"Required sheet '{required_main_sheet}' not found")
         
         # Validate main sheet structure if it exists
-        if required_main_sheet in excel_file.sheet_names:
+        if required_main_sheet in sheet_names:
             try:
-                main_sheet = pd.read_excel(file_path, sheet_name=required_main_sheet)
+                main_sheet = sheets[required_main_sheet]
                 main_validation = validate_main_sheet(main_sheet)
                 validation_result['main_sheet_validation'] = main_validation
                 
@@ -79,9 +130,9 @@ def validate_input_file(file_path):
         
         # Check for Economic Indicators sheet (optional)
         economic_sheet = REQUIRED_SHEETS['ECONOMIC_INDICATORS']  # 'Economic_Indicators'
-        if economic_sheet in excel_file.sheet_names:
+        if economic_sheet in sheet_names:
             try:
-                economic_data = pd.read_excel(file_path, sheet_name=economic_sheet)
+                economic_data = sheets[economic_sheet]
                 economic_validation = validate_economic_indicators_sheet(economic_data)
                 validation_result['economic_indicators_validation'] = economic_validation
                 
@@ -94,12 +145,6 @@ def validate_input_file(file_path):
         # Overall validation result
         validation_result['valid'] = len(validation_result['errors']) == 0
         
-        # Close Excel file
-        try:
-            excel_file.close()
-        except:
-            pass
-        
         logger.info(f"File validation {'passed' if validation_result['valid'] else 'failed'} for {file_path}")
         return validation_result
         
@@ -260,12 +305,14 @@ def validate_economic_indicators_sheet(economic_df):
     
     return validation
 
-def input_demand_data(demand_input_file_path):
+def input_demand_data(demand_input_file_path, workbook=None):
     """
    input demand data processing with comprehensive error handling
     
     Args:
         demand_input_file_path (str): Path to the input Excel file
+        workbook (tuple, optional): (sheet_names, sheets) from read_input_workbook,
+            to reuse a workbook the caller has already parsed
         
     Returns:
         tuple: (sectors, missing_sectors, param_dict, sector_data, aggregated_ele)
@@ -273,8 +320,11 @@ def input_demand_data(demand_input_file_path):
     logger.info(f"Processing input demand file: {demand_input_file_path}")
     
     try:
+        # Parse all needed sheets in one pass; everything below works on these frames
+        sheet_names, sheets = workbook if workbook is not None else read_input_workbook(demand_input_file_path)
+        
         # First, validate the input file
-        file_validation = validate_input_file(demand_input_file_path)
+        file_validation = validate_input_file(demand_input_file_path, sheet_names, sheets)
         if not file_validation['valid']:
             error_msg = "Input file validation failed: " + "; ".join(file_validation['errors'])
             logger.error(error_msg)
@@ -285,7 +335,7 @@ def input_demand_data(demand_input_file_path):
             logger.warning(f"Input file warning: {warning}")
         
         # Read main sheet
-        main_settings = pd.read_excel(demand_input_file_path, sheet_name='main')
+        main_settings = sheets[REQUIRED_SHEETS['MAIN']]
         main_settings_parameters = extract_tables_by_markers(main_settings, "~")
         
         # Extract settings
@@ -346,7 +396,7 @@ def input_demand_data(demand_input_file_path):
         economic_indicators = None
         if econometric_parameters == 'Yes':
             try:
-                economic_indicators = pd.read_excel(demand_input_file_path, sheet_name='Economic_Indicators')
+                economic_indicators = sheets[REQUIRED_SHEETS['ECONOMIC_INDICATORS']]
                 logger.info(f"Loaded Economic Indicators with columns: {economic_indicators.columns.tolist()}")
                 
                 # Validate economic indicators
@@ -362,7 +412,10 @@ def input_demand_data(demand_input_file_path):
         for sector in sectors:
             try:
                 # Load sector data
-                sector_data[sector] = pd.read_excel(demand_input_file_path, sheet_name=sector)
+                if sector not in sheets:
+                    raise ValueError(f"Worksheet named '{sector}' not found")
+                # Copy so in-place economic indicator columns never leak into the parsed workbook
+                sector_data[sector] = sheets[sector].copy()
                 logger.debug(f"Loaded sector {sector} with columns: {sector_data[sector].columns.tolist()}")
                 
                 # Validate sector data
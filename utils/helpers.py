@@ -310,28 +310,50 @@ def copy_missing_templates(project_path, missing_templates, template_folder):
         'message': message
     }
 
+def _marker_mask(df, marker):
+    """Boolean (rows, cols) mask of string cells starting with marker, built column-wise"""
+    mask = np.zeros(df.shape, dtype=bool)
+    for j, dtype in enumerate(df.dtypes):
+        # Numeric and datetime columns cannot hold marker strings
+        if not (dtype == object or pd.api.types.is_string_dtype(dtype)):
+            continue
+        try:
+            mask[:, j] = df.iloc[:, j].str.startswith(marker, na=False).to_numpy(dtype=bool)
+        except AttributeError:
+            # Object column without any strings
+            continue
+    return mask
+
+def _first_false(flags, offset):
+    """Absolute position of the first False in flags, or offset + len(flags) if there is none"""
+    gaps = np.flatnonzero(~flags)
+    return offset + (int(gaps[0]) if gaps.size else len(flags))
+
 def find_special_symbols(df, marker):
     """Find cells with special marker symbols in DataFrame"""
     markers = []
     try:
-        for i, row in df.iterrows():
-            for j, value in enumerate(row):
-                if isinstance(value, str) and value.startswith(marker):
-                    markers.append((i, j, value[len(marker):].strip()))
+        rows, cols = np.nonzero(_marker_mask(df, marker))
+        for i, j in zip(rows, cols):
+            value = df.iat[i, j]
+            markers.append((df.index[i], int(j), value[len(marker):].strip()))
     except Exception as e:
         logger.error(f"Error finding special symbols: {e}")
     return markers
 
-def extract_table(df, start_row, start_col):
-    """Extract table from DataFrame starting at specified position"""
+def extract_table(df, start_row, start_col, notnull=None):
+    """
+    Extract table from DataFrame starting at specified position
+
+    Args:
+        notnull: Optional precomputed df.notna() array, shared when extracting several tables
+    """
     try:
-        end_row = start_row + 1
-        while end_row < len(df) and pd.notnull(df.iloc[end_row, start_col]):
-            end_row += 1
+        if notnull is None:
+            notnull = df.notna().to_numpy()
 
-        end_col = start_col + 1
-        while end_col < len(df.columns) and pd.notnull(df.iloc[start_row, end_col]):
-            end_col += 1
+        end_row = _first_false(notnull[start_row + 1:, start_col], start_row + 1)
+        end_col = _first_false(notnull[start_row, start_col + 1:], start_col + 1)
 
         table = df.iloc[start_row:end_row, start_col:end_col].copy()
         table.columns = table.iloc[0]
@@ -346,10 +368,11 @@ def extract_tables_by_markers(df, marker):
     """Extract multiple tables from DataFrame using marker symbols"""
     markers = find_special_symbols(df, marker)
     tables = {}
+    notnull = df.notna().to_numpy() if markers else None
     for marker_info in markers:
         try:
             start_row, start_col, table_name = marker_info
-            tables[table_name] = extract_table(df, start_row + 1, start_col)
+            tables[table_name] = extract_table(df, start_row + 1, start_col, notnull=notnull)
         except Exception as e:
             logger.error(f"Error extracting table {table_name}: {e}")
             tables[table_name] = pd.DataFrame()
@@ -19,6 +19,9 @@ from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
+from utils.calendar_features import calendar_features, day_name_categorical, day_type_categorical, season_categorical
+from utils.profile_store import PROFILE_EXTENSION, get_profile_path, list_profile_files, read_profile_series
+
 logger = logging.getLogger(__name__)
 
 class LoadProfileAnalyzer:
@@ -53,12 +56,10 @@ class LoadProfileAnalyzer:
             logger.warning(f"Profiles directory does not exist: {self.profiles_dir}")
             return profiles
         
-        for csv_file in self.profiles_dir.glob('*.csv'):
-            profile_id = csv_file.stem
-            
+        for profile_id, profile_file in list_profile_files(self.profiles_dir).items():
             try:
                 # Get file information
-                file_stat = csv_file.stat()
+                file_stat = profile_file.stat()
                 file_info = {
                     'size_bytes': file_stat.st_size,
                     'size_mb': round(file_stat.st_size / (1024 * 1024), 2),
@@ -77,7 +78,7 @@ class LoadProfileAnalyzer:
                         logger.warning(f"Failed to load metadata for {profile_id}: {e}")
                 
                 # Quick data preview for statistics
-                preview_stats = self._get_quick_preview(csv_file)
+                preview_stats = self._get_quick_preview(profile_file)
                 
                 profile_info = {
                     'profile_id': profile_id,
@@ -105,6 +106,16 @@ class LoadProfileAnalyzer:
     def _get_quick_preview(self, csv_file: Path) -> Dict[str, Any]:
         """Quickly previews a CSV file, robustly checking for a demand column."""
         try:
+            if csv_file.suffix == PROFILE_EXTENSION:
+                demand_data = read_profile_series(csv_file)['demand'].head(100).dropna()
+                if demand_data.empty:
+                    return {'error': 'File is empty'}
+                return {
+                    'peak_demand': float(demand_data.max()),
+                    'avg_demand': float(demand_data.mean()),
+                    'valid_data_points': len(demand_data)
+                }
+
             # FIX: Replace the removed 'sniff_delimiter' with the modern method.
             # Use sep=None and engine='python' to auto-detect the delimiter.
             df = pd.read_csv(csv_file, sep=None, engine='python', on_bad_lines='warn', nrows=100)
@@ -207,18 +218,37 @@ class LoadProfileAnalyzer:
 
     def load_profile_data(self, profile_id: str, filters: Optional[Dict] = None) -> pd.DataFrame:
         """Loads, standardizes, and cleans profile data with robust error handling."""
-        csv_path = self.profiles_dir / f"{profile_id}.csv"
-        if not csv_path.exists():
+        profile_path = get_profile_path(self.profiles_dir, profile_id)
+        if profile_path is None:
             raise FileNotFoundError(f"Profile '{profile_id}' not found.")
         
         try:
-            # FIX: Replace the removed 'sniff_delimiter' with the modern method.
-            df = pd.read_csv(csv_path, sep=None, engine='python', on_bad_lines='warn')
+            if profile_path.suffix == PROFILE_EXTENSION:
+                # Binary profiles hold only timestamps and demand; no text parsing needed
+                df = read_profile_series(profile_path)
+                if df.empty:
+                    raise ValueError("Profile file is empty.")
+                df = self._add_time_features(df)
+            else:
+                try:
+                    # Profile CSVs: timestamp and demand only, via the memory-mapped series cache
+                    df = read_profile_series(profile_path).dropna(subset=['ds'])
+                except ValueError:
+                    df = None
 
-            if df.empty:
-                raise ValueError("CSV file is empty.")
+                if df is not None:
+                    if df.empty:
+                        raise ValueError("CSV file is empty.")
+                    df = self._add_time_features(df)
+                else:
+                    # Foreign uploads without the profile columns: sniff the delimiter and map names
+                    df = pd.read_csv(profile_path, sep=None, engine='python', on_bad_lines='warn')
+
+                    if df.empty:
+                        raise ValueError("CSV file is empty.")
+
+                    df = self._standardize_columns(df)
 
-            df = self._standardize_columns(df)
             df = self._clean_data(df)
 
             if df.empty:
@@ -316,19 +346,15 @@ class LoadProfileAnalyzer:
 
     def _add_time_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """Adds derived time-based columns for analysis."""
-        df['hour'] = df['ds'].dt.hour
-        df['day_of_week'] = df['ds'].dt.dayofweek
-        df['month'] = df['ds'].dt.month
-        df['year'] = df['ds'].dt.year
-        df['day_name'] = df['ds'].dt.day_name()
-        df['financial_year'] = df['ds'].apply(lambda x: x.year + 1 if x.month >= 4 else x.year)
-        season_map = {
-            12: 'Winter', 1: 'Winter', 2: 'Winter', 3: 'Summer', 4: 'Summer',
-            5: 'Summer', 6: 'Summer', 7: 'Monsoon', 8: 'Monsoon',
-            9: 'Monsoon', 10: 'Monsoon', 11: 'Monsoon'
-        }
-        df['season'] = df['month'].map(season_map)
-        df['day_type'] = np.where(df['day_of_week'].isin([5, 6]), 'Weekend', 'Weekday')
+        calendar = calendar_features(df['ds'])
+        df['hour'] = calendar['hour']
+        df['day_of_week'] = calendar['dayofweek']
+        df['month'] = calendar['month']
+        df['year'] = calendar['year']
+        df['day_name'] = day_name_categorical(calendar['dayofweek'])
+        df['financial_year'] = calendar['fiscal_year']
+        df['season'] = season_categorical(calendar['month'], 'india')
+        df['day_type'] = day_type_categorical(calendar['dayofweek'])
         return df
 
 
@@ -523,7 +549,7 @@ class LoadProfileAnalyzer:
     
     def _calculate_daily_patterns(self, df: pd.DataFrame, unit_factor: float) -> Dict[str, Any]:
         """Calculate daily patterns (weekday vs weekend)"""
-        daily_stats = df.groupby('day_type')['demand'].agg(['mean', 'max', 'min', 'std']).round(4)
+        daily_stats = df.groupby('day_type', observed=True)['demand'].agg(['mean', 'max', 'min', 'std']).round(4)
         
         # Apply unit conversion
         for col in ['mean', 'max', 'min', 'std']:
@@ -546,7 +572,7 @@ class LoadProfileAnalyzer:
     
     def _calculate_seasonal_patterns(self, df: pd.DataFrame, unit_factor: float) -> Dict[str, Any]:
         """Calculate seasonal patterns"""
-        seasonal_stats = df.groupby('season')['demand'].agg(['mean', 'max', 'min', 'sum', 'std']).round(4)
+        seasonal_stats = df.groupby('season', observed=True)['demand'].agg(['mean', 'max', 'min', 'sum', 'std']).round(4)
         
         # Apply unit conversion
         for col in ['mean', 'max', 'min', 'sum', 'std']:
@@ -0,0 +1,385 @@
+# utils/profile_store.py
+"""
+Compact binary storage for generated load profiles.
+
+A generated profile is a regular time series, so the datetime, Date, Time,
+Fiscal_Year, Year and Hour columns of the legacy CSV are all derivable from the
+first timestamp and the frequency. The store keeps a single float32 demand
+column in results/load_profiles/{profile_id}.parquet and records start and
+frequency in the Parquet schema metadata (irregular series also keep their
+int64 timestamps). Readers rebuild the columns they need; CSV is only written
+when a profile is exported. Profiles saved as CSV before this format, or while
+pyarrow is unavailable, are still read transparently; their timestamp and demand
+columns are cached as uncompressed Feather in results/load_profiles/.series_cache
+on first read and memory-mapped afterwards. Long runs can write a profile
+incrementally with ProfileStreamWriter.
+"""
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+    logger.info("pyarrow not available - load profiles are stored as CSV")
+
+PROFILE_FORMAT_VERSION = 1
+PROFILE_EXTENSION = '.parquet'
+LEGACY_EXTENSION = '.csv'
+METADATA_KEY = b'load_profile'
+EXPORT_DIR_NAME = 'exports'
+SERIES_CACHE_DIR_NAME = '.series_cache'
+SERIES_CACHE_EXTENSION = '.feather'
+
+# Column layout of exported (and legacy) profile CSVs
+DEMAND_COLUMN = 'Demand (kW)'
+EXPORT_COLUMNS = ['datetime', DEMAND_COLUMN, 'Date', 'Time', 'Fiscal_Year', 'Year', 'Hour']
+
+PathLike = Union[str, Path]
+
+
+def get_profile_path(profiles_dir: PathLike, profile_id: str) -> Optional[Path]:
+    """Stored file of a profile, preferring the binary format over a legacy CSV"""
+    for extension in (PROFILE_EXTENSION, LEGACY_EXTENSION):
+        path = Path(profiles_dir) / f"{profile_id}{extension}"
+        if path.exists():
+            return path
+    return None
+
+
+def list_profile_files(profiles_dir: PathLike) -> Dict[str, Path]:
+    """profile_id -> stored file for every profile in the directory"""
+    profiles_dir = Path(profiles_dir)
+    if not profiles_dir.is_dir():
+        return {}
+    files = {path.stem: path for path in profiles_dir.glob(f"*{LEGACY_EXTENSION}")}
+    files.update({path.stem: path for path in profiles_dir.glob(f"*{PROFILE_EXTENSION}")})
+    return files
+
+
+def _nanoseconds(timestamps: pd.DatetimeIndex) -> np.ndarray:
+    """int64 nanoseconds whatever the index resolution (pandas 2+ may use 'us' or 's')"""
+    return timestamps.as_unit('ns').asi8 if hasattr(timestamps, 'as_unit') else timestamps.asi8
+
+
+def _regular_frequency(timestamps: pd.DatetimeIndex) -> Optional[str]:
+    """Offset alias if the timestamps are evenly spaced and increasing, else None"""
+    if len(timestamps) < 2:
+        return 'h'
+    steps = np.diff(_nanoseconds(timestamps))
+    if steps[0] <= 0 or not (steps == steps[0]).all():
+        return None
+    return pd.tseries.frequencies.to_offset(pd.Timedelta(int(steps[0]), unit='ns')).freqstr
+
+
+def write_profile(profiles_dir: PathLike, profile_id: str, timestamps, demand) -> Path:
+    """
+    Write a profile in the binary format, atomically.
+
+    Args:
+        timestamps: Datetime-like values, in time order
+        demand: Demand values in kW, stored as float32
+
+    Returns:
+        Path: Written file
+    """
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("pyarrow is required for binary profile storage")
+
+    timestamps = pd.DatetimeIndex(pd.to_datetime(timestamps))
+    demand = np.asarray(demand, dtype=np.float32)
+    if len(timestamps) != len(demand):
+        raise ValueError("Timestamps and demand must have the same length")
+
+    freq = _regular_frequency(timestamps)
+    columns = {'demand': pa.array(demand, type=pa.float32())}
+    if freq is None:
+        columns['timestamp'] = pa.array(_nanoseconds(timestamps), type=pa.int64())
+
+    layout = {
+        'format_version': PROFILE_FORMAT_VERSION,
+        'start': timestamps[0].isoformat() if len(timestamps) else None,
+        'freq': freq,
+        'periods': len(demand),
+        'demand_unit': 'kW'
+    }
+    table = pa.table(columns).replace_schema_metadata({METADATA_KEY: json.dumps(layout).encode('utf-8')})
+
+    path = Path(profiles_dir) / f"{profile_id}{PROFILE_EXTENSION}"
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    # A legacy CSV of the same profile would shadow nothing but confuse listings
+    legacy_path = path.with_suffix(LEGACY_EXTENSION)
+    if legacy_path.exists():
+        legacy_path.unlink()
+    return path
+
+
+def read_profile_series(path: PathLike) -> pd.DataFrame:
+    """
+    Timestamps and demand of a stored profile as a ('ds', 'demand') frame.
+
+    Binary profiles are read without parsing any text; legacy CSVs go through
+    read_csv and the usual column names.
+    """
+    path = Path(path)
+    if path.suffix != PROFILE_EXTENSION:
+        return _cached_legacy_series(path)
+
+    table = pq.read_table(path, memory_map=True)
+    layout = json.loads(table.schema.metadata[METADATA_KEY])
+    if layout.get('format_version') != PROFILE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported profile format version in {path.name}")
+
+    demand = table.column('demand').to_numpy().astype(float)
+    if 'timestamp' in table.column_names:
+        ds = pd.DatetimeIndex(table.column('timestamp').to_numpy().astype('datetime64[ns]'))
+    elif layout['start'] is None:
+        ds = pd.DatetimeIndex([])
+    else:
+        ds = pd.date_range(start=layout['start'], periods=len(demand), freq=layout['freq'])
+    return pd.DataFrame({'ds': ds, 'demand': demand})
+
+
+def _legacy_series_columns(columns) -> tuple:
+    """(datetime column, demand column) of a legacy profile CSV header"""
+    columns = list(columns)
+    demand_col = next((col for col in (DEMAND_COLUMN, 'demand') if col in columns), None)
+    if demand_col is None:
+        demand_col = next((col for col in columns if 'demand' in str(col).lower()), None)
+    datetime_col = next((col for col in ('datetime', 'ds') if col in columns), None)
+    if demand_col is None or datetime_col is None:
+        raise ValueError("Profile CSV needs a datetime and a demand column")
+    return datetime_col, demand_col
+
+
+def _read_legacy_series(path: Path) -> pd.DataFrame:
+    """('ds', 'demand') from a legacy profile CSV, parsing only those two columns"""
+    datetime_col, demand_col = _legacy_series_columns(pd.read_csv(path, nrows=0).columns)
+    df = pd.read_csv(path, usecols=[datetime_col, demand_col])
+    return pd.DataFrame({
+        'ds': pd.to_datetime(df[datetime_col], errors='coerce'),
+        'demand': pd.to_numeric(df[demand_col], errors='coerce')
+    })
+
+
+def get_series_cache_path(path: PathLike) -> Path:
+    """Feather cache file of a legacy profile CSV"""
+    path = Path(path)
+    return path.parent / SERIES_CACHE_DIR_NAME / f"{path.stem}{SERIES_CACHE_EXTENSION}"
+
+
+def _cached_legacy_series(path: Path) -> pd.DataFrame:
+    """
+    ('ds', 'demand') of a legacy profile CSV via its Feather cache.
+
+    The cache records the size and mtime of the CSV it was built from and is
+    rebuilt when either changes. Without pyarrow the CSV is parsed every time.
+    """
+    if not PARQUET_AVAILABLE:
+        return _read_legacy_series(path)
+
+    source_stat = path.stat()
+    source = {'size': source_stat.st_size, 'mtime_ns': source_stat.st_mtime_ns}
+    cache_path = get_series_cache_path(path)
+
+    if cache_path.exists():
+        try:
+            table = feather.read_table(cache_path, columns=['ds', 'demand'], memory_map=True)
+            if json.loads(table.schema.metadata[METADATA_KEY]) == source:
+                return table.to_pandas()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable profile cache {cache_path.name}: {e}")
+
+    series = _read_legacy_series(path)
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(series, preserve_index=False)
+        table = table.replace_schema_metadata({METADATA_KEY: json.dumps(source).encode('utf-8')})
+        # Uncompressed so later reads can map the file instead of decoding it
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not cache profile series for {path.name}: {e}")
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return series
+
+
+def series_to_export_frame(ds, demand) -> pd.DataFrame:
+    """Legacy/export column layout (EXPORT_COLUMNS) derived from timestamps and demand"""
+    ds = pd.DatetimeIndex(pd.to_datetime(ds))
+    month = ds.month.to_numpy()
+    year = ds.year.to_numpy()
+    return pd.DataFrame({
+        'datetime': ds,
+        DEMAND_COLUMN: np.round(np.asarray(demand, dtype=float), 2),
+        'Date': ds.date,
+        'Time': ds.time,
+        'Fiscal_Year': np.where(month >= 4, year + 1, year),
+        'Year': year,
+        'Hour': ds.hour.to_numpy()
+    })
+
+
+def read_profile_frame(path: PathLike) -> pd.DataFrame:
+    """Stored profile with the legacy CSV columns; legacy CSVs are returned as parsed"""
+    path = Path(path)
+    if path.suffix != PROFILE_EXTENSION:
+        return pd.read_csv(path)
+    series = read_profile_series(path)
+    return series_to_export_frame(series['ds'], series['demand'])
+
+
+def read_profile_head(path: PathLike, nrows: int) -> pd.DataFrame:
+    """First rows of a stored profile in the legacy CSV column layout, for previews"""
+    path = Path(path)
+    if path.suffix != PROFILE_EXTENSION:
+        return pd.read_csv(path, nrows=nrows)
+    series = read_profile_series(path).head(nrows)
+    return series_to_export_frame(series['ds'], series['demand'])
+
+
+def export_profile_csv(profiles_dir: PathLike, profile_id: str) -> Optional[Path]:
+    """
+    CSV export of a profile in the legacy column layout.
+
+    Binary profiles are exported to {profiles_dir}/exports/{profile_id}.csv, which is
+    reused while it is newer than the stored profile. Legacy profiles are already CSV.
+
+    Returns:
+        Path or None: CSV file, None if the profile does not exist
+    """
+    path = get_profile_path(profiles_dir, profile_id)
+    if path is None or path.suffix == LEGACY_EXTENSION:
+        return path
+
+    export_path = Path(profiles_dir) / EXPORT_DIR_NAME / f"{profile_id}{LEGACY_EXTENSION}"
+    if export_path.exists() and export_path.stat().st_mtime >= path.stat().st_mtime:
+        return export_path
+
+    export_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = export_path.with_name(export_path.name + '.tmp')
+    read_profile_frame(path).to_csv(tmp_path, index=False)
+    os.replace(tmp_path, export_path)
+    return export_path
+
+
+def delete_profile_files(profiles_dir: PathLike, profile_id: str) -> List[str]:
+    """Remove the stored profile in every format plus its CSV export; returns deleted file names"""
+    profiles_dir = Path(profiles_dir)
+    deleted = []
+    for path in (profiles_dir / f"{profile_id}{PROFILE_EXTENSION}",
+                 profiles_dir / f"{profile_id}{LEGACY_EXTENSION}",
+                 profiles_dir / EXPORT_DIR_NAME / f"{profile_id}{LEGACY_EXTENSION}",
+                 profiles_dir / SERIES_CACHE_DIR_NAME / f"{profile_id}{SERIES_CACHE_EXTENSION}"):
+        if path.exists():
+            path.unlink()
+            deleted.append(path.name)
+    return deleted
+
+
+class ProfileStreamWriter:
+    """
+    Append-only writer for a profile produced chunk by chunk, e.g. one financial year at a time.
+
+    Chunks must continue the regular series given by start and freq. Rows go to a
+    temporary file that replaces the profile only on close(), so an aborted run
+    never leaves a partial profile behind. Without pyarrow a CSV in the export
+    layout is appended to instead.
+    """
+
+    def __init__(self, profiles_dir: PathLike, profile_id: str, start, freq: str):
+        self.start = pd.Timestamp(start)
+        self.freq = pd.tseries.frequencies.to_offset(freq).freqstr
+        self.step = pd.Timedelta(pd.tseries.frequencies.to_offset(freq))
+        self.periods = 0
+        self.storage_format = 'parquet' if PARQUET_AVAILABLE else 'csv'
+
+        extension = PROFILE_EXTENSION if PARQUET_AVAILABLE else LEGACY_EXTENSION
+        self.path = Path(profiles_dir) / f"{profile_id}{extension}"
+        self._tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self._writer = None
+        if PARQUET_AVAILABLE:
+            layout = {
+                'format_version': PROFILE_FORMAT_VERSION,
+                'start': self.start.isoformat(),
+                'freq': self.freq,
+                'periods': None,
+                'demand_unit': 'kW'
+            }
+            self._schema = pa.schema([('demand', pa.float32())],
+                                     metadata={METADATA_KEY: json.dumps(layout).encode('utf-8')})
+            self._writer = pq.ParquetWriter(self._tmp_path, self._schema)
+
+    def write(self, timestamps, demand) -> None:
+        """Append one chunk; its timestamps must follow the previous chunk without gaps"""
+        timestamps = pd.DatetimeIndex(pd.to_datetime(timestamps))
+        demand = np.asarray(demand, dtype=np.float32)
+        if len(timestamps) != len(demand):
+            raise ValueError("Timestamps and demand must have the same length")
+        if not len(timestamps):
+            return
+
+        steps = np.diff(_nanoseconds(timestamps))
+        if timestamps[0] != self.start + self.periods * self.step or not (steps == self.step.value).all():
+            raise ValueError(f"Chunk starting {timestamps[0]} does not continue the profile series")
+
+        if self._writer is not None:
+            self._writer.write_table(pa.Table.from_arrays([pa.array(demand, type=pa.float32())], schema=self._schema))
+        else:
+            series_to_export_frame(timestamps, demand).to_csv(
+                self._tmp_path, mode='a', header=self.periods == 0, index=False
+            )
+        self.periods += len(demand)
+
+    def close(self) -> Path:
+        """Finish the file and move it into place"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif not self._tmp_path.exists():
+            pd.DataFrame(columns=EXPORT_COLUMNS).to_csv(self._tmp_path, index=False)
+        os.replace(self._tmp_path, self.path)
+
+        legacy_path = self.path.with_suffix(LEGACY_EXTENSION)
+        if self.path.suffix == PROFILE_EXTENSION and legacy_path.exists():
+            legacy_path.unlink()
+        return self.path
+
+    def abort(self) -> None:
+        """Discard everything written so far"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._tmp_path.exists():
+            self._tmp_path.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False